@@ -0,0 +1,295 @@
+"""
+DexBot Session Log Analyzer
+
+Streams DexBot session logs and reports farming and performance statistics:
+gold/hour, bandages/hour, heal latency distribution, main loop time distribution
+and loot success rates.
+
+Inputs (files or directories, searched recursively):
+    *.dxev  Binary session event logs written by src/core/event_log.py (preferred)
+    *.log   Text logs (file sink or run-with-logging output); fewer metrics are available.
+            Only used for directories without event logs, which already cover the same session.
+
+Every input is read record by record (or line by line) and aggregated into fixed-size
+histograms, so memory use does not depend on log size.
+
+Usage:
+    python dev-tools/analysis/analyze_session_logs.py logs/
+    python dev-tools/analysis/analyze_session_logs.py logs/dexbot_events_20250101_120000.dxev --json reports/session.json
+"""
+
+import argparse
+import calendar
+import json
+import os
+import re
+import sys
+from typing import Any, Dict, Iterator, List, Optional
+
+# Add the project root to path so the src package (and its relative imports) resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.event_log import EventType, iter_events
+from src.core.profiler import PhaseHistogram
+
+EVENT_LOG_EXTENSION = ".dxev"
+TEXT_LOG_EXTENSION = ".log"
+
+# Heal requests older than this without a heal action are treated as abandoned
+# (e.g. the player died or healing was toggled off) and not counted as latency
+MAX_HEAL_LATENCY_SECONDS = 60.0
+
+# Text log patterns (messages emitted by the bot's Logger)
+TEXT_PATTERNS = {
+    "gold": re.compile(r"LOOTING: Collected (\d+) gold"),
+    "item_taken": re.compile(r"LOOTING: Successfully took item"),
+    "item_failed": re.compile(r"LOOTING: Failed to take item"),
+    "corpse_looted": re.compile(r"LOOTING: Finished processing corpse"),
+    "bandage": re.compile(r"\[DexBot\] Applying bandage to self"),
+    "potion": re.compile(r"\[DexBot\] Used heal potion"),
+    "loop_time": re.compile(r"(?:Main loop took|All systems completed in) ([\d.]+)ms"),
+    "timestamp": re.compile(r"^(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2})(?:\.(\d{3}))?"),
+}
+
+
+class SessionStats:
+    """Streaming aggregate of one or more sessions"""
+
+    def __init__(self) -> None:
+        self.files = 0
+        self.session_seconds = 0.0
+        self.events = 0
+
+        self.gold = 0
+        self.bandages = 0
+        self.bandages_applied = 0
+        self.potions = 0
+        self.heal_requests = 0
+        self.targets_acquired = 0
+        self.corpses_scanned = 0
+        self.corpses_looted = 0
+        self.items_moved = 0
+        self.item_moves_failed = 0
+
+        self.heal_latency = PhaseHistogram()
+        self.loop_time = PhaseHistogram()
+
+    def add_event_log(self, file_path: str) -> None:
+        """Aggregate a binary event log"""
+        first_time: Optional[float] = None
+        last_time = 0.0
+        heal_needed_at: Optional[float] = None
+
+        for timestamp, event_type, item_id, serial, aux, value in iter_events(file_path):
+            self.events += 1
+            if event_type == EventType.SESSION_START and first_time is not None:
+                # Another session appended to the same file: idle time between runs is not counted
+                self.session_seconds += last_time - first_time
+                first_time = None
+                heal_needed_at = None
+            if first_time is None:
+                first_time = timestamp
+            last_time = timestamp
+
+            if event_type == EventType.LOOP_TICK:
+                self.loop_time.record(value / 1000.0)
+            elif event_type == EventType.HEAL_NEEDED:
+                self.heal_requests += 1
+                heal_needed_at = timestamp
+            elif event_type in (EventType.BANDAGE_STARTED, EventType.POTION_USED):
+                if event_type == EventType.BANDAGE_STARTED:
+                    self.bandages += 1
+                else:
+                    self.potions += 1
+                if heal_needed_at is not None:
+                    latency = timestamp - heal_needed_at
+                    if 0 <= latency <= MAX_HEAL_LATENCY_SECONDS:
+                        self.heal_latency.record(latency * 1000)
+                    heal_needed_at = None
+            elif event_type == EventType.BANDAGE_APPLIED:
+                self.bandages_applied += 1
+            elif event_type == EventType.GOLD_COLLECTED:
+                self.gold += value
+            elif event_type == EventType.ITEM_MOVED:
+                self.items_moved += 1
+            elif event_type == EventType.ITEM_MOVE_FAILED:
+                self.item_moves_failed += 1
+            elif event_type == EventType.CORPSE_LOOTED:
+                self.corpses_looted += 1
+            elif event_type == EventType.CORPSE_SCANNED:
+                self.corpses_scanned += value
+            elif event_type == EventType.TARGET_ACQUIRED:
+                self.targets_acquired += 1
+
+        if first_time is not None:
+            self.session_seconds += last_time - first_time
+        self.files += 1
+
+    def add_text_log(self, file_path: str) -> None:
+        """Aggregate a text log (only metrics that the console messages expose)"""
+        first_time: Optional[float] = None
+        last_time = 0.0
+
+        with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                self.events += 1
+                match = TEXT_PATTERNS["timestamp"].match(line)
+                if match:
+                    seconds = _clock_seconds(match)
+                    if first_time is None:
+                        first_time = seconds
+                    last_time = seconds
+
+                match = TEXT_PATTERNS["gold"].search(line)
+                if match:
+                    self.gold += int(match.group(1))
+                    continue
+                match = TEXT_PATTERNS["loop_time"].search(line)
+                if match:
+                    self.loop_time.record(float(match.group(1)))
+                    continue
+                if TEXT_PATTERNS["item_taken"].search(line):
+                    self.items_moved += 1
+                elif TEXT_PATTERNS["item_failed"].search(line):
+                    self.item_moves_failed += 1
+                elif TEXT_PATTERNS["corpse_looted"].search(line):
+                    self.corpses_looted += 1
+                elif TEXT_PATTERNS["bandage"].search(line):
+                    self.bandages += 1
+                elif TEXT_PATTERNS["potion"].search(line):
+                    self.potions += 1
+
+        if first_time is not None and last_time >= first_time:
+            self.session_seconds += last_time - first_time
+        self.files += 1
+
+    def get_report(self) -> Dict[str, Any]:
+        """Build the analysis report"""
+        hours = self.session_seconds / 3600.0
+        attempts = self.items_moved + self.item_moves_failed
+
+        def per_hour(count: float) -> float:
+            return round(count / hours, 1) if hours > 0 else 0.0
+
+        return {
+            "files": self.files,
+            "events": self.events,
+            "session_hours": round(hours, 3),
+            "gold": self.gold,
+            "gold_per_hour": per_hour(self.gold),
+            "bandages": self.bandages,
+            "bandages_per_hour": per_hour(self.bandages),
+            "bandages_completed": self.bandages_applied,
+            "potions": self.potions,
+            "potions_per_hour": per_hour(self.potions),
+            "heal_requests": self.heal_requests,
+            "heal_latency_ms": self.heal_latency.get_summary(),
+            "loop_time_ms": self.loop_time.get_summary(),
+            "targets_acquired": self.targets_acquired,
+            "corpses_scanned": self.corpses_scanned,
+            "corpses_looted": self.corpses_looted,
+            "items_moved": self.items_moved,
+            "item_moves_failed": self.item_moves_failed,
+            "loot_success_percent": round(self.items_moved / attempts * 100, 1) if attempts else 0.0,
+            "items_per_corpse": round(self.items_moved / self.corpses_looted, 2) if self.corpses_looted else 0.0,
+        }
+
+
+def _clock_seconds(match: Any) -> float:
+    """Convert a matched 'YYYY-MM-DD HH:MM:SS.mmm' prefix to epoch-like seconds"""
+    year, month, day, hour, minute, second = (int(match.group(i)) for i in range(1, 7))
+    millis = int(match.group(7) or 0)
+    return calendar.timegm((year, month, day, hour, minute, second)) + millis / 1000.0
+
+
+def find_log_files(paths: List[str]) -> Iterator[str]:
+    """Yield every event and text log under the given files/directories"""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files):
+                    if name.endswith((EVENT_LOG_EXTENSION, TEXT_LOG_EXTENSION)):
+                        yield os.path.join(root, name)
+        elif os.path.isfile(path):
+            yield path
+
+
+def analyze(paths: List[str], include_text: bool = False) -> Dict[str, Any]:
+    """Analyze all logs found under paths and return the combined report
+
+    Text logs are a fallback: a session with file logging on writes both
+    dexbot.log and a .dxev file into the same directory, so a text log next to
+    an event log is skipped (it would count the same gold, loot and time twice)
+    unless include_text is set.
+    """
+    stats = SessionStats()
+    log_files = list(find_log_files(paths))
+    event_log_dirs = {os.path.dirname(path) for path in log_files if path.endswith(EVENT_LOG_EXTENSION)}
+    for file_path in log_files:
+        try:
+            if file_path.endswith(EVENT_LOG_EXTENSION):
+                stats.add_event_log(file_path)
+            elif include_text or os.path.dirname(file_path) not in event_log_dirs:
+                stats.add_text_log(file_path)
+        except (OSError, ValueError) as e:
+            print(f"[WARNING] Skipping {file_path}: {e}")
+    return stats.get_report()
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    """Print a human readable report"""
+
+    def distribution(summary: Dict[str, Any]) -> str:
+        if not summary["count"]:
+            return "no samples"
+        return (
+            f"p50 {summary['p50_ms']:.1f}ms / p95 {summary['p95_ms']:.1f}ms / "
+            f"p99 {summary['p99_ms']:.1f}ms / max {summary['max_ms']:.1f}ms ({summary['count']} samples)"
+        )
+
+    print("=== DexBot Session Analysis ===")
+    print(f"Files analyzed:   {report['files']} ({report['events']:,} records)")
+    print(f"Session time:     {report['session_hours']:.2f} h")
+    print(f"Gold:             {report['gold']:,} ({report['gold_per_hour']:,.1f}/h)")
+    print(f"Bandages:         {report['bandages']} ({report['bandages_per_hour']:.1f}/h)")
+    print(f"Heal potions:     {report['potions']} ({report['potions_per_hour']:.1f}/h)")
+    print(f"Heal latency:     {distribution(report['heal_latency_ms'])}")
+    print(f"Loop time:        {distribution(report['loop_time_ms'])}")
+    print(f"Targets acquired: {report['targets_acquired']}")
+    print(
+        f"Looting:          {report['corpses_looted']} corpses, {report['items_moved']} items moved, "
+        f"{report['item_moves_failed']} failed ({report['loot_success_percent']:.1f}% success, "
+        f"{report['items_per_corpse']:.2f} items/corpse)"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Analyze DexBot session logs in constant memory")
+    parser.add_argument("paths", nargs="*", default=["logs"], help="Log files or directories (default: logs)")
+    parser.add_argument("--json", dest="json_output", help="Also write the report to this JSON file")
+    parser.add_argument(
+        "--include-text", action="store_true",
+        help="Also analyze text logs that sit next to .dxev files (counts those sessions twice)",
+    )
+    args = parser.parse_args(argv)
+
+    report = analyze(args.paths, include_text=args.include_text)
+    if report["files"] == 0:
+        print(f"[WARNING] No session logs found in: {', '.join(args.paths)}")
+        return 1
+
+    print_report(report)
+
+    if args.json_output:
+        directory = os.path.dirname(args.json_output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.json_output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport saved to: {args.json_output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
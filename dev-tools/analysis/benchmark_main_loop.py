@@ -0,0 +1,226 @@
+"""
+DexBot Main Loop Benchmark
+
+Runs the real bot systems through the main loop tick (SystemRegistry dispatch on a
+TickScheduler, as run_dexbot does) inside the simulated world from
+src/utils/world_simulator.py, and reports for each scenario:
+
+    ticks/sec        Main loop ticks per wall-clock second (the simulated clock only
+                     advances through Misc.Pause, so this is pure CPU cost)
+    tick cost        Wall-clock time of one tick (p50/p95/max)
+    per-system cost  Wall-clock time per run of healing, gump, combat and looting
+    heal latency     Simulated time from taking damage to the next bandage/potion
+
+Scenarios: idle, single_mob, swarm (20 mobs), corpse_field (50 corpses), low_health
+
+Usage:
+    python dev-tools/analysis/benchmark_main_loop.py
+    python dev-tools/analysis/benchmark_main_loop.py --scenario swarm --seconds 1800 --json reports/bench.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# Add the project root to path so the src package (and its relative imports) resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.config_manager import ConfigManager
+from src.core.bot_config import BotConfig
+from src.core.logger import Logger, SystemStatus
+from src.core.main_loop import build_system_registry
+from src.core.profiler import PhaseHistogram
+from src.core.scheduler import TickScheduler
+from src.systems.combat import CombatSystem
+from src.systems.looting import LootingSystem
+from src.utils.world_simulator import WorldSimulator
+
+DEFAULT_SIMULATED_SECONDS = 600
+
+# Loot for the corpse field: one item worth taking and one the rules skip
+CORPSE_FIELD_LOOT = [(3821, "Gold Coins", (40, 160), 0.02), (3786, "Bones", 1, 1.0)]
+
+
+def _scenario_idle(world: WorldSimulator) -> None:
+    """No creatures, full health"""
+
+
+def _scenario_single_mob(world: WorldSimulator) -> None:
+    """One respawning creature"""
+    world.spawn_mobile("Orc", x_offset=6, respawn_ms=10000)
+
+
+def _scenario_swarm(world: WorldSimulator) -> None:
+    """20 weak respawning creatures closing in from all sides on a sturdy character"""
+    world.player.HitsMax = world.player.Hits = 1000
+    for index in range(20):
+        x_offset = (index % 5) * 2 - 4
+        y_offset = 6 if index % 2 else -6
+        world.spawn_mobile(
+            "Orc", x_offset=x_offset, y_offset=y_offset + index // 5, hits=20, damage=1, respawn_ms=15000
+        )
+
+
+def _scenario_corpse_field(world: WorldSimulator) -> None:
+    """50 corpses within looting range"""
+    for index in range(50):
+        world.spawn_corpse(x_offset=index % 5 - 2, y_offset=(index // 5) % 5 - 2, loot=CORPSE_FIELD_LOOT)
+
+
+def _scenario_low_health(world: WorldSimulator) -> None:
+    """Heavy periodic damage keeping the player near critical health"""
+    world.player.Hits = world.player.HitsMax // 5
+    world.add_damage_source(35, 3000)
+
+
+SCENARIOS: Dict[str, Callable[[WorldSimulator], None]] = {
+    "idle": _scenario_idle,
+    "single_mob": _scenario_single_mob,
+    "swarm": _scenario_swarm,
+    "corpse_field": _scenario_corpse_field,
+    "low_health": _scenario_low_health,
+}
+
+
+class _TimedCallback:
+    """Wraps a registered system so each run is timed on the wall clock"""
+
+    def __init__(self, callback: Callable[[], Any], histogram: PhaseHistogram) -> None:
+        self.callback = callback
+        self.histogram = histogram
+
+    def __call__(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return self.callback()
+        finally:
+            self.histogram.record((time.perf_counter() - start) * 1000)
+
+
+def _benchmark_config(config_manager: ConfigManager) -> Dict[str, Any]:
+    """Enable combat and looting in memory (nothing is written to config/)"""
+    saved = {
+        "combat": config_manager.combat_config,
+        "looting": config_manager.looting_config,
+    }
+    config_manager.combat_config = config_manager._merge_configs(
+        config_manager.combat_config,
+        {"system_toggles": {"combat_system_enabled": True, "auto_target_enabled": True, "auto_attack_enabled": True}},
+    )
+    config_manager.looting_config = config_manager._merge_configs(config_manager.looting_config, {"enabled": True})
+    return saved
+
+
+def run_scenario(name: str, simulated_seconds: float = DEFAULT_SIMULATED_SECONDS, seed: int = 1) -> Dict[str, Any]:
+    """Run one scenario and return its measurements"""
+    config_manager = ConfigManager()
+    config = BotConfig()
+    status = SystemStatus()
+    saved_config = _benchmark_config(config_manager)
+    console_enabled = Logger.console_enabled
+    Logger.console_enabled = False
+
+    world = WorldSimulator(seed=seed)
+    SCENARIOS[name](world)
+    world.disconnect_after(simulated_seconds)
+
+    tick_cost = PhaseHistogram()
+    system_cost: Dict[str, PhaseHistogram] = {}
+    try:
+        with world:
+            combat_system = CombatSystem(config_manager)
+            looting_system = LootingSystem(config_manager)
+            scheduler = TickScheduler(config.DEFAULT_SCRIPT_DELAY)
+            registry = build_system_registry(config, config_manager, combat_system, looting_system, status.profiler)
+            for system_name in registry.get_stats():
+                system = registry.get_system(system_name)
+                system_cost[system_name] = PhaseHistogram()
+                system.callback = _TimedCallback(system.callback, system_cost[system_name])
+
+            wall_start = time.perf_counter()
+            while world.player.Connected:
+                tick_start = time.perf_counter()
+                scheduler.begin_tick()
+                registry.run_due(scheduler.get_deadline())
+                tick_cost.record((time.perf_counter() - tick_start) * 1000)
+                scheduler.end_tick()
+            wall_seconds = time.perf_counter() - wall_start
+    finally:
+        config_manager.combat_config = saved_config["combat"]
+        config_manager.looting_config = saved_config["looting"]
+        Logger.console_enabled = console_enabled
+
+    ticks = scheduler.tick_count
+    return {
+        "scenario": name,
+        "simulated_seconds": simulated_seconds,
+        "ticks": ticks,
+        "wall_seconds": round(wall_seconds, 3),
+        "ticks_per_second": round(ticks / wall_seconds, 1) if wall_seconds > 0 else 0.0,
+        "tick_cost_ms": tick_cost.get_summary(),
+        "system_cost_ms": {
+            system_name: histogram.get_summary()
+            for system_name, histogram in system_cost.items()
+            if histogram.count
+        },
+        "heal_latency_ms": world.heal_latency.get_summary(),
+        "world": world.get_stats(),
+    }
+
+
+def print_result(result: Dict[str, Any]) -> None:
+    """Print one scenario result"""
+    tick = result["tick_cost_ms"]
+    latency = result["heal_latency_ms"]
+    world = result["world"]
+    print(f"\n--- {result['scenario']} ({result['simulated_seconds']:.0f}s simulated) ---")
+    print(f"Ticks:         {result['ticks']} in {result['wall_seconds']:.2f}s ({result['ticks_per_second']:,.0f} ticks/s)")
+    print(f"Tick cost:     p50 {tick['p50_ms']:.3f}ms / p95 {tick['p95_ms']:.3f}ms / max {tick['max_ms']:.3f}ms")
+    for system_name, summary in result["system_cost_ms"].items():
+        print(
+            f"  {system_name:<13} {summary['count']:>6} runs, mean {summary['mean_ms']:.3f}ms, "
+            f"p95 {summary['p95_ms']:.3f}ms, max {summary['max_ms']:.3f}ms"
+        )
+    if latency["count"]:
+        print(
+            f"Heal latency:  p50 {latency['p50_ms']:.0f}ms / p95 {latency['p95_ms']:.0f}ms / "
+            f"max {latency['max_ms']:.0f}ms ({latency['count']} heals)"
+        )
+    print(
+        f"World:         {world['mobiles_killed']} kills, {world['items_moved']} items moved "
+        f"({world['item_moves_failed']} failed), {world['bandages_applied']} bandages, "
+        f"{world['potions_used']} potions, {world['damage_taken']} damage taken"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark the DexBot main loop in a simulated world")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), action="append", help="Scenario to run (repeatable, default: all)")
+    parser.add_argument("--seconds", type=float, default=DEFAULT_SIMULATED_SECONDS, help="Simulated seconds per scenario")
+    parser.add_argument("--seed", type=int, default=1, help="World random seed")
+    parser.add_argument("--json", dest="json_output", help="Also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    print("=== DexBot Main Loop Benchmark ===")
+    results = []
+    for name in args.scenario or list(SCENARIOS):
+        result = run_scenario(name, args.seconds, args.seed)
+        print_result(result)
+        results.append(result)
+
+    if args.json_output:
+        directory = os.path.dirname(args.json_output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.json_output, "w", encoding="utf-8") as f:
+            json.dump({"generated_at": time.strftime("%Y-%m-%d %H:%M:%S"), "results": results}, f, indent=2)
+        print(f"\nResults saved to: {args.json_output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
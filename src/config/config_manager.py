@@ -6,7 +6,12 @@ Handles loading and saving bot settings from JSON files
 import json
 import os
 import sys
-from typing import Dict, Optional
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .config_schema import ConfigValidationError, normalize_section, normalize_setting
 
 
 # Helper to detect if running as bundled script (DexBot.py) or as modules
@@ -27,6 +32,203 @@ else:
     DEFAULT_AUTO_HEAL_CONFIG = load_json_config(_os.path.join(_config_dir, 'default_auto_heal_config.json'))
     DEFAULT_LOOTING_CONFIG = load_json_config(_os.path.join(_config_dir, 'default_looting_config.json'))
 
+# Config sections, each stored in <section>_config.json
+CONFIG_SECTIONS = ("main", "auto_heal", "combat", "looting")
+
+# Profile that uses the config files directly in config/ (others live in config/profiles/<name>/)
+DEFAULT_PROFILE = "default"
+
+# Config save debouncing (the delay is overridden by global_settings.config_save_delay_ms)
+CONFIG_SAVE_DELAY_SECONDS = 1.0
+CONFIG_SAVE_MAX_DELAY_SECONDS = 5.0
+
+
+class ConfigWriter:
+    """Debounced, atomic config file writer
+
+    schedule() only records that a file needs saving. A background thread writes
+    it once no further save was requested for delay_seconds (but never later than
+    max_delay_seconds after the first request), so a burst of GUMP clicks costs
+    one write, made off the main loop. Files are written to a temp file and
+    renamed over the old one, so an interrupted write never leaves a truncated
+    config behind. Call flush() before exiting to write anything still pending.
+    """
+
+    def __init__(
+        self,
+        delay_seconds: float = CONFIG_SAVE_DELAY_SECONDS,
+        max_delay_seconds: float = CONFIG_SAVE_MAX_DELAY_SECONDS,
+        lock: Optional[Any] = None,
+        on_write: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        self.delay_seconds = delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.on_write = on_write  # Called with the path after each successful write
+
+        # path -> (config, due time, latest due time)
+        self._pending: Dict[str, Tuple[Dict, float, float]] = {}
+        self._lock = threading.Lock()
+        self._config_lock = lock if lock is not None else threading.RLock()  # Held while serializing
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Statistics
+        self.writes = 0
+        self.coalesced = 0
+        self.write_errors = 0
+
+    def schedule(self, path: str, config: Dict) -> None:
+        """Queue a config for saving; repeated requests for one file are merged"""
+        now = time.monotonic()
+        with self._lock:
+            if path in self._pending:
+                latest = self._pending[path][2]
+                self.coalesced += 1
+            else:
+                latest = now + self.max_delay_seconds
+            self._pending[path] = (config, min(now + self.delay_seconds, latest), latest)
+
+        if self._thread is None:
+            self._start()
+        self._wakeup.set()
+
+    def cancel(self, path: str) -> None:
+        """Drop a queued save (e.g. because the file was edited on disk)"""
+        with self._lock:
+            self._pending.pop(path, None)
+
+    def flush(self) -> bool:
+        """Write every pending file now; returns False if any write failed"""
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+        return self._write_all(pending)
+
+    def close(self) -> bool:
+        """Stop the background thread and write what is left"""
+        if self._thread is not None:
+            self._stopping = True
+            self._wakeup.set()
+            self._thread.join(self.max_delay_seconds + 1.0)
+            self._thread = None
+        return self.flush()
+
+    def write_file(self, path: str, config: Dict) -> bool:
+        """Atomically replace path with config as JSON"""
+        temp_path = path + ".tmp"
+        try:
+            with self._config_lock:
+                data = json.dumps(config, indent=2)
+            with open(temp_path, "w") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+            self.writes += 1
+            if self.on_write is not None:
+                self.on_write(path)
+            return True
+        except Exception as e:
+            self.write_errors += 1
+            print(f"[ConfigManager] Error saving {path}: {e}")
+            if os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            return False
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get writer statistics for status reporting"""
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            "pending": pending,
+            "writes": self.writes,
+            "coalesced": self.coalesced,
+            "write_errors": self.write_errors,
+        }
+
+    def _start(self) -> None:
+        """Start the background writer thread, or write synchronously if threads are unavailable"""
+        try:
+            self._stopping = False
+            self._thread = threading.Thread(target=self._write_worker, name="DexBotConfigWriter")
+            self._thread.daemon = True
+            self._thread.start()
+        except Exception as e:
+            self._thread = None
+            print(f"[ConfigManager] Background saving unavailable, saving immediately: {e}")
+            self.flush()
+
+    def _write_worker(self) -> None:
+        """Background loop writing each pending file once it is due"""
+        while not self._stopping:
+            with self._lock:
+                now = time.monotonic()
+                due = {path: entry for path, entry in self._pending.items() if entry[1] <= now}
+                for path in due:
+                    del self._pending[path]
+                next_due = min((entry[1] for entry in self._pending.values()), default=None)
+
+            self._write_all(due)
+            timeout = None if next_due is None else max(next_due - time.monotonic(), 0.01)
+            self._wakeup.wait(timeout)
+            self._wakeup.clear()
+
+    def _write_all(self, pending: Dict[str, Tuple[Dict, float, float]]) -> bool:
+        """Write a batch of pending files"""
+        saved = True
+        for path, entry in pending.items():
+            saved = self.write_file(path, entry[0]) and saved
+        return saved
+
+
+class ConfigSnapshot:
+    """Read-only attribute view of a config section
+
+    Nested sections become nested snapshots, so hot paths read plain attributes
+    (settings.target_selection.max_range) instead of resolving dotted paths.
+    Snapshots are rebuilt whenever their section changes; fetch the current one
+    from the ConfigManager each pass rather than keeping it.
+    """
+
+    def __init__(self, values: Dict) -> None:
+        for key, value in values.items():
+            self.__dict__[key] = ConfigSnapshot(value) if isinstance(value, dict) else value
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Get an attribute that may be missing from older config files"""
+        return self.__dict__.get(name, default)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("ConfigSnapshot is read-only; use ConfigManager.set_*_setting")
+
+
+def _config_section(section: str) -> property:
+    """Config dict attribute that recompiles its lookups when replaced"""
+
+    def getter(self) -> Dict:
+        return self._configs[section]
+
+    def setter(self, value: Dict) -> None:
+        with self._config_lock:
+            previous = self._configs.get(section)
+            self._configs[section] = value
+            try:
+                self._compile_section(section)
+            except ConfigValidationError:
+                # Keep the last valid config
+                if previous is None:
+                    del self._configs[section]
+                else:
+                    self._configs[section] = previous
+                raise
+        self._notify(section, None)
+
+    return property(getter, setter)
+
 
 class ConfigManager:
     """Configuration manager for loading and saving bot settings from JSON files
@@ -34,10 +236,49 @@ class ConfigManager:
     Manages separate configuration files for different bot systems:
     - main_config.json: Overall bot settings and system toggles
     - auto_heal_config.json: Auto Heal system specific settings
+
+    Each loaded section is validated against its schema (config_schema.py) and
+    compiled into a flat dotted-path lookup table (used by get_*_setting) and a
+    ConfigSnapshot (main_settings, combat_settings, ...). Both hold normalized
+    values: item IDs are ints, durations numbers and enum settings enum members,
+    so callers never convert them. Invalid values raise ConfigValidationError:
+    at startup, and from set_*_setting or a section replacement, which then keep
+    the previous config.
+    Both are rebuilt only when a section is loaded, replaced or changed through
+    set_*_setting; code that edits a config dict in place must call
+    recompile_settings() afterwards.
+
+    Systems that cache values derived from a section subscribe to it and drop
+    their cache when notified, instead of re-reading config on a timer:
+
+        config_manager.subscribe("looting", self._on_config_changed)
+
+    Callbacks receive (section, key_path); key_path is the dotted path passed to
+    set_*_setting, or None when the whole section was loaded, replaced or
+    recompiled. Setting a value equal to the current one notifies no one.
+
+    save_*_config() queues the file on a ConfigWriter (debounced, atomic, written
+    in the background) and returns True once queued; flush_saves() writes
+    everything still pending and is called when the bot shuts down.
+
+    check_for_changes() hot-reloads config files edited on disk (the main loop
+    polls it every few seconds). Only the sections whose values changed are
+    replaced, and their subscribers are notified once per changed setting.
+
+    Profiles are per-character config sets in config/profiles/<name>/ holding any
+    of the four section files; sections a profile does not override come from
+    config/. switch_profile() loads a profile once and keeps every profile it has
+    used in memory, so switching back is a swap, not a re-parse. While a profile
+    is active, saves go to that profile's directory.
     """
 
     _instance: Optional["ConfigManager"] = None
 
+    main_config = _config_section("main")
+    auto_heal_config = _config_section("auto_heal")
+    combat_config = _config_section("combat")
+    looting_config = _config_section("looting")
+
     def __new__(cls) -> "ConfigManager":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -49,6 +290,16 @@ class ConfigManager:
             return
         self._initialized = True
 
+        # Raw config dicts and their compiled forms, keyed by section name
+        self._configs: Dict[str, Dict] = {}
+        self._compiled: Dict[str, Dict[str, Any]] = {}
+        self._snapshots: Dict[str, ConfigSnapshot] = {}
+        self.config_version = 0  # Incremented on every recompile
+        self._subscribers: Dict[str, List[Any]] = {}
+        self._config_lock = threading.RLock()
+        self._writer = ConfigWriter(lock=self._config_lock, on_write=self._record_file_signature)
+        self._file_signatures: Dict[str, Tuple[float, int]] = {}  # path -> (mtime, size) last loaded/saved
+
         # Get the script directory and config path
         self.script_dir = os.path.dirname(
             os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -59,49 +310,169 @@ class ConfigManager:
         if not os.path.exists(self.config_dir):
             os.makedirs(self.config_dir)
 
-        # Configuration file paths
-        self.main_config_path = os.path.join(self.config_dir, "main_config.json")
-        self.auto_heal_config_path = os.path.join(self.config_dir, "auto_heal_config.json")
-        self.combat_config_path = os.path.join(self.config_dir, "combat_config.json")
-        self.looting_config_path = os.path.join(self.config_dir, "looting_config.json")
+        # Configuration file paths (main_config_path, ...) of the active profile
+        self.active_profile = DEFAULT_PROFILE
+        self._profile_cache: Dict[str, Dict[str, Tuple[Dict, Dict[str, Any], ConfigSnapshot]]] = {}
+        self._set_profile_paths(DEFAULT_PROFILE)
 
-        # Load configurations
-        self.main_config = self._load_config(self.main_config_path, self._get_default_main_config())
-        self.auto_heal_config = self._load_config(
-            self.auto_heal_config_path, self._get_default_auto_heal_config()
-        )
-        self.combat_config = self._load_config(
-            self.combat_config_path, self._get_default_combat_config()
+        # Load configurations; a file with invalid values stops the bot before it starts
+        try:
+            self.main_config = self._load_section(DEFAULT_PROFILE, "main")
+            self.auto_heal_config = self._load_section(DEFAULT_PROFILE, "auto_heal")
+            self.combat_config = self._load_section(DEFAULT_PROFILE, "combat")
+            self.looting_config = self._load_section(DEFAULT_PROFILE, "looting")
+        except ConfigValidationError as e:
+            print(f"[ConfigManager] {e}")
+            self._initialized = False
+            raise
+        self._writer.delay_seconds = (
+            self.get_main_setting("global_settings.config_save_delay_ms", 1000) / 1000.0
         )
-        self.looting_config = self._load_config(
-            self.looting_config_path, self._get_default_looting_config()
+
+    def _get_profile_dir(self, profile: str) -> str:
+        """Directory holding a profile's config files"""
+        if profile == DEFAULT_PROFILE:
+            return self.config_dir
+        return os.path.join(self.config_dir, "profiles", profile)
+
+    def _set_profile_paths(self, profile: str) -> None:
+        """Point main_config_path, ... at a profile's files
+
+        Sections a profile does not have a file for are loaded from (and
+        hot-reloaded from) config/, but saved into the profile directory: the
+        first save of such a section gives the profile its own copy.
+        """
+        profile_dir = self._get_profile_dir(profile)
+        for section in CONFIG_SECTIONS:
+            setattr(self, f"{section}_config_path", os.path.join(profile_dir, f"{section}_config.json"))
+
+    def _load_section(self, profile: str, section: str) -> Dict:
+        """Load a section of a profile, falling back to config/ for files it does not have"""
+        path = os.path.join(self._get_profile_dir(profile), f"{section}_config.json")
+        if profile != DEFAULT_PROFILE and not os.path.exists(path):
+            path = os.path.join(self.config_dir, f"{section}_config.json")
+        return self._load_config(path, self._get_default_config(section))
+
+    def list_profiles(self) -> List[str]:
+        """Names of the available config profiles (the default profile first)"""
+        profiles_dir = os.path.join(self.config_dir, "profiles")
+        names = []
+        if os.path.isdir(profiles_dir):
+            names = sorted(
+                name for name in os.listdir(profiles_dir)
+                if os.path.isdir(os.path.join(profiles_dir, name)) and name != DEFAULT_PROFILE
+            )
+        return [DEFAULT_PROFILE] + names
+
+    def switch_profile(self, profile: str) -> bool:
+        """Make a profile's settings current
+
+        The first switch to a profile parses and validates its files; later
+        switches reuse the in-memory configs (including unsaved changes).
+        Subscribers of every section are notified.
+
+        Args:
+            profile: Profile name, or DEFAULT_PROFILE for the files in config/
+
+        Returns:
+            False if the profile does not exist (the current one stays active)
+
+        Raises:
+            ConfigValidationError: If the profile's files contain invalid values
+        """
+        profile = profile or DEFAULT_PROFILE
+        if profile == self.active_profile:
+            return True
+        if profile != DEFAULT_PROFILE and not os.path.isdir(self._get_profile_dir(profile)):
+            print(f"[ConfigManager] Unknown config profile '{profile}'")
+            return False
+
+        with self._config_lock:
+            state = self._profile_cache.get(profile)
+            if state is None:
+                # Compile everything before touching the current state, so a bad file changes nothing
+                state = {}
+                for section in CONFIG_SECTIONS:
+                    config = self._load_section(profile, section)
+                    normalized = normalize_section(section, config)
+                    flat: Dict[str, Any] = {}
+                    self._flatten_config(config, normalized, "", flat)
+                    state[section] = (config, flat, ConfigSnapshot(normalized))
+
+            self._profile_cache[self.active_profile] = {
+                section: (self._configs[section], self._compiled[section], self._snapshots[section])
+                for section in CONFIG_SECTIONS
+            }
+            for section, (config, flat, snapshot) in state.items():
+                self._configs[section] = config
+                self._compiled[section] = flat
+                self._snapshots[section] = snapshot
+            self.config_version += 1
+            self.active_profile = profile
+            self._set_profile_paths(profile)
+
+        print(f"[ConfigManager] Switched to config profile '{profile}'")
+        for section in CONFIG_SECTIONS:
+            self._notify(section, None)
+        return True
+
+    def select_profile_for_character(self, name: str, serial: int) -> str:
+        """Switch to the profile configured for a character
+
+        main_config.json "profiles" (in config/, not in a profile) maps character
+        names or serials to profile names in "by_character"; characters without
+        an entry use "active_profile".
+
+        Returns:
+            The name of the profile now active
+        """
+        if self.active_profile == DEFAULT_PROFILE:
+            base_main = self.main_config
+        elif DEFAULT_PROFILE in self._profile_cache:
+            base_main = self._profile_cache[DEFAULT_PROFILE]["main"][0]
+        else:
+            base_main = self._load_section(DEFAULT_PROFILE, "main")
+        profiles = base_main.get("profiles", {})
+        by_character = profiles.get("by_character", {})
+        profile = (
+            by_character.get(str(serial))
+            or by_character.get(name)
+            or profiles.get("active_profile")
+            or DEFAULT_PROFILE
         )
+        if not self.switch_profile(profile):
+            self.switch_profile(DEFAULT_PROFILE)
+        return self.active_profile
 
     def _load_config(self, config_path: str, default_config: Dict) -> Dict:
         """Load configuration from JSON file, create with defaults if not exists"""
         try:
             if os.path.exists(config_path):
+                self._record_file_signature(config_path)
                 with open(config_path, "r") as f:
                     config = json.load(f)
                 # Merge with defaults to ensure all keys exist
                 return self._merge_configs(default_config, config)
             else:
                 # Create default config file
-                self._save_config(config_path, default_config)
+                self._writer.write_file(config_path, default_config)
                 return default_config
         except Exception as e:
             print(f"[ConfigManager] Error loading {config_path}: {e}")
             return default_config
 
     def _save_config(self, config_path: str, config: Dict) -> bool:
-        """Save configuration to JSON file"""
-        try:
-            with open(config_path, "w") as f:
-                json.dump(config, f, indent=2)
-            return True
-        except Exception as e:
-            print(f"[ConfigManager] Error saving {config_path}: {e}")
-            return False
+        """Queue configuration to be saved to its JSON file"""
+        self._writer.schedule(config_path, config)
+        return True
+
+    def flush_saves(self) -> bool:
+        """Write all pending config saves now (call before the script exits)"""
+        return self._writer.flush()
+
+    def get_save_stats(self) -> Dict[str, int]:
+        """Get config writer statistics (pending, writes, coalesced, write_errors)"""
+        return self._writer.get_stats()
 
     def _merge_configs(self, default: Dict, loaded: Dict) -> Dict:
         """Recursively merge loaded config with defaults to ensure all keys exist"""
@@ -139,50 +510,255 @@ class ConfigManager:
         looting_saved = self.save_looting_config()
         return main_saved and auto_heal_saved and combat_saved and looting_saved
 
-    def reload_configs(self) -> None:
-        """Reload all configurations from files"""
-        self.main_config = self._load_config(self.main_config_path, self._get_default_main_config())
-        self.auto_heal_config = self._load_config(
-            self.auto_heal_config_path, self._get_default_auto_heal_config()
-        )
-        self.combat_config = self._load_config(
-            self.combat_config_path, self._get_default_combat_config()
-        )
-        self.looting_config = self._load_config(
-            self.looting_config_path, self._get_default_looting_config()
+    def check_for_changes(self) -> List[str]:
+        """Apply edits made to the config files on disk since they were loaded or saved
+
+        Costs one os.stat per file when nothing changed. An edited file is merged
+        with the defaults and only settings whose values differ are applied; an
+        edit wins over a GUMP change still waiting to be saved. Files that fail
+        to parse (e.g. saved halfway through an edit) are ignored until they
+        change again.
+
+        Returns:
+            The sections that were reloaded
+        """
+        reloaded = []
+        for section in list(self._configs):
+            path = self._get_watched_path(section)
+            signature = self._get_file_signature(path)
+            if signature is None or signature == self._file_signatures.get(path):
+                continue
+            self._file_signatures[path] = signature
+            if self._apply_file_changes(section, path):
+                reloaded.append(section)
+        return reloaded
+
+    def _apply_file_changes(self, section: str, path: str) -> bool:
+        """Load an edited config file and apply the settings that changed"""
+        try:
+            with open(path, "r") as f:
+                loaded = json.load(f)
+        except Exception as e:
+            print(f"[ConfigManager] Ignoring edit to {path}, keeping current settings: {e}")
+            return False
+
+        config = self._merge_configs(self._get_default_config(section), loaded)
+        try:
+            normalized = normalize_section(section, config)
+        except ConfigValidationError as e:
+            print(f"[ConfigManager] Ignoring edit to {path}, keeping current settings: {e}")
+            return False
+        flat: Dict[str, Any] = {}
+        self._flatten_config(config, normalized, "", flat)
+        current = self._compiled[section]
+        changed = sorted(
+            key_path
+            for key_path in set(flat) | set(current)
+            if not isinstance(flat.get(key_path), dict)
+            and not isinstance(current.get(key_path), dict)
+            and flat.get(key_path, self) != current.get(key_path, self)
         )
+        if not changed:
+            return False
+
+        self._writer.cancel(path)
+        with self._config_lock:
+            self._configs[section] = config
+            self._install_compiled(section, flat, normalized)
+        print(f"[ConfigManager] Reloaded {os.path.basename(path)}: {', '.join(changed)}")
+        for key_path in changed:
+            self._notify(section, key_path)
+        return True
+
+    def _get_config_path(self, section: str) -> str:
+        """Get the file a section is loaded from and saved to"""
+        return getattr(self, f"{section}_config_path")
+
+    def _get_watched_path(self, section: str) -> str:
+        """Get the file whose edits apply to a section (the inherited config/ file until the profile saves its own)"""
+        path = self._get_config_path(section)
+        if self.active_profile != DEFAULT_PROFILE and not os.path.exists(path):
+            path = os.path.join(self.config_dir, f"{section}_config.json")
+        return path
+
+    def _get_default_config(self, section: str) -> Dict:
+        """Get a section's default configuration"""
+        return getattr(self, f"_get_default_{section}_config")()
+
+    def _get_file_signature(self, path: str) -> Optional[Tuple[float, int]]:
+        """(mtime, size) of a file, or None if it cannot be read"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime, stat.st_size)
+
+    def _record_file_signature(self, path: str) -> None:
+        """Remember a file as loaded/saved so check_for_changes skips it"""
+        signature = self._get_file_signature(path)
+        if signature is not None:
+            self._file_signatures[path] = signature
+
+    def reload_configs(self) -> None:
+        """Reload all configurations of the active profile from files"""
+        self._profile_cache.clear()  # Other profiles are parsed again when next used
+        self.main_config = self._load_section(self.active_profile, "main")
+        self.auto_heal_config = self._load_section(self.active_profile, "auto_heal")
+        self.combat_config = self._load_section(self.active_profile, "combat")
+        self.looting_config = self._load_section(self.active_profile, "looting")
 
     def get_main_setting(self, key_path: str, default=None):
         """Get setting from main config using dot notation (e.g., 'system_toggles.healing_system_enabled')"""
-        return self._get_nested_value(self.main_config, key_path, default)
+        return self._compiled["main"].get(key_path, default)
 
     def set_main_setting(self, key_path: str, value) -> None:
         """Set setting in main config using dot notation"""
-        self._set_nested_value(self.main_config, key_path, value)
+        self._set_setting("main", key_path, value)
 
     def get_auto_heal_setting(self, key_path: str, default=None):
         """Get setting from auto heal config using dot notation"""
-        return self._get_nested_value(self.auto_heal_config, key_path, default)
+        return self._compiled["auto_heal"].get(key_path, default)
 
     def set_auto_heal_setting(self, key_path: str, value) -> None:
         """Set setting in auto heal config using dot notation"""
-        self._set_nested_value(self.auto_heal_config, key_path, value)
+        self._set_setting("auto_heal", key_path, value)
 
     def get_combat_setting(self, key_path: str, default=None):
         """Get setting from combat config using dot notation"""
-        return self._get_nested_value(self.combat_config, key_path, default)
+        return self._compiled["combat"].get(key_path, default)
 
     def set_combat_setting(self, key_path: str, value) -> None:
         """Set setting in combat config using dot notation"""
-        self._set_nested_value(self.combat_config, key_path, value)
+        self._set_setting("combat", key_path, value)
 
     def get_looting_setting(self, key_path: str, default=None):
         """Get setting from looting config using dot notation"""
-        return self._get_nested_value(self.looting_config, key_path, default)
+        return self._compiled["looting"].get(key_path, default)
 
     def set_looting_setting(self, key_path: str, value) -> None:
         """Set setting in looting config using dot notation"""
-        self._set_nested_value(self.looting_config, key_path, value)
+        self._set_setting("looting", key_path, value)
+
+    @property
+    def main_settings(self) -> ConfigSnapshot:
+        """Attribute view of the main config"""
+        return self._snapshots["main"]
+
+    @property
+    def auto_heal_settings(self) -> ConfigSnapshot:
+        """Attribute view of the auto heal config"""
+        return self._snapshots["auto_heal"]
+
+    @property
+    def combat_settings(self) -> ConfigSnapshot:
+        """Attribute view of the combat config"""
+        return self._snapshots["combat"]
+
+    @property
+    def looting_settings(self) -> ConfigSnapshot:
+        """Attribute view of the looting config"""
+        return self._snapshots["looting"]
+
+    def recompile_settings(self) -> None:
+        """Rebuild every section's lookups after config dicts were edited in place"""
+        for section in list(self._configs):
+            self._compile_section(section)
+            self._notify(section, None)
+
+    def subscribe(self, section: str, callback: Callable[[str, Optional[str]], None]) -> None:
+        """Call callback(section, key_path) whenever a config section changes
+
+        Bound methods are held weakly, so a system that subscribes in __init__
+        does not outlive its owner; other callables are held until unsubscribed.
+        """
+        if hasattr(callback, "__self__"):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback  # noqa: E731 - same call shape as a weak reference
+        self.unsubscribe(section, callback)
+        self._subscribers.setdefault(section, []).append(ref)
+
+    def unsubscribe(self, section: str, callback: Callable[[str, Optional[str]], None]) -> None:
+        """Stop notifying callback about a section (no-op if not subscribed)"""
+        refs = self._subscribers.get(section)
+        if refs:
+            refs[:] = [ref for ref in refs if ref() is not None and ref() != callback]
+
+    def _notify(self, section: str, key_path: Optional[str]) -> None:
+        """Call a section's subscribers; one failing callback does not stop the rest"""
+        refs = self._subscribers.get(section)
+        if not refs:
+            return
+        for ref in list(refs):
+            callback = ref()
+            if callback is None:
+                refs.remove(ref)
+                continue
+            try:
+                callback(section, key_path)
+            except Exception as e:
+                print(f"[ConfigManager] Error notifying {section} subscriber: {e}")
+
+    def _set_setting(self, section: str, key_path: str, value: Any) -> None:
+        """Set a dotted-path value, recompile and notify if it actually changed"""
+        with self._config_lock:
+            if self._is_current_value(section, key_path, value):
+                return
+            config = self._configs[section]
+            previous = self._get_nested_value(config, key_path, self)
+            self._set_nested_value(config, key_path, value)
+            try:
+                self._compile_section(section)
+            except ConfigValidationError:
+                # Put the old value back so the config stays valid
+                if previous is self:
+                    parent, _, key = key_path.rpartition(".")
+                    self._get_nested_value(config, parent, config).pop(key, None)
+                else:
+                    self._set_nested_value(config, key_path, previous)
+                raise
+        self._notify(section, key_path)
+
+    def _is_current_value(self, section: str, key_path: str, value: Any) -> bool:
+        """Whether value normalizes to what key_path already holds ("0x0E21" matches 3617)"""
+        current = self._compiled[section].get(key_path, self)
+        if current is self or isinstance(value, dict):
+            return False
+        try:
+            value = normalize_setting(section, key_path, value)
+        except ValueError:
+            return False  # Let the section compile report it
+        return type(current) is type(value) and current == value
+
+    def _compile_section(self, section: str) -> None:
+        """Validate a section, flatten it into dotted-path lookups and rebuild its snapshot"""
+        config = self._configs[section]
+        normalized = normalize_section(section, config)
+        flat: Dict[str, Any] = {}
+        self._flatten_config(config, normalized, "", flat)
+        self._install_compiled(section, flat, normalized)
+
+    def _install_compiled(self, section: str, flat: Dict[str, Any], normalized: Dict) -> None:
+        """Make a compiled section current"""
+        self._compiled[section] = flat
+        self._snapshots[section] = ConfigSnapshot(normalized)
+        self.config_version += 1
+
+    def _flatten_config(
+        self, config: Dict, normalized: Dict, prefix: str, flat: Dict[str, Any]
+    ) -> None:
+        """Add every path of a nested dict to flat
+
+        Settings map to their normalized values; section paths map to the live
+        config dicts, so callers reading a whole section see later edits.
+        """
+        for key, value in config.items():
+            path = f"{prefix}{key}"
+            if isinstance(value, dict):
+                flat[path] = value
+                self._flatten_config(value, normalized[key], path + ".", flat)
+            else:
+                flat[path] = normalized[key]
 
     def get_looting_config(self) -> Dict:
         """Get the entire looting configuration"""
@@ -221,6 +797,15 @@ class ConfigManager:
                 "main_loop_delay_ms": 250,
                 "error_recovery_delay_ms": 1000,
                 "target_wait_timeout_ms": 1000,
+                "config_save_delay_ms": 1000,
+                "config_hot_reload_enabled": True,
+                "config_reload_check_interval_ms": 2000,
+            },
+            "profiles": {"active_profile": "default", "by_character": {}},
+            "runtime_state": {
+                "enabled": True,
+                "snapshot_interval_ms": 30000,
+                "max_age_seconds": 900,
             },
             "gump_interface": {
                 "enabled": True,
@@ -229,7 +814,6 @@ class ConfigManager:
                     "height": 240,
                     "x_position": 100,
                     "y_position": 100,
-                    "update_interval_cycles": 8,
                 },
                 "minimized_gump": {"width": 100, "height": 30},
                 "rate_limiting": {"button_press_delay_ms": 500},
@@ -247,13 +831,29 @@ class ConfigManager:
                 "performance_thresholds": {
                     "main_loop_warning_ms": 800,
                     "system_execution_warning_ms": 300
+                },
+                "profiling": {
+                    "enabled": True,
+                    "dump_on_shutdown": True
                 }
             },
+            "system_scheduling": {
+                "healing": {"period_ms": 250, "priority": 0, "budget_ms": 100},
+                "gump": {"period_ms": 250, "priority": 1, "budget_ms": 50},
+                "combat": {"period_ms": 250, "priority": 2, "budget_ms": 150},
+                "looting": {"period_ms": 250, "priority": 3, "budget_ms": 300}
+            },
             "logging": {
                 "console_logging": True,
                 "file_logging": False,
                 "log_level": "info",
                 "debug_status_interval_cycles": 20,
+                "log_file_name": "dexbot.log",
+                "max_file_size_kb": 1024,
+                "backup_count": 3,
+                "flush_interval_seconds": 2.0,
+                "buffer_max_records": 200,
+                "event_log_enabled": True,
             },
         }
 
@@ -0,0 +1,348 @@
+"""
+Configuration Schema for DexBot
+Validates config sections when they are loaded and normalizes their values
+"""
+
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+
+class ConfigValidationError(ValueError):
+    """Raised when a config section contains values that do not match its schema"""
+
+    def __init__(self, section: str, errors: List[str]) -> None:
+        self.section = section
+        self.errors = errors
+        super().__init__(f"Invalid {section} config: " + "; ".join(errors))
+
+
+class TargetPriority(str, Enum):
+    """Combat target_selection.priority_mode values"""
+
+    CLOSEST = "closest"
+    LOWEST_HEALTH = "lowest_health"
+    HIGHEST_THREAT = "highest_threat"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class LogLevel(str, Enum):
+    """Main logging.log_level values"""
+
+    DEBUG = "debug"
+    INFO = "info"
+    WARNING = "warning"
+    ERROR = "error"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+def _check_range(value: Any, minimum: Optional[float], maximum: Optional[float]) -> None:
+    """Raise ValueError if a number is outside [minimum, maximum]"""
+    if minimum is not None and value < minimum:
+        raise ValueError(f"must be at least {minimum}")
+    if maximum is not None and value > maximum:
+        raise ValueError(f"must be at most {maximum}")
+
+
+def _boolean() -> Callable[[Any], bool]:
+    """true/false"""
+
+    def convert(value: Any) -> bool:
+        if not isinstance(value, bool):
+            raise ValueError("expected true or false")
+        return value
+
+    return convert
+
+
+def _integer(minimum: Optional[int] = None, maximum: Optional[int] = None) -> Callable[[Any], int]:
+    """Whole number; numeric strings and whole floats are accepted"""
+
+    def convert(value: Any) -> int:
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        elif isinstance(value, str) and value.strip().lstrip("-").isdigit():
+            value = int(value.strip())
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise ValueError("expected a whole number")
+        _check_range(value, minimum, maximum)
+        return value
+
+    return convert
+
+
+def _number(minimum: Optional[float] = 0, maximum: Optional[float] = None) -> Callable[[Any], Any]:
+    """Number such as a millisecond duration; numeric strings are accepted"""
+
+    def convert(value: Any) -> Any:
+        if isinstance(value, str):
+            try:
+                value = float(value) if "." in value else int(value)
+            except ValueError:
+                raise ValueError("expected a number")
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError("expected a number")
+        _check_range(value, minimum, maximum)
+        return value
+
+    return convert
+
+
+def parse_item_id(value: Any) -> Optional[int]:
+    """Item ID from an int, a hex string ("0x0E21") or a decimal string ("3617")
+
+    Returns None if the value is not an item ID (e.g. an item name).
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value if value >= 0 else None
+    if isinstance(value, str):
+        text = value.strip().lower()
+        try:
+            if text.startswith("0x"):
+                return int(text, 16)
+            if text.isdigit():
+                return int(text)
+        except ValueError:
+            return None
+    return None
+
+
+def _item_id(optional: bool = False) -> Callable[[Any], Optional[int]]:
+    """Item ID normalized to an int (null allowed when optional)"""
+
+    def convert(value: Any) -> Optional[int]:
+        if value is None and optional:
+            return None
+        item_id = parse_item_id(value)
+        if item_id is None:
+            raise ValueError('expected an item ID such as 3617 or "0x0E21"')
+        return item_id
+
+    return convert
+
+
+def _enum(enum_class: Any) -> Callable[[Any], Any]:
+    """One of an Enum's values (case-insensitive)"""
+
+    def convert(value: Any) -> Any:
+        try:
+            return enum_class(str(value).strip().lower())
+        except ValueError:
+            choices = ", ".join(member.value for member in enum_class)
+            raise ValueError(f"expected one of {choices}")
+
+    return convert
+
+
+def _string() -> Callable[[Any], str]:
+    """Text"""
+
+    def convert(value: Any) -> str:
+        if not isinstance(value, str):
+            raise ValueError("expected text")
+        return value
+
+    return convert
+
+
+def _string_list() -> Callable[[Any], List[str]]:
+    """List of text entries"""
+
+    def convert(value: Any) -> List[str]:
+        if not isinstance(value, list) or not all(isinstance(entry, str) for entry in value):
+            raise ValueError("expected a list of text entries")
+        return list(value)
+
+    return convert
+
+
+def _loot_rules() -> Callable[[Any], List[Any]]:
+    """Loot list: item IDs become ints, names and category rules lowercase text"""
+
+    def convert(value: Any) -> List[Any]:
+        if not isinstance(value, list):
+            raise ValueError("expected a list of item IDs and names")
+        rules: List[Any] = []
+        for entry in value:
+            item_id = parse_item_id(entry)
+            if item_id is not None:
+                rules.append(item_id)
+            elif isinstance(entry, str) and entry.strip():
+                rules.append(entry.strip().lower())
+            else:
+                raise ValueError(f"entry {entry!r} is not an item ID or name")
+        return rules
+
+    return convert
+
+
+# Dotted paths checked for each section; settings not listed here pass through unchanged
+CONFIG_SCHEMAS: Dict[str, Dict[str, Callable[[Any], Any]]] = {
+    "main": {
+        "system_toggles.healing_system_enabled": _boolean(),
+        "global_settings.debug_mode": _boolean(),
+        "global_settings.main_loop_delay_ms": _number(1),
+        "global_settings.error_recovery_delay_ms": _number(),
+        "global_settings.target_wait_timeout_ms": _number(),
+        "global_settings.config_save_delay_ms": _number(),
+        "global_settings.config_hot_reload_enabled": _boolean(),
+        "global_settings.config_reload_check_interval_ms": _number(100),
+        "profiles.active_profile": _string(),
+        "runtime_state.enabled": _boolean(),
+        "runtime_state.snapshot_interval_ms": _number(1000),
+        "runtime_state.max_age_seconds": _number(),
+        "gump_interface.enabled": _boolean(),
+        "gump_interface.main_gump.width": _integer(1),
+        "gump_interface.main_gump.height": _integer(1),
+        "gump_interface.main_gump.x_position": _integer(),
+        "gump_interface.main_gump.y_position": _integer(),
+        "gump_interface.minimized_gump.width": _integer(1),
+        "gump_interface.minimized_gump.height": _integer(1),
+        "gump_interface.rate_limiting.button_press_delay_ms": _number(),
+        "performance_optimization.looting_optimizations.use_ignore_list": _boolean(),
+        "performance_optimization.looting_optimizations.ignore_list_cleanup_interval_seconds": _number(1),
+        "performance_optimization.profiling.enabled": _boolean(),
+        "performance_optimization.profiling.dump_on_shutdown": _boolean(),
+        "system_scheduling.healing.period_ms": _number(1),
+        "system_scheduling.healing.priority": _integer(),
+        "system_scheduling.healing.budget_ms": _number(),
+        "system_scheduling.gump.period_ms": _number(1),
+        "system_scheduling.gump.priority": _integer(),
+        "system_scheduling.gump.budget_ms": _number(),
+        "system_scheduling.combat.period_ms": _number(1),
+        "system_scheduling.combat.priority": _integer(),
+        "system_scheduling.combat.budget_ms": _number(),
+        "system_scheduling.looting.period_ms": _number(1),
+        "system_scheduling.looting.priority": _integer(),
+        "system_scheduling.looting.budget_ms": _number(),
+        "logging.console_logging": _boolean(),
+        "logging.log_level": _enum(LogLevel),
+        "logging.file_logging": _boolean(),
+        "logging.log_file_name": _string(),
+        "logging.max_file_size_kb": _number(),
+        "logging.backup_count": _integer(0),
+        "logging.flush_interval_seconds": _number(),
+        "logging.buffer_max_records": _integer(1),
+        "logging.event_log_enabled": _boolean(),
+    },
+    "auto_heal": {
+        "healing_toggles.bandage_healing_enabled": _boolean(),
+        "healing_toggles.potion_healing_enabled": _boolean(),
+        "health_thresholds.healing_threshold_percentage": _number(0, 100),
+        "health_thresholds.critical_health_threshold": _number(0, 100),
+        "health_thresholds.bandage_threshold_hp": _integer(0),
+        "item_ids.bandage_id": _item_id(),
+        "item_ids.heal_potion_id": _item_id(),
+        "item_ids.lesser_heal_potion_id": _item_id(optional=True),
+        "item_ids.greater_heal_potion_id": _item_id(optional=True),
+        "timing_settings.healing_timer_duration_ms": _number(),
+        "timing_settings.potion_cooldown_ms": _number(),
+        "timing_settings.bandage_retry_delay_ms": _number(),
+        "resource_management.bandage_retry_attempts": _integer(0),
+        "resource_management.low_bandage_warning": _integer(0),
+        "resource_management.search_range": _integer(0),
+        "resource_management.bandage_check_interval_cycles": _integer(1),
+        "journal_monitoring.healing_success_msg": _string(),
+        "journal_monitoring.healing_partial_msg": _string(),
+    },
+    "combat": {
+        "system_toggles.combat_system_enabled": _boolean(),
+        "system_toggles.auto_target_enabled": _boolean(),
+        "system_toggles.auto_attack_enabled": _boolean(),
+        "target_selection.max_range": _integer(0),
+        "target_selection.priority_mode": _enum(TargetPriority),
+        "target_selection.target_types": _string_list(),
+        "target_selection.ignore_pets": _boolean(),
+        "target_selection.allow_target_blues": _boolean(),
+        "combat_behavior.attack_delay_ms": _number(),
+        "combat_behavior.target_switch_delay_ms": _number(),
+        "combat_behavior.combat_timeout_ms": _number(),
+        "combat_behavior.retreat_on_low_health": _boolean(),
+        "combat_behavior.retreat_health_threshold": _number(0, 100),
+        "timing_settings.combat_check_interval": _number(1),
+        "timing_settings.combat_loop_delay_ms": _number(1),
+        "timing_settings.target_scan_interval": _integer(0),
+        "display_settings.show_target_name_overhead": _boolean(),
+        "display_settings.target_name_display_interval_ms": _number(),
+        "display_settings.target_name_display_color": _integer(0),
+    },
+    "looting": {
+        "enabled": _boolean(),
+        "timing.corpse_scan_interval_ms": _number(),
+        "timing.loot_action_delay_ms": _number(),
+        "timing.container_open_timeout_ms": _number(),
+        "timing.skinning_action_delay_ms": _number(),
+        "behavior.max_looting_range": _integer(0),
+        "behavior.auto_skinning_enabled": _boolean(),
+        "behavior.inventory_weight_limit_percent": _number(0, 100),
+        "behavior.inventory_item_limit": _integer(1),
+        "behavior.process_corpses_in_combat": _boolean(),
+        "loot_lists.always_take": _loot_rules(),
+        "loot_lists.take_if_space": _loot_rules(),
+        "loot_lists.never_take": _loot_rules(),
+        "skinning.enabled": _boolean(),
+        "skinning.skinnable_creatures": _string_list(),
+        "performance.max_corpse_queue_size": _integer(1),
+        "performance.cache_cleanup_interval_seconds": _number(1),
+        "performance.max_cache_size": _integer(1),
+        "ui.notification_color": _integer(0),
+    },
+}
+
+
+def normalize_section(section: str, config: Dict) -> Dict:
+    """Validate a config section and return a copy with normalized values
+
+    Args:
+        section: Section name ("main", "auto_heal", "combat" or "looting")
+        config: The section as loaded from JSON (merged with defaults)
+
+    Returns:
+        A nested copy of config where every setting in the schema holds its
+        normalized value (ints for item IDs, numbers for durations, enum members)
+
+    Raises:
+        ConfigValidationError: Listing every invalid setting in the section
+    """
+    errors: List[str] = []
+    normalized = _normalize(config, "", CONFIG_SCHEMAS.get(section, {}), errors)
+    if errors:
+        raise ConfigValidationError(section, errors)
+    return normalized
+
+
+def normalize_setting(section: str, key_path: str, value: Any) -> Any:
+    """Normalize a single setting the way normalize_section would
+
+    Raises:
+        ValueError: If the value does not match the setting's schema
+    """
+    convert = CONFIG_SCHEMAS.get(section, {}).get(key_path)
+    if convert is None or isinstance(value, dict):
+        return value
+    return convert(value)
+
+
+def _normalize(config: Dict, prefix: str, schema: Dict[str, Callable[[Any], Any]], errors: List[str]) -> Dict:
+    """Normalize one level of a nested config dict, collecting errors"""
+    result: Dict[str, Any] = {}
+    for key, value in config.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            if path in schema:
+                errors.append(f"{path}: expected a single value, got a section")
+            result[key] = _normalize(value, path + ".", schema, errors)
+        elif path in schema:
+            try:
+                result[key] = schema[path](value)
+            except ValueError as e:
+                errors.append(f"{path}: {e} (got {value!r})")
+                result[key] = value
+        else:
+            result[key] = value
+    return result
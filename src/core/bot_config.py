@@ -4,21 +4,21 @@ Manages all configuration constants using the Singleton pattern and ConfigManage
 """
 
 import os
-from typing import Optional
+from typing import Optional, Tuple
 
 from ..config.config_manager import ConfigManager
+from ..core.logger import Logger
 
-def _get_version_info():
-    """Read version information from version.txt file or use bundled constants"""
-    
-    # Check if we're running as a bundled script with embedded version info
-    import sys
-    main_module = sys.modules.get('__main__')
-    if hasattr(main_module, '_BUNDLED_VERSION'):
+def _read_version_info() -> Tuple[str, str, str]:
+    """Read version information from the bundled constants or version.txt"""
+
+    # The bundle task bakes the version into DexBot.py, which shares this namespace
+    bundled_version = globals().get("_BUNDLED_VERSION")
+    if bundled_version is not None:
         return (
-            getattr(main_module, '_BUNDLED_VERSION', 'UNKNOWN'),
-            getattr(main_module, '_BUNDLED_VERSION_NAME', 'Development Version'),
-            getattr(main_module, '_BUNDLED_BUILD_DATE', 'UNKNOWN')
+            bundled_version,
+            globals().get("_BUNDLED_VERSION_NAME", "Development Version"),
+            globals().get("_BUNDLED_BUILD_DATE", "UNKNOWN"),
         )
     
     # Try to find version.txt in the project root
@@ -54,6 +54,13 @@ def _get_version_info():
     return "UNKNOWN", "Development Version", "UNKNOWN"
 
 
+def _get_version_info() -> Tuple[str, str, str]:
+    """Version, version name and build date, read on first use and then cached"""
+    if not hasattr(_get_version_info, "cached"):
+        _get_version_info.cached = _read_version_info()
+    return _get_version_info.cached
+
+
 class BotConfig:
     """Configuration constants for DexBot - now loads from JSON config files
 
@@ -61,12 +68,6 @@ class BotConfig:
     and ConfigManager for persistent storage.
     """
 
-    # Version Information - Read from version.txt
-    _version_info = _get_version_info()
-    VERSION = _version_info[0]
-    VERSION_NAME = _version_info[1]
-    BUILD_DATE = _version_info[2]
-
     _instance: Optional["BotConfig"] = None
 
     def __new__(cls) -> "BotConfig":
@@ -84,6 +85,36 @@ class BotConfig:
         self.config_manager = ConfigManager()
         self._load_settings()
 
+        # Pick up changes made elsewhere (hot-reloaded files, other set_*_setting callers)
+        self.config_manager.subscribe("main", self._on_config_changed)
+        self.config_manager.subscribe("auto_heal", self._on_config_changed)
+
+    def _on_config_changed(self, section: str, key_path: Optional[str]) -> None:
+        """ConfigManager subscriber: refresh the cached setting attributes"""
+        self._load_settings()
+
+    @property
+    def DEBUG_MODE(self) -> bool:
+        """Debug output toggle, stored on Logger so debug calls need no config lookup"""
+        return Logger.debug_enabled
+
+    @DEBUG_MODE.setter
+    def DEBUG_MODE(self, value: bool) -> None:
+        Logger.debug_enabled = bool(value)
+
+    # Version information - resolved lazily so importing does no file I/O
+    @property
+    def VERSION(self) -> str:
+        return _get_version_info()[0]
+
+    @property
+    def VERSION_NAME(self) -> str:
+        return _get_version_info()[1]
+
+    @property
+    def BUILD_DATE(self) -> str:
+        return _get_version_info()[2]
+
     def get_version_info(self) -> str:
         """Get formatted version information for display"""
         return f"DexBot v{self.VERSION} ({self.VERSION_NAME}) - Build: {self.BUILD_DATE}"
@@ -104,19 +135,10 @@ class BotConfig:
             "healing_toggles.potion_healing_enabled", True
         )
 
-        # Item IDs (convert hex strings to integers)
-        bandage_id_str = self.config_manager.get_auto_heal_setting("item_ids.bandage_id", "0x0E21")
-        self.BANDAGE_ID = (
-            int(bandage_id_str, 16) if isinstance(bandage_id_str, str) else bandage_id_str
-        )
-
-        heal_potion_id_str = self.config_manager.get_auto_heal_setting(
-            "item_ids.heal_potion_id", "0x0F0C"
-        )
-        self.HEAL_POTION_ID = (
-            int(heal_potion_id_str, 16)
-            if isinstance(heal_potion_id_str, str)
-            else heal_potion_id_str
+        # Item IDs (normalized to ints by the config schema)
+        self.BANDAGE_ID = self.config_manager.get_auto_heal_setting("item_ids.bandage_id", 0x0E21)
+        self.HEAL_POTION_ID = self.config_manager.get_auto_heal_setting(
+            "item_ids.heal_potion_id", 0x0F0C
         )
 
         # Timer names (constants)
@@ -187,9 +209,6 @@ class BotConfig:
 
         # GUMP settings
         self.GUMP_ID = 12345  # Static constant
-        self.GUMP_UPDATE_INTERVAL_CYCLES = self.config_manager.get_main_setting(
-            "gump_interface.main_gump.update_interval_cycles", 8
-        )
         self.GUMP_WIDTH = self.config_manager.get_main_setting(
             "gump_interface.main_gump.width", 320
         )
@@ -261,18 +280,24 @@ class BotConfig:
     def save_settings(self) -> bool:
         """Save current settings back to configuration files"""
         try:
+            # Capture first: each set_*_setting below reloads these attributes from config
+            healing_enabled = self.HEALING_ENABLED
+            debug_mode = self.DEBUG_MODE
+            bandage_healing_enabled = self.BANDAGE_HEALING_ENABLED
+            potion_healing_enabled = self.POTION_HEALING_ENABLED
+
             # Update main config values
             self.config_manager.set_main_setting(
-                "system_toggles.healing_system_enabled", self.HEALING_ENABLED
+                "system_toggles.healing_system_enabled", healing_enabled
             )
-            self.config_manager.set_main_setting("global_settings.debug_mode", self.DEBUG_MODE)
+            self.config_manager.set_main_setting("global_settings.debug_mode", debug_mode)
 
             # Update auto heal config values
             self.config_manager.set_auto_heal_setting(
-                "healing_toggles.bandage_healing_enabled", self.BANDAGE_HEALING_ENABLED
+                "healing_toggles.bandage_healing_enabled", bandage_healing_enabled
             )
             self.config_manager.set_auto_heal_setting(
-                "healing_toggles.potion_healing_enabled", self.POTION_HEALING_ENABLED
+                "healing_toggles.potion_healing_enabled", potion_healing_enabled
             )
 
             # Save all configs
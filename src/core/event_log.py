@@ -0,0 +1,208 @@
+"""
+Binary Session Event Log for DexBot
+Append-only log of fixed-size event records (heals, targets, corpses, item moves)
+for offline session analysis without scraping console text
+"""
+
+import os
+import struct
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# File layout: 8-byte header (magic, format version, record size) followed by
+# fixed-size little-endian records
+EVENT_LOG_MAGIC = b"DXEV"
+EVENT_LOG_VERSION = 1
+EVENT_HEADER = struct.Struct("<4sHH")
+
+# timestamp (float64 seconds), event type (uint8), pad, item_id (uint16),
+# serial (uint32), aux (uint32), value (int32) = 24 bytes
+EVENT_RECORD = struct.Struct("<dBxHIIi")
+
+# Buffered records are written once this many are pending or this much time has passed
+EVENT_FLUSH_RECORDS = 256
+EVENT_FLUSH_INTERVAL_SECONDS = 5.0
+
+
+class EventType:
+    """Event type codes stored in the record's type byte
+
+    Field usage per event (unused fields are 0):
+        HEAL_NEEDED      value=hits, aux=max hits
+        BANDAGE_STARTED  item_id=bandage ID, value=hits
+        BANDAGE_APPLIED  (bandage finished, from the journal)
+        POTION_USED      item_id=potion ID, value=hits
+        TARGET_ACQUIRED  serial=mobile, value=distance in tenths of a tile
+        TARGET_LOST      serial=mobile
+        CORPSE_SCANNED   value=corpses found
+        CORPSE_LOOTED    serial=corpse, value=items taken
+        ITEM_MOVED       serial=item, item_id, aux=corpse, value=amount
+        ITEM_MOVE_FAILED serial=item, item_id, aux=corpse, value=amount
+        GOLD_COLLECTED   serial=item, item_id, aux=corpse, value=amount
+        LOOP_TICK        value=tick duration in microseconds
+        SESSION_START / SESSION_END
+    """
+
+    SESSION_START = 1
+    SESSION_END = 2
+    LOOP_TICK = 3
+    HEAL_NEEDED = 10
+    BANDAGE_STARTED = 11
+    BANDAGE_APPLIED = 12
+    POTION_USED = 13
+    TARGET_ACQUIRED = 20
+    TARGET_LOST = 21
+    CORPSE_SCANNED = 30
+    CORPSE_LOOTED = 31
+    ITEM_MOVED = 32
+    ITEM_MOVE_FAILED = 33
+    GOLD_COLLECTED = 34
+
+    NAMES: Dict[int, str] = {}
+
+
+EventType.NAMES = {
+    value: name
+    for name, value in vars(EventType).items()
+    if name.isupper() and isinstance(value, int)
+}
+
+
+class EventLog:
+    """Append-only binary event log
+
+    Recording is a struct pack and a list append; records are written to disk in
+    batches. A log that has not been opened ignores all events, so systems can
+    record unconditionally.
+    """
+
+    def __init__(self) -> None:
+        self.file_path: Optional[str] = None
+        self._pending: List[bytes] = []
+        self._last_flush = 0.0
+        self.records_written = 0
+        self.write_errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether events are currently being recorded"""
+        return self.file_path is not None
+
+    def open(self, file_path: str) -> bool:
+        """Start recording to a new or existing log file
+
+        Args:
+            file_path: Destination file; parent directories are created if needed
+
+        Returns:
+            True if the log is ready for recording
+        """
+        self.close()
+        try:
+            directory = os.path.dirname(file_path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            if not os.path.exists(file_path) or os.path.getsize(file_path) == 0:
+                with open(file_path, "wb") as f:
+                    f.write(EVENT_HEADER.pack(EVENT_LOG_MAGIC, EVENT_LOG_VERSION, EVENT_RECORD.size))
+        except Exception as e:
+            print(f"[ERROR] Failed to open event log {file_path}: {e}")
+            return False
+
+        self.file_path = file_path
+        self._last_flush = time.time()
+        self.record(EventType.SESSION_START)
+        return True
+
+    def record(
+        self,
+        event_type: int,
+        serial: int = 0,
+        item_id: int = 0,
+        aux: int = 0,
+        value: int = 0,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """Append one event (no-op while the log is closed)"""
+        if self.file_path is None:
+            return
+        now = time.time() if timestamp is None else timestamp
+        self._pending.append(
+            EVENT_RECORD.pack(
+                now,
+                event_type,
+                int(item_id) & 0xFFFF,
+                int(serial) & 0xFFFFFFFF,
+                int(aux) & 0xFFFFFFFF,
+                max(-0x80000000, min(0x7FFFFFFF, int(value))),
+            )
+        )
+        if (
+            len(self._pending) >= EVENT_FLUSH_RECORDS
+            or now - self._last_flush >= EVENT_FLUSH_INTERVAL_SECONDS
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending records to disk"""
+        self._last_flush = time.time()
+        if not self._pending or self.file_path is None:
+            return
+        data = b"".join(self._pending)
+        self._pending = []
+        try:
+            with open(self.file_path, "ab") as f:
+                f.write(data)
+            self.records_written += len(data) // EVENT_RECORD.size
+        except Exception as e:
+            self.write_errors += 1
+            print(f"[ERROR] Failed to write event log {self.file_path}: {e}")
+
+    def close(self) -> None:
+        """Record the session end, flush and stop recording"""
+        if self.file_path is None:
+            return
+        self.record(EventType.SESSION_END)
+        self.flush()
+        self.file_path = None
+
+
+def iter_events(file_path: str, chunk_records: int = 4096) -> Iterator[Tuple[float, int, int, int, int, int]]:
+    """Stream events from a log file in constant memory
+
+    Args:
+        file_path: Event log written by EventLog
+        chunk_records: Number of records read per disk read
+
+    Yields:
+        (timestamp, event_type, item_id, serial, aux, value) tuples
+
+    Raises:
+        ValueError: If the file is not a DexBot event log of a supported version
+    """
+    with open(file_path, "rb") as f:
+        header = f.read(EVENT_HEADER.size)
+        if len(header) < EVENT_HEADER.size:
+            raise ValueError(f"{file_path} is too short to be an event log")
+        magic, version, record_size = EVENT_HEADER.unpack(header)
+        if magic != EVENT_LOG_MAGIC or record_size != EVENT_RECORD.size:
+            raise ValueError(f"{file_path} is not a DexBot event log")
+        if version > EVENT_LOG_VERSION:
+            raise ValueError(f"Unsupported event log version {version}")
+
+        chunk_size = EVENT_RECORD.size * chunk_records
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            # A partially written trailing record (e.g. after a crash) is ignored
+            usable = len(chunk) - len(chunk) % EVENT_RECORD.size
+            for offset in range(0, usable, EVENT_RECORD.size):
+                yield EVENT_RECORD.unpack_from(chunk, offset)
+
+
+def get_event_log() -> EventLog:
+    """Get the shared session event log"""
+    if not hasattr(get_event_log, "_instance"):
+        get_event_log._instance = EventLog()
+    return get_event_log._instance
@@ -3,40 +3,250 @@ Logging and Status Management System for DexBot
 Provides standardized logging and runtime status tracking
 """
 
-from typing import Dict, Optional, Union
+import os
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Union
 
+from ..core.profiler import Profiler
 from ..utils.imports import Items, Player
 
+# File sink defaults (overridden by the "logging" section of main_config)
+LOG_FLUSH_INTERVAL_SECONDS = 2.0
+LOG_BUFFER_MAX_RECORDS = 200
+LOG_MAX_FILE_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+
+class LogFileSink:
+    """Buffered, size-rotated log file writer
+
+    Records are collected in memory and written in batches, either by a background
+    thread every flush interval or as soon as the buffer holds buffer_max_records
+    lines. When the file would grow past max_bytes it is rotated to .1, .2, ...
+    keeping backup_count old files.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        max_bytes: int = LOG_MAX_FILE_BYTES,
+        backup_count: int = LOG_BACKUP_COUNT,
+        flush_interval_seconds: float = LOG_FLUSH_INTERVAL_SECONDS,
+        buffer_max_records: int = LOG_BUFFER_MAX_RECORDS,
+    ) -> None:
+        self.file_path = file_path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.flush_interval_seconds = flush_interval_seconds
+        self.buffer_max_records = buffer_max_records
+
+        self._buffer: List[str] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Statistics
+        self.records_written = 0
+        self.flush_count = 0
+        self.rotation_count = 0
+        self.write_errors = 0
+
+        directory = os.path.dirname(file_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+    def start(self) -> None:
+        """Start the background flush thread"""
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._flush_worker, name="DexBotLogFlush")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def write(self, line: str) -> None:
+        """Queue one log line; never touches the disk on the caller's thread
+        unless no background thread is running"""
+        with self._lock:
+            self._buffer.append(line)
+            buffer_full = len(self._buffer) >= self.buffer_max_records
+
+        if buffer_full:
+            if self._thread is not None:
+                self._wakeup.set()
+            else:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered lines to the file, rotating first if needed"""
+        with self._lock:
+            if not self._buffer:
+                return
+            lines = self._buffer
+            self._buffer = []
+
+        data = "\n".join(lines) + "\n"
+        with self._write_lock:
+            try:
+                self._rotate_if_needed(len(data.encode("utf-8")))
+                with open(self.file_path, "a", encoding="utf-8") as f:
+                    f.write(data)
+                self.records_written += len(lines)
+                self.flush_count += 1
+            except Exception as e:
+                self.write_errors += 1
+                print(f"[ERROR] Failed to write log file {self.file_path}: {e}")
+
+    def close(self) -> None:
+        """Stop the background thread and flush what is left"""
+        if self._thread is not None:
+            self._stopping = True
+            self._wakeup.set()
+            self._thread.join(self.flush_interval_seconds + 1.0)
+            self._thread = None
+        self.flush()
+
+    def _flush_worker(self) -> None:
+        """Background loop flushing on the interval or when woken by a full buffer"""
+        while not self._stopping:
+            self._wakeup.wait(self.flush_interval_seconds)
+            self._wakeup.clear()
+            self.flush()
+
+    def _rotate_if_needed(self, incoming_bytes: int) -> None:
+        """Rotate dexbot.log -> dexbot.log.1 -> ... when the size limit is reached"""
+        if self.max_bytes <= 0 or not os.path.exists(self.file_path):
+            return
+        if os.path.getsize(self.file_path) + incoming_bytes <= self.max_bytes:
+            return
+
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.file_path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.file_path}.{index + 1}")
+        if self.backup_count > 0:
+            os.replace(self.file_path, f"{self.file_path}.1")
+        else:
+            os.remove(self.file_path)
+        self.rotation_count += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get sink statistics for status reporting"""
+        with self._lock:
+            buffered = len(self._buffer)
+        return {
+            "buffered": buffered,
+            "records_written": self.records_written,
+            "flushes": self.flush_count,
+            "rotations": self.rotation_count,
+            "write_errors": self.write_errors,
+        }
+
 
 class Logger:
     """Simple logging system with different levels
 
     Provides standardized logging functionality with debug, info, error, and warning levels.
     Debug messages are only shown when DEBUG_MODE is enabled.
+
+    Debug messages are formatted lazily: pass %-style arguments
+    (Logger.debug("Took %.1fms", duration)) or a callable returning the message, and
+    nothing is formatted while debug output is off. Guard expensive argument
+    computation with `if Logger.debug_enabled:`.
+
+    Output goes to the console and, once configure() has been called with a file
+    path, to a buffered LogFileSink.
     """
 
+    # Cached DEBUG_MODE; kept in sync by the BotConfig.DEBUG_MODE property
+    debug_enabled = False
+
+    console_enabled = True
+    _file_sink: Optional[LogFileSink] = None
+
+    @staticmethod
+    def configure(
+        console: bool = True,
+        file_path: Optional[str] = None,
+        max_bytes: int = LOG_MAX_FILE_BYTES,
+        backup_count: int = LOG_BACKUP_COUNT,
+        flush_interval_seconds: float = LOG_FLUSH_INTERVAL_SECONDS,
+        buffer_max_records: int = LOG_BUFFER_MAX_RECORDS,
+    ) -> None:
+        """Set up log outputs
+
+        Args:
+            console: Whether messages are printed to the RazorEnhanced console
+            file_path: Log file to write to, or None to disable file logging
+            max_bytes: Rotate the log file once it reaches this size
+            backup_count: Number of rotated files to keep
+            flush_interval_seconds: Background flush period
+            buffer_max_records: Flush early once this many lines are buffered
+        """
+        Logger.shutdown()
+        Logger.console_enabled = console
+        if file_path:
+            sink = LogFileSink(
+                file_path, max_bytes, backup_count, flush_interval_seconds, buffer_max_records
+            )
+            sink.start()
+            Logger._file_sink = sink
+
     @staticmethod
-    def debug(message: str) -> None:
+    def shutdown() -> None:
+        """Flush and close the file sink (safe to call more than once)"""
+        sink = Logger._file_sink
+        Logger._file_sink = None
+        if sink is not None:
+            sink.close()
+
+    @staticmethod
+    def get_file_sink() -> Optional[LogFileSink]:
+        """Get the active file sink, if file logging is enabled"""
+        return Logger._file_sink
+
+    @staticmethod
+    def _emit(line: str) -> None:
+        """Send one formatted line to every configured output"""
+        if Logger.console_enabled:
+            print(line)
+        sink = Logger._file_sink
+        if sink is not None:
+            sink.write(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]} {line}")
+
+    @staticmethod
+    def debug(message: Union[str, Callable[[], str]], *args: Any) -> None:
         """Log debug message (only shown when DEBUG_MODE is enabled)"""
-        from ..core.bot_config import BotConfig
+        if not Logger.debug_enabled:
+            return
+        if callable(message):
+            message = message()
+        elif args:
+            message = message % args
+        Logger._emit(f"[DEBUG] {message}")
 
-        if BotConfig().DEBUG_MODE:
-            print(f"[DEBUG] {message}")
+    @staticmethod
+    def timestamp() -> str:
+        """Get the current time as HH:MM:SS.mmm for log messages"""
+        return datetime.now().strftime("%H:%M:%S.%f")[:-3]
 
     @staticmethod
     def info(message: str) -> None:
         """Log informational message"""
-        print(message)
+        Logger._emit(message)
 
     @staticmethod
     def error(message: str) -> None:
         """Log error message"""
-        print(f"[ERROR] {message}")
+        Logger._emit(f"[ERROR] {message}")
 
     @staticmethod
     def warning(message: str) -> None:
         """Log warning message"""
-        print(f"[WARNING] {message}")
+        Logger._emit(f"[WARNING] {message}")
 
 
 class SystemStatus:
@@ -53,10 +263,11 @@ class SystemStatus:
             cls._instance = super().__new__(cls)
             # Initialize all instance variables
             cls._instance.healing_active = False
+            cls._instance.heal_need_recorded = False  # HEAL_NEEDED event already logged
             cls._instance.bandage_count = 0
             cls._instance.heal_potion_count = 0  # Track heal potions used
             cls._instance.bandage_check_counter = 0
-            cls._instance.gump_update_counter = 0
+            cls._instance.last_debug_status_time = 0.0  # Last debug status line (GUMP system)
             cls._instance.runtime_cycles = 0  # Track runtime in loop cycles
             cls._instance.gump_closed = False  # Track if GUMP was manually closed
             cls._instance.gump_minimized = False  # Track if GUMP is minimized
@@ -80,6 +291,7 @@ class SystemStatus:
             cls._instance.current_gump_state = (
                 "closed"  # Import GumpState later to avoid circular imports
             )
+            cls._instance.profiler = Profiler()  # Per-phase timing histograms
         return cls._instance
 
     def increment_bandage_count(self) -> None:
@@ -90,6 +302,20 @@ class SystemStatus:
         """Increment heal potion usage counter"""
         self.heal_potion_count += 1
 
+    def get_state(self) -> Dict[str, int]:
+        """Counters kept across script restarts (see RuntimeStateStore)"""
+        return {
+            "bandage_count": self.bandage_count,
+            "heal_potion_count": self.heal_potion_count,
+            "runtime_cycles": self.runtime_cycles,
+        }
+
+    def restore_state(self, state: Dict[str, Any], age_seconds: float) -> None:
+        """Continue the counters of the previous run"""
+        self.bandage_count = int(state.get("bandage_count", self.bandage_count))
+        self.heal_potion_count = int(state.get("heal_potion_count", self.heal_potion_count))
+        self.runtime_cycles = int(state.get("runtime_cycles", self.runtime_cycles))
+
     def get_status_report(self) -> Dict[str, Union[str, int]]:
         """Get comprehensive status report"""
         return {
@@ -98,6 +324,14 @@ class SystemStatus:
             "heal_potions_used": self.heal_potion_count,
         }
 
+    def get_profile_report(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """Get p50/p95/p99/max timings for every profiled phase"""
+        return self.profiler.get_summary()
+
+    def dump_profile(self, file_path: str) -> bool:
+        """Write the profile report to a JSON file"""
+        return self.profiler.dump_json(file_path)
+
     def set_gump_state(self, state: str) -> None:
         """Set the current GUMP state"""
         self.current_gump_state = state
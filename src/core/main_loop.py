@@ -3,11 +3,16 @@ Main Bot Loop and Entry Point for DexBot
 Coordinates all bot systems and handles the main execution loop
 """
 
-import time
+import os
 from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
 from ..config.config_manager import ConfigManager
 from ..core.bot_config import BotConfig, BotMessages, GumpState
+from ..core.event_log import EventType, get_event_log
 from ..core.logger import Logger, SystemStatus
+from ..core.profiler import Profiler
+from ..core.runtime_state import RuntimeStateStore
+from ..core.scheduler import SystemRegistry, TickScheduler
 from ..systems.auto_heal import execute_auto_heal_system, process_healing_journal
 from ..systems.combat import CombatSystem
 from ..systems.looting import LootingSystem
@@ -15,6 +20,203 @@ from ..ui.gump_interface import GumpInterface, update_gump_system
 from ..utils.imports import Misc, Player
 
 
+def _finish_session(
+    status: SystemStatus,
+    scheduler: TickScheduler,
+    config_manager: ConfigManager,
+    runtime_state: Optional[RuntimeStateStore] = None,
+    config_listener: Optional[Callable[[str, Optional[str]], None]] = None,
+) -> None:
+    """Log the end-of-session statistics, dump the profile and flush pending saves and the log file"""
+    if config_listener:
+        config_manager.unsubscribe("main", config_listener)
+    report = status.get_status_report()
+    Logger.info(
+        f"Final stats - Bandages used: {report['bandages_used']}, Heal potions used: {report['heal_potions_used']}"
+    )
+    tick_stats = scheduler.get_stats()
+    Logger.info(
+        f"Loop stats - Ticks: {tick_stats['ticks']}, Overruns: {tick_stats['overruns']} "
+        f"({tick_stats['overrun_percent']:.1f}%, max {tick_stats['max_overrun_ms']:.1f}ms), "
+        f"Jitter: avg {tick_stats['avg_jitter_ms']:.1f}ms / max {tick_stats['max_jitter_ms']:.1f}ms"
+    )
+
+    if status.profiler.enabled and config_manager.get_main_setting(
+        "performance_optimization.profiling.dump_on_shutdown", True
+    ):
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        profile_path = os.path.join(
+            config_manager.script_dir, "logs", f"dexbot_profile_{timestamp}.json"
+        )
+        if status.dump_profile(profile_path):
+            Logger.info(f"[DexBot] Phase timing profile saved to {profile_path}")
+
+    if runtime_state:
+        runtime_state.save()
+    config_manager.flush_saves()
+    get_event_log().close()
+    Logger.shutdown()
+
+
+def _configure_logging(config_manager: ConfigManager) -> None:
+    """Apply the logging section of main_config (console output and file sink)"""
+    logging_config = config_manager.get_main_setting("logging", {})
+    log_path = None
+    if logging_config.get("file_logging", False):
+        log_path = os.path.join(
+            config_manager.script_dir, "logs", logging_config.get("log_file_name", "dexbot.log")
+        )
+
+    Logger.configure(
+        console=logging_config.get("console_logging", True),
+        file_path=log_path,
+        max_bytes=int(logging_config.get("max_file_size_kb", 1024) * 1024),
+        backup_count=logging_config.get("backup_count", 3),
+        flush_interval_seconds=logging_config.get("flush_interval_seconds", 2.0),
+        buffer_max_records=logging_config.get("buffer_max_records", 200),
+    )
+    if log_path:
+        Logger.info(f"[DexBot] Logging to file: {log_path}")
+
+    # Binary session event log for offline analysis (dev-tools session analyzer)
+    if logging_config.get("event_log_enabled", True):
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        event_log_path = os.path.join(
+            config_manager.script_dir, "logs", f"dexbot_events_{timestamp}.dxev"
+        )
+        if get_event_log().open(event_log_path):
+            Logger.info(f"[DexBot] Recording session events to: {event_log_path}")
+
+
+def get_system_schedules(config_manager: ConfigManager) -> Dict[str, Tuple[float, int, float]]:
+    """(period_ms, priority, budget_ms) of every scheduled system from main_config
+
+    Priority order: Healing > GUMP > Combat > Looting > config reload > state snapshot.
+    """
+    loop_delay_ms = config_manager.get_main_setting("global_settings.main_loop_delay_ms", 250)
+
+    def schedule(name: str, period_ms: float, priority: int, budget_ms: float) -> Tuple[float, int, float]:
+        settings = config_manager.get_main_setting(f"system_scheduling.{name}", {})
+        return (
+            settings.get("period_ms", period_ms),
+            settings.get("priority", priority),
+            settings.get("budget_ms", budget_ms),
+        )
+
+    return {
+        "healing": schedule("healing", loop_delay_ms, 0, 100),
+        "gump": schedule("gump", loop_delay_ms, 1, 50),
+        "combat": schedule("combat", loop_delay_ms, 2, 150),
+        "looting": schedule("looting", loop_delay_ms, 3, 300),
+        "config_reload": (
+            config_manager.get_main_setting("global_settings.config_reload_check_interval_ms", 2000), 4, 20
+        ),
+        "state_snapshot": (
+            config_manager.get_main_setting("runtime_state.snapshot_interval_ms", 30000), 5, 20
+        ),
+    }
+
+
+def build_system_registry(
+    config: BotConfig,
+    config_manager: ConfigManager,
+    combat_system: CombatSystem,
+    looting_system: LootingSystem,
+    profiler: Optional[Profiler] = None,
+    runtime_state: Optional[RuntimeStateStore] = None,
+) -> SystemRegistry:
+    """Register every bot system with its cadence from main_config system_scheduling
+
+    Healing is never deferred. See get_system_schedules for the priority order.
+    """
+    registry = SystemRegistry(profiler=profiler)
+    schedules = get_system_schedules(config_manager)
+
+    def run_healing():
+        process_healing_journal()
+        execute_auto_heal_system()
+
+    registry.register(
+        "healing",
+        run_healing,
+        *schedules["healing"],
+        enabled=lambda: config.HEALING_ENABLED,
+        deferrable=False,
+    )
+    registry.register("gump", update_gump_system, *schedules["gump"])
+    registry.register(
+        "combat",
+        combat_system.run,
+        *schedules["combat"],
+        enabled=lambda: config_manager.get_combat_setting(
+            "system_toggles.combat_system_enabled", False
+        ),
+    )
+    registry.register(
+        "looting",
+        looting_system.update,
+        *schedules["looting"],
+        enabled=looting_system.is_enabled,
+    )
+
+    # Hot-reload config files edited while the bot runs
+    registry.register(
+        "config_reload",
+        config_manager.check_for_changes,
+        *schedules["config_reload"],
+        enabled=lambda: config_manager.get_main_setting(
+            "global_settings.config_hot_reload_enabled", True
+        ),
+    )
+
+    # Periodic runtime state snapshot so a restarted script picks up where it left off
+    if runtime_state:
+        registry.register("state_snapshot", runtime_state.save, *schedules["state_snapshot"])
+
+    return registry
+
+
+def apply_schedule_changes(
+    config_manager: ConfigManager, scheduler: TickScheduler, registry: SystemRegistry
+) -> None:
+    """Apply edited loop timing (main_loop_delay_ms, system_scheduling, intervals) to the running loop
+
+    Logging, profiling and runtime_state.enabled are only read at startup and
+    still need a restart.
+    """
+    scheduler.period_ms = config_manager.get_main_setting(
+        "global_settings.main_loop_delay_ms", scheduler.period_ms
+    )
+    for name, (period_ms, priority, budget_ms) in get_system_schedules(config_manager).items():
+        registry.set_schedule(name, period_ms, priority, budget_ms)
+
+
+def _create_runtime_state(
+    config_manager: ConfigManager,
+    status: SystemStatus,
+    combat_system: CombatSystem,
+    looting_system: LootingSystem,
+) -> Optional[RuntimeStateStore]:
+    """Restore the previous run's state for this character (state/dexbot_state_<serial>.json)"""
+    if not config_manager.get_main_setting("runtime_state.enabled", True):
+        return None
+
+    state_path = os.path.join(
+        config_manager.script_dir, "state", f"dexbot_state_{Player.Serial}.json"
+    )
+    runtime_state = RuntimeStateStore(
+        state_path, config_manager.get_main_setting("runtime_state.max_age_seconds", 900)
+    )
+    runtime_state.register("status", status)
+    runtime_state.register("combat", combat_system)
+    runtime_state.register("looting", looting_system)
+
+    restored = runtime_state.restore()
+    if restored:
+        Logger.info(f"[DexBot] Restored runtime state from previous run: {', '.join(restored)}")
+    return runtime_state
+
+
 def run_dexbot():
     """
     Main bot loop that runs continuously and manages different bot systems.
@@ -23,10 +225,32 @@ def run_dexbot():
     messages = BotMessages()
     status = SystemStatus()
     config_manager = ConfigManager()
+    # Per-character settings (config/profiles/<name>/) before anything reads them
+    profile = config_manager.select_profile_for_character(Player.Name, Player.Serial)
+    _configure_logging(config_manager)
+    Logger.info(f"[DexBot] Config profile: {profile}")
+    event_log = get_event_log()
     
     # Initialize systems
     looting_system = LootingSystem(config_manager)
     combat_system = CombatSystem(config_manager)
+    runtime_state = _create_runtime_state(config_manager, status, combat_system, looting_system)
+
+    # Per-phase timing histograms (see SystemStatus.get_profile_report)
+    status.profiler.enabled = config_manager.get_main_setting(
+        "performance_optimization.profiling.enabled", True
+    )
+
+    # Deadline-driven loop timing: sleep only what is left of the target period
+    scheduler = TickScheduler(config.DEFAULT_SCRIPT_DELAY)
+    registry = build_system_registry(
+        config, config_manager, combat_system, looting_system, status.profiler, runtime_state
+    )
+    # Hot-reloaded or GUMP-edited timing takes effect without a restart
+    def on_main_config_changed(section: str, key_path: Optional[str]) -> None:
+        apply_schedule_changes(config_manager, scheduler, registry)
+
+    config_manager.subscribe("main", on_main_config_changed)
 
     # Display version and build information prominently
     version_info = config.get_version_info()
@@ -109,73 +333,35 @@ def run_dexbot():
                     Journal.Clear()
 
             # Player is connected and alive - run enabled bot systems
-            loop_start_time = time.time()
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]  # Include milliseconds
-            Logger.debug(f"MAIN LOOP: ===== Phase 3.1 Optimized - System Updates [{timestamp}] =====")
+            scheduler.begin_tick()
+            if Logger.debug_enabled:
+                Logger.debug("MAIN LOOP: ===== Phase 3.1 Optimized - System Updates [%s] =====", Logger.timestamp())
 
             # Check for shutdown requests (e.g., from GUMP close button)
             if status.is_shutdown_requested():
                 Logger.info("[DexBot] Shutdown requested - stopping script")
                 break
 
-            # Update GUMP system (handle interactions and periodic updates)
-            gump_start_time = time.time()
-            update_gump_system()
-            gump_duration = (time.time() - gump_start_time) * 1000  # Convert to milliseconds
-            Logger.debug(f"MAIN LOOP: GUMP update completed in {gump_duration:.1f}ms")
-
-            # PHASE 3.1 OPTIMIZATION: Run systems in priority order with minimal overhead
-            # Priority: Healing > Combat > Looting
-            
-            # 1. Auto Heal system (highest priority - survival)
-            if config.HEALING_ENABLED:
-                heal_start_time = time.time()
-                Logger.debug(f"MAIN LOOP: Processing healing system...")
-                process_healing_journal()
-                execute_auto_heal_system()
-                heal_duration = (time.time() - heal_start_time) * 1000
-                if heal_duration > 200:  # Only log if significant time spent
-                    Logger.info(f"MAIN LOOP: Healing system completed in {heal_duration:.1f}ms")
-
-            # 2. Combat system (medium priority - engagement)
-            combat_start_time = time.time()
-            Logger.debug(f"MAIN LOOP: Processing combat system...")
-            try:
-                combat_system.run()
-                combat_duration = (time.time() - combat_start_time) * 1000
-                if combat_duration > 200:  # Only log if significant time spent
-                    Logger.info(f"MAIN LOOP: Combat system completed in {combat_duration:.1f}ms")
-            except Exception as e:
-                combat_duration = (time.time() - combat_start_time) * 1000
-                Logger.error(f"MAIN LOOP: Error in combat system after {combat_duration:.1f}ms: {e}")
-
-            # 3. Looting system (lowest priority - cleanup)
-            loot_start_time = time.time()
-            Logger.debug(f"MAIN LOOP: Processing looting system...")
-            try:
-                looting_system.update()
-                loot_duration = (time.time() - loot_start_time) * 1000
-                if loot_duration > 200:  # Only log if significant time spent
-                    Logger.info(f"MAIN LOOP: Looting system completed in {loot_duration:.1f}ms")
-            except Exception as e:
-                loot_duration = (time.time() - loot_start_time) * 1000
-                Logger.error(f"MAIN LOOP: Error in looting system after {loot_duration:.1f}ms: {e}")
+            # Dispatch the systems that are due this tick, in priority order
+            systems_run = registry.run_due(scheduler.get_deadline())
+            Logger.debug("MAIN LOOP: Systems run this tick: %s", systems_run)
 
             # Calculate total loop time
-            loop_duration = (time.time() - loop_start_time) * 1000
-            end_timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+            loop_duration = scheduler.get_elapsed_ms()
+            status.profiler.record("loop.tick", loop_duration)
+            event_log.record(EventType.LOOP_TICK, value=loop_duration * 1000)
             
             # Optimized logging: only show detailed timing for slow loops
             if loop_duration > 1000:  # More than 1 second
-                Logger.warning(f"PERFORMANCE: Main loop took {loop_duration:.1f}ms - potential issue! [{end_timestamp}]")
+                Logger.warning(f"PERFORMANCE: Main loop took {loop_duration:.1f}ms - potential issue! [{Logger.timestamp()}]")
             elif loop_duration > 500:  # More than 500ms  
-                Logger.info(f"MAIN LOOP: All systems completed in {loop_duration:.1f}ms [{end_timestamp}]")
-            else:
-                Logger.debug(f"MAIN LOOP: All systems completed in {loop_duration:.1f}ms [{end_timestamp}]")
+                Logger.info(f"MAIN LOOP: All systems completed in {loop_duration:.1f}ms [{Logger.timestamp()}]")
+            elif Logger.debug_enabled:
+                Logger.debug("MAIN LOOP: All systems completed in %.1fms [%s]", loop_duration, Logger.timestamp())
             
-            # Increment runtime counter and main loop delay
+            # Increment runtime counter and sleep for the rest of the tick period
             status.increment_runtime()
-            Misc.Pause(config.DEFAULT_SCRIPT_DELAY)
+            scheduler.end_tick()
 
         except KeyboardInterrupt:
             # Allow manual stopping with Ctrl+C or ESC
@@ -183,10 +369,7 @@ def run_dexbot():
 
             Gumps.CloseGump(config.GUMP_ID)  # Close GUMP on exit
             Logger.info(messages.STOPPED)
-            report = status.get_status_report()
-            Logger.info(
-                f"Final stats - Bandages used: {report['bandages_used']}, Heal potions used: {report['heal_potions_used']}"
-            )
+            _finish_session(status, scheduler, config_manager, runtime_state, on_main_config_changed)
             return
         except Exception as e:
             error_msg = messages.MAIN_LOOP_ERROR.format(str(e))
@@ -198,10 +381,7 @@ def run_dexbot():
         from ..utils.imports import Gumps
         Gumps.CloseGump(config.GUMP_ID)  # Close GUMP on shutdown
         Logger.info(messages.STOPPED)
-        report = status.get_status_report()
-        Logger.info(
-            f"Final stats - Bandages used: {report['bandages_used']}, Heal potions used: {report['heal_potions_used']}"
-        )
+        _finish_session(status, scheduler, config_manager, runtime_state, on_main_config_changed)
         return
 
     # If we get here, player disconnected
@@ -212,10 +392,7 @@ def run_dexbot():
     Logger.info(messages.STOPPED)
 
     # Show final status report
-    report = status.get_status_report()
-    Logger.info(
-        f"Final stats - Bandages used: {report['bandages_used']}, Heal potions used: {report['heal_potions_used']}"
-    )
+    _finish_session(status, scheduler, config_manager, runtime_state, on_main_config_changed)
 
 
 
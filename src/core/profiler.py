@@ -0,0 +1,164 @@
+"""
+Phase Profiler for DexBot
+Records bounded duration histograms for hot-path phases so long sessions can be
+analyzed without debug logging
+"""
+
+import json
+import os
+import time
+from typing import Dict, List, Optional, Union
+
+# Histogram bucket layout: upper bounds grow geometrically from 0.05ms to ~60s, which
+# keeps percentile error under ~10% while using a fixed amount of memory per phase
+HISTOGRAM_MIN_MS = 0.05
+HISTOGRAM_GROWTH = 1.2
+HISTOGRAM_BUCKETS = 80
+
+
+def _build_bucket_bounds() -> List[float]:
+    """Build the shared list of bucket upper bounds in milliseconds"""
+    bounds = []
+    bound = HISTOGRAM_MIN_MS
+    for _ in range(HISTOGRAM_BUCKETS):
+        bounds.append(bound)
+        bound *= HISTOGRAM_GROWTH
+    return bounds
+
+
+BUCKET_BOUNDS_MS = _build_bucket_bounds()
+
+
+class PhaseHistogram:
+    """Fixed-size log-bucket histogram of phase durations"""
+
+    def __init__(self) -> None:
+        # One extra bucket catches everything above the last bound
+        self.buckets = [0] * (HISTOGRAM_BUCKETS + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, duration_ms: float) -> None:
+        """Add one duration sample"""
+        # Binary search for the first bound >= duration
+        low, high = 0, HISTOGRAM_BUCKETS
+        while low < high:
+            mid = (low + high) // 2
+            if BUCKET_BOUNDS_MS[mid] < duration_ms:
+                low = mid + 1
+            else:
+                high = mid
+        self.buckets[low] += 1
+
+        self.count += 1
+        self.total_ms += duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+
+    def percentile(self, percent: float) -> float:
+        """Get the estimated duration below which the given percent of samples fall
+
+        Args:
+            percent: Percentile to estimate (0-100)
+
+        Returns:
+            Upper bound of the bucket holding that sample, capped at the observed max
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = max(1, int(round(self.count * percent / 100.0)))
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                if index >= HISTOGRAM_BUCKETS:
+                    return self.max_ms
+                return min(BUCKET_BOUNDS_MS[index], self.max_ms)
+        return self.max_ms
+
+    def get_summary(self) -> Dict[str, Union[int, float]]:
+        """Get count, mean and p50/p95/p99/max in milliseconds"""
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "p99_ms": round(self.percentile(99), 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class Profiler:
+    """Per-phase duration profiler
+
+    Phases are free-form dotted names (e.g. "combat.detect", "loot.move"). Recording
+    is a dictionary lookup plus a short binary search, so it stays enabled in
+    normal sessions.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.started_at = time.time()
+        self._phases: Dict[str, PhaseHistogram] = {}
+
+    def record(self, phase: str, duration_ms: float) -> None:
+        """Record one duration sample for a phase"""
+        if not self.enabled:
+            return
+        histogram = self._phases.get(phase)
+        if histogram is None:
+            histogram = PhaseHistogram()
+            self._phases[phase] = histogram
+        histogram.record(duration_ms)
+
+    def record_since(self, phase: str, start_time: float) -> float:
+        """Record the time elapsed since start_time (from time.time())
+
+        Returns:
+            The recorded duration in milliseconds
+        """
+        duration_ms = (time.time() - start_time) * 1000
+        self.record(phase, duration_ms)
+        return duration_ms
+
+    def get_phase(self, phase: str) -> Optional[PhaseHistogram]:
+        """Get the histogram for a phase, if any samples were recorded"""
+        return self._phases.get(phase)
+
+    def get_summary(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """Get the summary of every recorded phase, sorted by phase name"""
+        return {phase: self._phases[phase].get_summary() for phase in sorted(self._phases)}
+
+    def reset(self) -> None:
+        """Discard all recorded samples"""
+        self._phases.clear()
+        self.started_at = time.time()
+
+    def dump_json(self, file_path: str) -> bool:
+        """Write the phase summary to a JSON file
+
+        Args:
+            file_path: Destination file; parent directories are created if needed
+
+        Returns:
+            True if the file was written
+        """
+        report = {
+            "started_at": self.started_at,
+            "dumped_at": time.time(),
+            "session_seconds": round(time.time() - self.started_at, 1),
+            "phases": self.get_summary(),
+        }
+        try:
+            directory = os.path.dirname(file_path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            with open(file_path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+            return True
+        except Exception as e:
+            print(f"[ERROR] Failed to write profile to {file_path}: {e}")
+            return False
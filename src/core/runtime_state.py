@@ -0,0 +1,109 @@
+"""
+Runtime State Snapshots for DexBot
+Keeps in-memory system state (processed corpses, caches, counters) across script restarts
+"""
+
+import json
+import os
+import time
+from typing import Any, Dict, List
+
+from ..core.logger import Logger
+
+# Snapshot file layout version; files with another version are ignored
+RUNTIME_STATE_VERSION = 2
+RUNTIME_STATE_MAX_AGE_SECONDS = 900
+
+
+class RuntimeStateStore:
+    """Periodic, atomic snapshot of system state in one compact JSON file
+
+    Systems are registered by name and provide get_state() -> dict (JSON-able)
+    and restore_state(state, age_seconds). save() collects every state into the
+    file (written to a temp file and swapped in, so a crash never leaves half a
+    snapshot). restore() hands each system its part together with the snapshot's
+    age so entries with their own expiry (corpse serials, the current target)
+    can be dropped; snapshots older than max_age_seconds are ignored entirely.
+    """
+
+    def __init__(self, file_path: str, max_age_seconds: float = RUNTIME_STATE_MAX_AGE_SECONDS) -> None:
+        self.file_path = file_path
+        self.max_age_seconds = max_age_seconds
+        self._providers: Dict[str, Any] = {}
+        self.saves = 0
+        self.save_errors = 0
+        self.last_save_time = 0.0
+
+    def register(self, name: str, provider: Any) -> None:
+        """Include a system's get_state()/restore_state() in the snapshot"""
+        self._providers[name] = provider
+
+    def save(self) -> bool:
+        """Write the state of every registered system; returns True on success"""
+        systems: Dict[str, Any] = {}
+        for name, provider in self._providers.items():
+            try:
+                systems[name] = provider.get_state()
+            except Exception as e:
+                Logger.warning(f"[RuntimeState] Could not capture {name} state: {e}")
+
+        saved_at = time.time()
+        snapshot = {"version": RUNTIME_STATE_VERSION, "saved_at": saved_at, "systems": systems}
+        temp_path = self.file_path + ".tmp"
+        try:
+            directory = os.path.dirname(self.file_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(json.dumps(snapshot, separators=(",", ":")))
+            os.replace(temp_path, self.file_path)
+        except Exception as e:
+            self.save_errors += 1
+            Logger.warning(f"[RuntimeState] Could not save {self.file_path}: {e}")
+            return False
+
+        self.saves += 1
+        self.last_save_time = saved_at
+        return True
+
+    def restore(self) -> List[str]:
+        """Restore every registered system from the snapshot file
+
+        Returns:
+            Names of the systems that were restored (empty if there is no usable snapshot)
+        """
+        if not os.path.exists(self.file_path):
+            return []
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            saved_at = float(snapshot["saved_at"])
+            systems = snapshot["systems"]
+        except Exception as e:
+            Logger.warning(f"[RuntimeState] Ignoring unreadable snapshot {self.file_path}: {e}")
+            return []
+
+        age_seconds = time.time() - saved_at
+        if snapshot.get("version") != RUNTIME_STATE_VERSION or not 0 <= age_seconds <= self.max_age_seconds:
+            Logger.debug("[RuntimeState] Ignoring snapshot (version %s, %.0fs old)", snapshot.get("version"), age_seconds)
+            return []
+
+        restored = []
+        for name, provider in self._providers.items():
+            state = systems.get(name)
+            if not isinstance(state, dict):
+                continue
+            try:
+                provider.restore_state(state, age_seconds)
+                restored.append(name)
+            except Exception as e:
+                Logger.warning(f"[RuntimeState] Could not restore {name} state: {e}")
+        return restored
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Snapshot counters"""
+        return {
+            "saves": self.saves,
+            "save_errors": self.save_errors,
+            "last_save_time": self.last_save_time,
+        }
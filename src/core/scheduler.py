@@ -0,0 +1,332 @@
+"""
+Tick Scheduling for DexBot
+Runs the main loop against a target period, tracks overruns and jitter, and
+dispatches each bot system at its own cadence
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from ..core.logger import Logger
+from ..core.profiler import Profiler
+from ..utils.imports import Misc
+
+# Smallest pause issued at the end of a tick so the script thread always yields
+MIN_TICK_PAUSE_MS = 10
+
+# A deferrable system is forced to run after being pushed back this many ticks in a row
+MAX_CONSECUTIVE_DEFERRALS = 4
+
+# Systems due within this window are run now, so a period equal to the tick period
+# is not skipped every other tick because of sub-millisecond timing differences
+DUE_TOLERANCE_MS = 15
+
+
+class TickScheduler:
+    """Deadline-driven scheduler for the main bot loop
+
+    Every tick is measured against a target period and only the time left in that
+    period is slept. A slow pass therefore shortens the following pause instead of
+    adding a full fixed delay on top of itself, which keeps heal reaction time
+    bounded. Overruns and tick start jitter are tracked for status reporting.
+    """
+
+    def __init__(
+        self,
+        period_ms: float,
+        clock: Optional[Callable[[], float]] = None,
+        sleep: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        """Create a scheduler
+
+        Args:
+            period_ms: Target duration of one tick in milliseconds
+            clock: Time source returning seconds (defaults to time.time)
+            sleep: Pause function taking milliseconds (defaults to Misc.Pause)
+        """
+        self.period_ms = period_ms
+        self._clock = clock or time.time
+        self._sleep = sleep or Misc.Pause
+
+        self.tick_start = 0.0
+        self.last_tick_start: Optional[float] = None
+        self.last_tick_duration_ms = 0.0
+        self.last_tick_overran = False
+
+        # Statistics
+        self.tick_count = 0
+        self.overrun_count = 0
+        self.max_overrun_ms = 0.0
+        self.jitter_samples = 0
+        self.total_jitter_ms = 0.0
+        self.max_jitter_ms = 0.0
+
+    def begin_tick(self) -> float:
+        """Mark the start of a tick and record start jitter
+
+        Returns:
+            The tick start time in seconds
+        """
+        now = self._clock()
+
+        # Jitter is only meaningful when the previous tick finished inside its period,
+        # otherwise the late start is already accounted for as an overrun
+        if self.last_tick_start is not None and not self.last_tick_overran:
+            interval_ms = (now - self.last_tick_start) * 1000
+            jitter_ms = abs(interval_ms - self.period_ms)
+            self.jitter_samples += 1
+            self.total_jitter_ms += jitter_ms
+            if jitter_ms > self.max_jitter_ms:
+                self.max_jitter_ms = jitter_ms
+
+        self.tick_start = now
+        self.last_tick_start = now
+        return now
+
+    def get_deadline(self) -> float:
+        """Get the time (in seconds) at which the current tick should end"""
+        return self.tick_start + self.period_ms / 1000.0
+
+    def get_elapsed_ms(self) -> float:
+        """Get the time spent in the current tick so far in milliseconds"""
+        return (self._clock() - self.tick_start) * 1000
+
+    def end_tick(self) -> float:
+        """Finish the current tick and sleep for whatever is left of the period
+
+        Returns:
+            Duration of the tick's work in milliseconds (excluding the pause)
+        """
+        duration_ms = self.get_elapsed_ms()
+        remaining_ms = self.period_ms - duration_ms
+
+        self.tick_count += 1
+        self.last_tick_duration_ms = duration_ms
+        self.last_tick_overran = remaining_ms <= 0
+
+        if self.last_tick_overran:
+            overrun_ms = -remaining_ms
+            self.overrun_count += 1
+            if overrun_ms > self.max_overrun_ms:
+                self.max_overrun_ms = overrun_ms
+
+        self._sleep(max(remaining_ms, MIN_TICK_PAUSE_MS))
+        return duration_ms
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """Get scheduler statistics for status reporting"""
+        return {
+            "period_ms": self.period_ms,
+            "ticks": self.tick_count,
+            "overruns": self.overrun_count,
+            "overrun_percent": (
+                (self.overrun_count / self.tick_count) * 100 if self.tick_count else 0.0
+            ),
+            "max_overrun_ms": self.max_overrun_ms,
+            "avg_jitter_ms": (
+                self.total_jitter_ms / self.jitter_samples if self.jitter_samples else 0.0
+            ),
+            "max_jitter_ms": self.max_jitter_ms,
+        }
+
+
+class ScheduledSystem:
+    """A bot system registered with the SystemRegistry"""
+
+    def __init__(
+        self,
+        name: str,
+        callback: Callable[[], Any],
+        period_ms: float,
+        priority: int,
+        budget_ms: float,
+        enabled: Optional[Callable[[], bool]] = None,
+        deferrable: bool = True,
+    ) -> None:
+        self.name = name
+        self.callback = callback
+        self.period_ms = period_ms
+        self.priority = priority
+        self.budget_ms = budget_ms
+        self.enabled = enabled
+        self.deferrable = deferrable
+
+        self.next_run = 0.0  # Due immediately on the first tick
+        self.consecutive_deferrals = 0
+
+        # Statistics
+        self.run_count = 0
+        self.deferral_count = 0
+        self.budget_overruns = 0
+        self.error_count = 0
+        self.last_duration_ms = 0.0
+        self.max_duration_ms = 0.0
+
+
+class SystemRegistry:
+    """Central cadence registry for bot systems
+
+    Each system declares how often it needs to run, its priority and a per-run
+    time budget. On every tick the main loop calls run_due(), which dispatches
+    only the systems whose period has elapsed, in priority order (lowest number
+    first). Once the tick deadline has passed, the remaining deferrable systems
+    wait for the next tick so survival-critical work keeps its cadence.
+    """
+
+    def __init__(
+        self,
+        clock: Optional[Callable[[], float]] = None,
+        profiler: Optional[Profiler] = None,
+    ) -> None:
+        """Create an empty registry
+
+        Args:
+            clock: Time source returning seconds (defaults to time.time)
+            profiler: Optional profiler receiving a "system.<name>" sample per run
+        """
+        self._clock = clock or time.time
+        self._profiler = profiler
+        self._systems: List[ScheduledSystem] = []
+
+    def register(
+        self,
+        name: str,
+        callback: Callable[[], Any],
+        period_ms: float,
+        priority: int = 10,
+        budget_ms: float = 100,
+        enabled: Optional[Callable[[], bool]] = None,
+        deferrable: bool = True,
+    ) -> ScheduledSystem:
+        """Register a system to be dispatched by run_due()
+
+        Args:
+            name: Unique system name used in logs and statistics
+            callback: Function that runs one pass of the system
+            period_ms: Minimum time between two runs in milliseconds
+            priority: Dispatch order within a tick (lower runs first)
+            budget_ms: Expected maximum run time; longer runs are reported
+            enabled: Optional cheap check evaluated only when the system is due
+            deferrable: Whether the system may be pushed back when a tick overruns
+
+        Returns:
+            The registered ScheduledSystem entry
+        """
+        if self.get_system(name) is not None:
+            raise ValueError(f"System '{name}' is already registered")
+
+        system = ScheduledSystem(
+            name, callback, period_ms, priority, budget_ms, enabled, deferrable
+        )
+        self._systems.append(system)
+        self._systems.sort(key=lambda s: s.priority)
+        return system
+
+    def get_system(self, name: str) -> Optional[ScheduledSystem]:
+        """Get a registered system by name"""
+        for system in self._systems:
+            if system.name == name:
+                return system
+        return None
+
+    def set_schedule(self, name: str, period_ms: float, priority: int, budget_ms: float) -> bool:
+        """Change the cadence, priority and budget of a registered system
+
+        The next run moves with the period (last run + new period), so
+        shortening a long period takes effect right away.
+
+        Returns:
+            False if no system with that name is registered
+        """
+        system = self.get_system(name)
+        if system is None:
+            return False
+        system.next_run += (period_ms - system.period_ms) / 1000.0
+        system.period_ms = period_ms
+        system.budget_ms = budget_ms
+        if system.priority != priority:
+            system.priority = priority
+            self._systems.sort(key=lambda s: s.priority)
+        return True
+
+    def run_due(self, deadline: Optional[float] = None) -> List[str]:
+        """Run every system whose period has elapsed
+
+        Args:
+            deadline: Time (in seconds) at which the current tick should end.
+                Deferrable systems that become due after it has passed are
+                pushed to the next tick.
+
+        Returns:
+            Names of the systems that ran, in dispatch order
+        """
+        ran = []
+        dispatch_time = self._clock()
+        due_time = dispatch_time + DUE_TOLERANCE_MS / 1000.0
+
+        for system in self._systems:
+            if due_time < system.next_run:
+                continue
+
+            if (
+                deadline is not None
+                and system.deferrable
+                and system.consecutive_deferrals < MAX_CONSECUTIVE_DEFERRALS
+                and self._clock() >= deadline
+            ):
+                system.consecutive_deferrals += 1
+                system.deferral_count += 1
+                continue
+
+            system.consecutive_deferrals = 0
+            system.next_run = dispatch_time + system.period_ms / 1000.0
+
+            if system.enabled is not None and not system.enabled():
+                continue
+
+            self._run_system(system)
+            ran.append(system.name)
+
+        return ran
+
+    def _run_system(self, system: ScheduledSystem) -> None:
+        """Run one system pass with error isolation and budget tracking"""
+        start_time = self._clock()
+        try:
+            system.callback()
+        except Exception as e:
+            system.error_count += 1
+            duration_ms = (self._clock() - start_time) * 1000
+            Logger.error(f"MAIN LOOP: Error in {system.name} system after {duration_ms:.1f}ms: {e}")
+
+        duration_ms = (self._clock() - start_time) * 1000
+        system.run_count += 1
+        system.last_duration_ms = duration_ms
+        if duration_ms > system.max_duration_ms:
+            system.max_duration_ms = duration_ms
+        if self._profiler is not None:
+            self._profiler.record(f"system.{system.name}", duration_ms)
+
+        if duration_ms > system.budget_ms:
+            system.budget_overruns += 1
+            Logger.info(
+                f"MAIN LOOP: {system.name} system took {duration_ms:.1f}ms "
+                f"(budget {system.budget_ms}ms)"
+            )
+
+    def get_stats(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """Get per-system dispatch statistics"""
+        return {
+            system.name: {
+                "period_ms": system.period_ms,
+                "priority": system.priority,
+                "budget_ms": system.budget_ms,
+                "runs": system.run_count,
+                "deferrals": system.deferral_count,
+                "budget_overruns": system.budget_overruns,
+                "errors": system.error_count,
+                "last_duration_ms": system.last_duration_ms,
+                "max_duration_ms": system.max_duration_ms,
+            }
+            for system in self._systems
+        }
@@ -4,6 +4,7 @@ Handles automatic healing using bandages and potions based on Dexxor.py
 """
 
 from ..core.bot_config import BotConfig, BotMessages
+from ..core.event_log import EventType, get_event_log
 from ..core.logger import Logger, SystemStatus
 from ..utils.helpers import check_bandage_supply, has_healing_resources
 from ..utils.imports import Items, Journal, Misc, Player, Target, Timer
@@ -26,11 +27,13 @@ def process_healing_journal():
         if Journal.SearchByType(config.HEALING_SUCCESS_MSG, config.JOURNAL_MESSAGE_TYPE):
             Timer.Create(config.HEALING_TIMER, config.HEALING_CHECK_INTERVAL)
             Logger.info(messages.BANDAGE_APPLIED)
+            get_event_log().record(EventType.BANDAGE_APPLIED, value=Player.Hits)
             status.increment_bandage_count()
             status.healing_active = False  # Reset healing status when bandaging completes
         elif Journal.SearchByType(config.HEALING_PARTIAL_MSG, config.JOURNAL_MESSAGE_TYPE):
             Timer.Create(config.HEALING_TIMER, config.HEALING_CHECK_INTERVAL)
             Logger.info(messages.BANDAGE_APPLIED)
+            get_event_log().record(EventType.BANDAGE_APPLIED, value=Player.Hits)
             status.increment_bandage_count()
             status.healing_active = False  # Reset healing status when bandaging completes
 
@@ -48,6 +51,7 @@ def execute_auto_heal_system():
     config = BotConfig()
     messages = BotMessages()
     status = SystemStatus()
+    event_log = get_event_log()
 
     # Check if Auto Heal is enabled
     if not config.HEALING_ENABLED:
@@ -83,6 +87,11 @@ def execute_auto_heal_system():
     )
 
     if needs_healing:
+        # Record only the moment healing first became necessary (for heal latency analysis)
+        if not status.heal_need_recorded:
+            event_log.record(EventType.HEAL_NEEDED, value=Player.Hits, aux=Player.HitsMax)
+            status.heal_need_recorded = True
+
         Logger.debug(
             f"Auto Heal needed - Health: {Player.Hits}/{Player.HitsMax} ({health_percentage:.1f}%)"
         )
@@ -105,7 +114,7 @@ def execute_auto_heal_system():
                     disabled_methods.append("bandages")
                 if has_heal_potions and not config.POTION_HEALING_ENABLED:
                     disabled_methods.append("potions")
-                Logger.debug(f"Healing needed but disabled methods: {', '.join(disabled_methods)}")
+                Logger.debug("Healing needed but disabled methods: %s", ', '.join(disabled_methods))
             return False
 
         # Prioritize heal potions for faster healing when health is very low
@@ -115,9 +124,11 @@ def execute_auto_heal_system():
         if health_percentage <= config.CRITICAL_HEALTH_THRESHOLD and can_use_potions:
             # Use heal potion for critical health
             try:
-                Logger.debug(f"Using heal potion - Health: {health_percentage:.1f}% <= {config.CRITICAL_HEALTH_THRESHOLD}%")
+                Logger.debug("Using heal potion - Health: %.1f%% <= %s%%", health_percentage, config.CRITICAL_HEALTH_THRESHOLD)
                 Items.UseItemByID(config.HEAL_POTION_ID, -1)
                 Logger.info(messages.HEAL_POTION_USED)
+                event_log.record(EventType.POTION_USED, item_id=config.HEAL_POTION_ID, value=Player.Hits)
+                status.heal_need_recorded = False
                 status.increment_heal_potion_count()
                 status.healing_active = True
                 # Short cooldown for potion use
@@ -141,13 +152,15 @@ def execute_auto_heal_system():
                     Timer.Create(config.HEALING_TIMER, config.HEALING_TIMER_DURATION)
 
                     Logger.info(messages.BANDAGE_APPLYING)
+                    event_log.record(EventType.BANDAGE_STARTED, item_id=config.BANDAGE_ID, value=Player.Hits)
+                    status.heal_need_recorded = False
                     status.healing_active = True
                     return True
 
                 except Exception as e:
                     Logger.error(messages.BANDAGE_ERROR.format(str(e)))
                     if attempt < config.BANDAGE_RETRY_ATTEMPTS - 1:
-                        Logger.debug(f"Retrying bandage application (attempt {attempt + 2})")
+                        Logger.debug("Retrying bandage application (attempt %s)", attempt + 2)
                         Misc.Pause(config.BANDAGE_RETRY_DELAY)
                     else:
                         status.healing_active = False
@@ -158,4 +171,5 @@ def execute_auto_heal_system():
             return False
 
     status.healing_active = False
+    status.heal_need_recorded = False
     return False
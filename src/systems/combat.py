@@ -5,10 +5,11 @@ Automates engaging and defeating enemies with smart target selection and combat
 
 import math
 import time
-from datetime import datetime
 from typing import List, Optional, Dict
 
 from ..config.config_manager import ConfigManager
+from ..config.config_schema import TargetPriority
+from ..core.event_log import EventType, get_event_log
 from ..core.logger import Logger, SystemStatus
 from ..utils.imports import Items, Misc, Mobiles, Player, Target, Timer
 
@@ -28,6 +29,36 @@ class CombatSystem:
         self.mobile_cache = {}  # Cache mobile data with timestamps
         self.cache_duration = 500  # 500ms cache duration
         self.health_bar_opened = {}  # Track which mobiles we've opened health bars for
+        
+        # Phase timing histograms (combat.detect / combat.select / combat.engage / combat.monitor)
+        self.profiler = SystemStatus().profiler
+        self.event_log = get_event_log()
+
+        self.config_manager.subscribe("combat", self._on_config_changed)
+
+    def _on_config_changed(self, section: str, key_path: Optional[str]) -> None:
+        """ConfigManager subscriber: rescan on the next run when targeting settings change"""
+        if key_path is None or key_path.startswith(("target_selection", "system_toggles")):
+            self.last_target_scan = 0
+
+    def get_state(self) -> Dict:
+        """State kept across script restarts (see RuntimeStateStore)"""
+        return {
+            'current_target': self.current_target,
+            'combat_start_time': self.combat_start_time,
+        }
+
+    def restore_state(self, state: Dict, age_seconds: float) -> None:
+        """Resume the previous run's fight unless it would have timed out since"""
+        target = state.get('current_target')
+        start_time = state.get('combat_start_time')
+        if not target or not start_time:
+            return
+        timeout = self.config_manager.combat_settings.combat_behavior.combat_timeout_ms
+        if time.time() * 1000 - start_time <= timeout:
+            self.current_target = target
+            self.combat_start_time = start_time
+            Logger.debug("Resuming combat with %s (%s)", target.get('name', 'Unknown'), target.get('serial'))
 
     def _get_distance(self, serial: int) -> float:
         """Calculate distance to a mobile."""
@@ -47,19 +78,19 @@ class CombatSystem:
                 self._cache_mobile_data(serial, {'distance': distance})
                 return distance
         except AttributeError as e:
-            Logger.debug(f"Position data unavailable for mobile {serial}: {e}")
+            Logger.debug("Position data unavailable for mobile %s: %s", serial, e)
         except Exception as e:
-            Logger.debug(f"Error calculating distance to {serial}: {e}")
+            Logger.debug("Error calculating distance to %s: %s", serial, e)
         return float('inf')
 
     def _is_valid_target(self, mobile) -> bool:
         """Check if a mobile is a valid combat target."""
         try:
             # Get combat settings
-            ignore_innocents = self.config_manager.get_combat_setting('target_selection.ignore_innocents')
-            ignore_pets = self.config_manager.get_combat_setting('target_selection.ignore_pets')
-            allow_target_blues = self.config_manager.get_combat_setting('target_selection.allow_target_blues')
-            max_range = self.config_manager.get_combat_setting('target_selection.max_range')
+            target_selection = self.config_manager.combat_settings.target_selection
+            ignore_pets = target_selection.ignore_pets
+            allow_target_blues = target_selection.allow_target_blues
+            max_range = target_selection.max_range
             
             # Basic checks
             if not mobile or mobile.Serial == Player.Serial:
@@ -88,29 +119,29 @@ class CombatSystem:
             # Handle blue (innocent) targets based on configuration
             if mobile.Notoriety == 1:  # Blue (innocent)
                 if not allow_target_blues:
-                    Logger.debug(f"Skipping blue mobile {mobile.Serial} - allow_target_blues is disabled")
+                    Logger.debug("Skipping blue mobile %s - allow_target_blues is disabled", mobile.Serial)
                     return False
                 else:
-                    Logger.debug(f"Allowing blue mobile {mobile.Serial} - allow_target_blues is enabled")
+                    Logger.debug("Allowing blue mobile %s - allow_target_blues is enabled", mobile.Serial)
             
             # Always skip friends (green) - these are typically player allies
             if mobile.Notoriety == 2:  # Green (friend)
-                Logger.debug(f"Skipping friend mobile {mobile.Serial} with notoriety {mobile.Notoriety}")
+                Logger.debug("Skipping friend mobile %s with notoriety %s", mobile.Serial, mobile.Notoriety)
                 return False
             
             # Skip yellow (5) - these are often neutral NPCs that shouldn't be targeted
             if mobile.Notoriety == 5:  # Yellow (orange/aggressive but often neutral)
-                Logger.debug(f"Skipping yellow mobile {mobile.Serial} with notoriety {mobile.Notoriety} (neutral NPC)")
+                Logger.debug("Skipping yellow mobile %s with notoriety %s (neutral NPC)", mobile.Serial, mobile.Notoriety)
                 return False
                 
             # Skip invulnerable (7) - can't be attacked anyway
             if mobile.Notoriety == 7:  # Invulnerable
-                Logger.debug(f"Skipping invulnerable mobile {mobile.Serial} with notoriety {mobile.Notoriety}")
+                Logger.debug("Skipping invulnerable mobile %s with notoriety %s", mobile.Serial, mobile.Notoriety)
                 return False
             
             # Allow gray (3), criminal (4), and red (6) - these are always valid targets
             if mobile.Notoriety in [3, 4, 6]:
-                Logger.debug(f"Valid target mobile {mobile.Serial} with notoriety {mobile.Notoriety}")
+                Logger.debug("Valid target mobile %s with notoriety %s", mobile.Serial, mobile.Notoriety)
             
             # Basic pet check - pets usually have certain naming patterns or are controlled
             if ignore_pets:
@@ -122,7 +153,7 @@ class CombatSystem:
             return True
             
         except Exception as e:
-            Logger.debug(f"Error validating target {mobile.Serial}: {e}")
+            Logger.debug("Error validating target %s: %s", mobile.Serial, e)
             return False
 
     def detect_targets(self) -> List[Dict]:
@@ -136,13 +167,13 @@ class CombatSystem:
             
             # Skip interval check if this is the first scan (last_target_scan == 0)
             if self.last_target_scan > 0 and current_time - self.last_target_scan < scan_interval:
-                Logger.debug(f"Target scan on cooldown - {scan_interval - (current_time - self.last_target_scan):.0f}ms remaining")
+                Logger.debug("Target scan on cooldown - %.0fms remaining", scan_interval - (current_time - self.last_target_scan))
                 return targets
             
             self.last_target_scan = current_time
             
-            max_range = self.config_manager.get_combat_setting('target_selection.max_range')
-            Logger.debug(f"Scanning for targets within {max_range} tiles...")
+            max_range = self.config_manager.combat_settings.target_selection.max_range
+            Logger.debug("Scanning for targets within %s tiles...", max_range)
             
             # Get all mobiles using Filter (RazorEnhanced API)
             mobile_filter = Mobiles.Filter()
@@ -176,7 +207,7 @@ class CombatSystem:
                     targets.append(target_info)
             
             if targets:
-                Logger.debug(f"Found {len(targets)} valid targets")
+                Logger.debug("Found %s valid targets", len(targets))
             
         except Exception as e:
             Logger.error(f"Error detecting targets: {e}")
@@ -189,7 +220,7 @@ class CombatSystem:
             return None
         
         try:
-            priority_mode = self.config_manager.get_combat_setting('target_selection.priority_mode')
+            priority_mode = self.config_manager.combat_settings.target_selection.priority_mode
             
             # ENHANCED TARGET SELECTION: Prioritize currently engaged target
             # If we have a current target and it's still valid, keep fighting it unless there's a much better option
@@ -204,7 +235,7 @@ class CombatSystem:
                 
                 if current_target_updated:
                     # Current target is still valid and in range
-                    Logger.debug(f"Continuing engagement with current target: {current_target_updated['name']}")
+                    Logger.debug("Continuing engagement with current target: %s", current_target_updated['name'])
                     
                     # Only switch if there's a SIGNIFICANTLY better target (much closer)
                     # This prevents target bouncing and improves combat efficiency
@@ -226,22 +257,22 @@ class CombatSystem:
                     Logger.debug("Current target no longer available, selecting new target")
             
             # No current target or current target lost - select best available target
-            if priority_mode == 'closest':
+            if priority_mode == TargetPriority.CLOSEST:
                 # Sort by distance, closest first
                 targets.sort(key=lambda t: t['distance'])
                 selected = targets[0]
-                Logger.debug(f"Selected closest target: {selected['name']} at {selected['distance']:.1f} tiles")
+                Logger.debug("Selected closest target: %s at %.1f tiles", selected['name'], selected['distance'])
                 return selected
             
-            elif priority_mode == 'lowest_health':
+            elif priority_mode == TargetPriority.LOWEST_HEALTH:
                 # Sort by health percentage, lowest first
                 targets.sort(key=lambda t: t['hits'] / max(t['hits_max'], 1))
                 selected = targets[0]
                 health_pct = (selected['hits'] / max(selected['hits_max'], 1)) * 100
-                Logger.debug(f"Selected lowest health target: {selected['name']} at {health_pct:.1f}% health")
+                Logger.debug("Selected lowest health target: %s at %.1f%% health", selected['name'], health_pct)
                 return selected
             
-            elif priority_mode == 'highest_threat':
+            elif priority_mode == TargetPriority.HIGHEST_THREAT:
                 # Sort by combination of closeness and health (closer + more health = higher threat)
                 def threat_score(target):
                     health_ratio = target['hits'] / max(target['hits_max'], 1)
@@ -250,14 +281,14 @@ class CombatSystem:
                 
                 targets.sort(key=threat_score, reverse=True)
                 selected = targets[0]
-                Logger.debug(f"Selected highest threat target: {selected['name']}")
+                Logger.debug("Selected highest threat target: %s", selected['name'])
                 return selected
             
             else:
                 # Default to closest
                 targets.sort(key=lambda t: t['distance'])
                 selected = targets[0]
-                Logger.debug(f"Selected target (default closest): {selected['name']} at {selected['distance']:.1f} tiles")
+                Logger.debug("Selected target (default closest): %s at %.1f tiles", selected['name'], selected['distance'])
                 return selected
                 
         except Exception as e:
@@ -268,7 +299,7 @@ class CombatSystem:
         """Engage the selected target with the currently equipped weapon."""
         try:
             # Check if auto attack is enabled
-            auto_attack_enabled = self.config_manager.get_combat_setting('system_toggles.auto_attack_enabled')
+            auto_attack_enabled = self.config_manager.combat_settings.system_toggles.auto_attack_enabled
             if not auto_attack_enabled:
                 Logger.debug("Auto attack disabled - setting target but not attacking")
                 # Still set the target for manual combat
@@ -276,9 +307,9 @@ class CombatSystem:
                 return True
             
             current_time = time.time() * 1000  # Convert to milliseconds
-            attack_delay = self.config_manager.get_combat_setting('combat_behavior.attack_delay_ms')
+            attack_delay = self.config_manager.combat_settings.combat_behavior.attack_delay_ms
             
-            Logger.debug(f"Engage target - Current time: {current_time:.0f}, Last attack: {self.last_attack_time:.0f}, Attack delay: {attack_delay}ms")
+            Logger.debug("Engage target - Current time: %.0f, Last attack: %.0f, Attack delay: %sms", current_time, self.last_attack_time, attack_delay)
             
             # Be more aggressive - allow immediate attacks in more cases
             should_attack = False
@@ -294,9 +325,9 @@ class CombatSystem:
             elif current_time - self.last_attack_time >= attack_delay:
                 # Normal attack delay has passed
                 should_attack = True
-                Logger.debug(f"Attack delay passed ({current_time - self.last_attack_time:.0f}ms >= {attack_delay}ms)")
+                Logger.debug("Attack delay passed (%.0fms >= %sms)", current_time - self.last_attack_time, attack_delay)
             else:
-                Logger.debug(f"Attack on cooldown - {attack_delay - (current_time - self.last_attack_time):.0f}ms remaining")
+                Logger.debug("Attack on cooldown - %.0fms remaining", attack_delay - (current_time - self.last_attack_time))
             
             if not should_attack:
                 # Still set target even if we're not attacking yet
@@ -351,16 +382,16 @@ class CombatSystem:
             # Check combat timeout
             if self.combat_start_time:
                 current_time = time.time() * 1000  # Convert to milliseconds
-                timeout = self.config_manager.get_combat_setting('combat_behavior.combat_timeout_ms')
+                timeout = self.config_manager.combat_settings.combat_behavior.combat_timeout_ms
                 if current_time - self.combat_start_time > timeout:
                     Logger.warning(f"Combat timeout reached for {target['name']}")
                     self.disengage()
                     return False
             
             # Check if we should retreat due to low health
-            retreat_on_low_health = self.config_manager.get_combat_setting('combat_behavior.retreat_on_low_health')
+            retreat_on_low_health = self.config_manager.combat_settings.combat_behavior.retreat_on_low_health
             if retreat_on_low_health:
-                health_threshold = self.config_manager.get_combat_setting('combat_behavior.retreat_health_threshold')
+                health_threshold = self.config_manager.combat_settings.combat_behavior.retreat_health_threshold
                 health_percentage = (Player.Hits / Player.HitsMax) * 100
                 
                 if health_percentage < health_threshold:
@@ -370,7 +401,7 @@ class CombatSystem:
             
             # Check if target is still in range
             distance = self._get_distance(target['serial'])
-            max_range = self.config_manager.get_combat_setting('target_selection.max_range')
+            max_range = self.config_manager.combat_settings.target_selection.max_range
             if distance > max_range * 1.5:  # Allow some buffer
                 Logger.info(f"Target {target['name']} moved out of range")
                 self.disengage()
@@ -386,7 +417,8 @@ class CombatSystem:
         """Disengage or switch targets as needed."""
         try:
             if self.current_target:
-                Logger.debug(f"Disengaging from {self.current_target.get('name', 'Unknown')}")
+                Logger.debug("Disengaging from %s", self.current_target.get('name', 'Unknown'))
+                self.event_log.record(EventType.TARGET_LOST, serial=self.current_target.get('serial', 0))
             
             self.current_target = None
             self.combat_start_time = None
@@ -400,18 +432,18 @@ class CombatSystem:
     def run(self):
         """Main entry point for the combat system (to be called in main loop)."""
         system_start_time = time.time()
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        timestamp = Logger.timestamp() if Logger.debug_enabled else ""
         
         try:
             # Check if combat system is enabled
-            if not self.config_manager.get_combat_setting('system_toggles.combat_system_enabled'):
-                Logger.debug(f"COMBAT [{timestamp}]: System disabled - skipping combat logic")
+            if not self.config_manager.combat_settings.system_toggles.combat_system_enabled:
+                Logger.debug("COMBAT [%s]: System disabled - skipping combat logic", timestamp)
                 return
             
             # Safety checks
             if Player.IsGhost or not Player.Visible:
                 if self.current_target:
-                    Logger.debug(f"COMBAT [{timestamp}]: Player is ghost or invisible - disengaging from combat")
+                    Logger.debug("COMBAT [%s]: Player is ghost or invisible - disengaging from combat", timestamp)
                     self.disengage()
                 return
             
@@ -419,51 +451,53 @@ class CombatSystem:
             if not Player.WarMode:
                 # If player exits war mode while fighting, disengage current target
                 if self.current_target:
-                    Logger.info(f"COMBAT [{timestamp}]: Player exited war mode - disengaging from combat")
+                    Logger.info(f"COMBAT [{Logger.timestamp()}]: Player exited war mode - disengaging from combat")
                     self.disengage()
                 else:
-                    Logger.debug(f"COMBAT [{timestamp}]: Player not in war mode - combat system inactive")
+                    Logger.debug("COMBAT [%s]: Player not in war mode - combat system inactive", timestamp)
                 return
             
             # Check if we should retreat due to low health first
             health_check_start = time.time()
-            retreat_on_low_health = self.config_manager.get_combat_setting('combat_behavior.retreat_on_low_health')
+            retreat_on_low_health = self.config_manager.combat_settings.combat_behavior.retreat_on_low_health
             if retreat_on_low_health:
-                health_threshold = self.config_manager.get_combat_setting('combat_behavior.retreat_health_threshold')
+                health_threshold = self.config_manager.combat_settings.combat_behavior.retreat_health_threshold
                 health_percentage = (Player.Hits / Player.HitsMax) * 100
                 
-                Logger.debug(f"COMBAT [{timestamp}]: Health check: {health_percentage:.1f}% (retreat threshold: {health_threshold}%)")
+                Logger.debug("COMBAT [%s]: Health check: %.1f%% (retreat threshold: %s%%)", timestamp, health_percentage, health_threshold)
                 
                 if health_percentage < health_threshold:
                     if self.current_target:
-                        Logger.warning(f"COMBAT [{timestamp}]: Health too low ({health_percentage:.1f}%), retreating from combat")
+                        Logger.warning(f"COMBAT [{Logger.timestamp()}]: Health too low ({health_percentage:.1f}%), retreating from combat")
                         self.disengage()
                     return
             health_check_duration = (time.time() - health_check_start) * 1000
             
             # Check Auto Target and Auto Attack settings
             settings_check_start = time.time()
-            auto_target_enabled = self.config_manager.get_combat_setting('system_toggles.auto_target_enabled')
-            auto_attack_enabled = self.config_manager.get_combat_setting('system_toggles.auto_attack_enabled')
+            auto_target_enabled = self.config_manager.combat_settings.system_toggles.auto_target_enabled
+            auto_attack_enabled = self.config_manager.combat_settings.system_toggles.auto_attack_enabled
             settings_check_duration = (time.time() - settings_check_start) * 1000
             
-            Logger.debug(f"COMBAT [{timestamp}]: Settings - Auto Target: {auto_target_enabled}, Auto Attack: {auto_attack_enabled}")
+            Logger.debug("COMBAT [%s]: Settings - Auto Target: %s, Auto Attack: %s", timestamp, auto_target_enabled, auto_attack_enabled)
             
             # If we have a current target, continue monitoring
             if self.current_target:
                 monitor_start = time.time()
-                Logger.debug(f"COMBAT [{timestamp}]: Monitoring current target: {self.current_target.get('name', 'Unknown')} ({self.current_target.get('serial', 'N/A')})")
+                Logger.debug("COMBAT [%s]: Monitoring current target: %s (%s)", timestamp, self.current_target.get('name', 'Unknown'), self.current_target.get('serial', 'N/A'))
                 if not self.monitor_combat(self.current_target):
                     # Target lost, disengage already called in monitor_combat
-                    monitor_duration = (time.time() - monitor_start) * 1000
-                    Logger.debug(f"COMBAT [{timestamp}]: Target monitoring completed in {monitor_duration:.1f}ms (target lost)")
+                    monitor_duration = self.profiler.record_since("combat.monitor", monitor_start)
+                    Logger.debug("COMBAT [%s]: Target monitoring completed in %.1fms (target lost)", timestamp, monitor_duration)
                     return
-                monitor_duration = (time.time() - monitor_start) * 1000
-                Logger.debug(f"COMBAT [{timestamp}]: Target monitoring completed in {monitor_duration:.1f}ms")
+                monitor_duration = self.profiler.record_since("combat.monitor", monitor_start)
+                Logger.debug("COMBAT [%s]: Target monitoring completed in %.1fms", timestamp, monitor_duration)
                 
                 # Only continue attacking if auto attack is enabled
                 if auto_attack_enabled:
+                    engage_start = time.time()
                     self.engage_target(self.current_target)
+                    self.profiler.record_since("combat.engage", engage_start)
                 else:
                     Logger.debug("Auto attack disabled - not attacking current target")
                 return
@@ -471,17 +505,28 @@ class CombatSystem:
             # Only look for new targets if auto targeting is enabled
             if auto_target_enabled:
                 Logger.debug("Scanning for new targets...")
+                detect_start = time.time()
                 targets = self.detect_targets()
+                self.profiler.record_since("combat.detect", detect_start)
+                
+                select_start = time.time()
                 target = self.select_target(targets)
+                self.profiler.record_since("combat.select", select_start)
                 
                 if target:
                     self.current_target = target
+                    self.event_log.record(
+                        EventType.TARGET_ACQUIRED, serial=target['serial'], value=target['distance'] * 10
+                    )
                     Logger.info(f"Auto target selected: {target['name']} (Distance: {target['distance']:.1f})")
-                    Logger.debug(f"Target details - Serial: {target['serial']}, Health: {target.get('hits', 'Unknown')}/{target.get('hits_max', 'Unknown')}, Notoriety: {target.get('notoriety', 'Unknown')}")
+                    Logger.debug("Target details - Serial: %s, Health: %s/%s, Notoriety: %s", target['serial'], target.get('hits', 'Unknown'), target.get('hits_max', 'Unknown'), target.get('notoriety', 'Unknown'))
                     
                     # Only engage if auto attack is also enabled
                     if auto_attack_enabled:
-                        if not self.engage_target(target):
+                        engage_start = time.time()
+                        engaged = self.engage_target(target)
+                        self.profiler.record_since("combat.engage", engage_start)
+                        if not engaged:
                             self.disengage()
                     else:
                         Logger.debug("Auto attack disabled - target selected but not attacking")
@@ -492,14 +537,14 @@ class CombatSystem:
             
             # Log performance timing
             system_duration = (time.time() - system_start_time) * 1000
-            end_timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+            end_timestamp = Logger.timestamp() if Logger.debug_enabled else ""
             
             if system_duration > 500:  # More than 500ms
-                Logger.warning(f"COMBAT [{end_timestamp}]: System took {system_duration:.1f}ms - performance issue!")
+                Logger.warning(f"COMBAT [{Logger.timestamp()}]: System took {system_duration:.1f}ms - performance issue!")
             elif system_duration > 200:  # More than 200ms
-                Logger.debug(f"COMBAT [{end_timestamp}]: System took {system_duration:.1f}ms - monitor performance")
+                Logger.debug("COMBAT [%s]: System took %.1fms - monitor performance", end_timestamp, system_duration)
             else:
-                Logger.debug(f"COMBAT [{end_timestamp}]: System completed in {system_duration:.1f}ms")
+                Logger.debug("COMBAT [%s]: System completed in %.1fms", end_timestamp, system_duration)
             
         except Exception as e:
             system_duration = (time.time() - system_start_time) * 1000
@@ -518,20 +563,20 @@ class CombatSystem:
                 Target.SetLast(mobile_serial)
                 # Give a small pause to let the data populate
                 Misc.Pause(50)  # Slightly longer pause to ensure data updates
-                Logger.debug(f"Opened health bar for {getattr(mobile, 'Name', 'Unknown')} ({mobile_serial})")
+                Logger.debug("Opened health bar for %s (%s)", getattr(mobile, 'Name', 'Unknown'), mobile_serial)
         except Exception as e:
-            Logger.debug(f"Error opening health bar for {mobile_serial}: {e}")
+            Logger.debug("Error opening health bar for %s: %s", mobile_serial, e)
 
     def _display_target_name_overhead(self, target: Dict) -> None:
         """Display the target's name above its head."""
         try:
             # Check if target name display is enabled
-            show_target_name = self.config_manager.get_combat_setting('display_settings.show_target_name_overhead')
+            show_target_name = self.config_manager.combat_settings.display_settings.show_target_name_overhead
             if not show_target_name:
                 return
             
             current_time = time.time() * 1000  # Convert to milliseconds
-            display_interval = self.config_manager.get_combat_setting('display_settings.target_name_display_interval_ms')
+            display_interval = self.config_manager.combat_settings.display_settings.target_name_display_interval_ms
             
             # Check if enough time has passed since last display
             if current_time - self.last_target_name_display < display_interval:
@@ -540,7 +585,7 @@ class CombatSystem:
             self.last_target_name_display = current_time
             
             # Get display color setting
-            display_color = self.config_manager.get_combat_setting('display_settings.target_name_display_color')
+            display_color = self.config_manager.combat_settings.display_settings.target_name_display_color
             
             # Find the mobile to display the name over
             mobile = Mobiles.FindBySerial(target['serial'])
@@ -560,17 +605,17 @@ class CombatSystem:
                 try:
                     # Display message above the target mobile
                     Mobiles.Message(target['serial'], display_color, display_text)
-                    Logger.debug(f"Displayed target name overhead: {display_text}")
+                    Logger.debug("Displayed target name overhead: %s", display_text)
                 except Exception as msg_error:
                     # Fallback to player message if overhead message fails
                     try:
                         Misc.SendMessage(f"Current Target: {display_text}", display_color)
-                        Logger.debug(f"Displayed target name to player: {display_text}")
+                        Logger.debug("Displayed target name to player: %s", display_text)
                     except Exception as fallback_error:
-                        Logger.debug(f"Failed to display target message: {fallback_error}")
+                        Logger.debug("Failed to display target message: %s", fallback_error)
             
         except Exception as e:
-            Logger.debug(f"Error displaying target name overhead: {e}")
+            Logger.debug("Error displaying target name overhead: %s", e)
 
     def _get_cached_mobile_data(self, serial: int) -> Optional[Dict]:
         """Get cached mobile data if still valid."""
@@ -596,7 +641,7 @@ class CombatSystem:
 
     def _get_adaptive_scan_interval(self) -> int:
         """Get adaptive scan interval based on combat state."""
-        base_interval = self.config_manager.get_combat_setting('timing_settings.target_scan_interval')
+        base_interval = self.config_manager.combat_settings.timing_settings.target_scan_interval
         if not self.current_target:
             return max(base_interval // 3, 100)  # Minimum 100ms when looking for targets
         elif self.current_target and self.current_target.get('hits', 0) > self.current_target.get('hits_max', 1) * 0.8:
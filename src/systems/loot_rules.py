@@ -0,0 +1,284 @@
+"""
+Compiled Loot Rules for DexBot
+Turns the loot lists into ID lookups and one name matcher so each item is classified in a single pass,
+caches the resulting decisions and orders the items worth taking best-first
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+# Loot lists in the order they win when an item matches several of them
+LOOT_LIST_PRIORITY = ("never_take", "always_take", "take_if_space")
+
+# Evaluation cache defaults
+EVALUATION_CACHE_MAX_ENTRIES = 1000
+EVALUATION_CACHE_TTL_SECONDS = 300
+
+# Worth of one unit of each item database value tier (items not in the database count as low)
+VALUE_TIER_SCORES = {"low": 1, "medium": 10, "high": 100, "very_high": 1000}
+# Weight assumed for weightless items when ranking by value per stone
+MIN_PLAN_ITEM_WEIGHT = 0.1
+
+
+class NameMatcher:
+    """Aho-Corasick automaton over lowercase name fragments
+
+    Every fragment is tagged with a rank (lower wins). search() walks the name
+    once and returns the lowest rank of any fragment it contains, however many
+    fragments there are.
+    """
+
+    def __init__(self) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._rank: List[Optional[int]] = [None]
+        self.pattern_count = 0
+
+    def add(self, fragment: str, rank: int) -> None:
+        """Add a fragment (call build() after the last one)"""
+        if not fragment:
+            return
+        node = 0
+        for char in fragment:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._rank.append(None)
+            node = next_node
+        if self._rank[node] is None or rank < self._rank[node]:
+            self._rank[node] = rank
+        self.pattern_count += 1
+
+    def build(self) -> None:
+        """Compute failure links, folding each node's suffix matches into its rank"""
+        queue = list(self._goto[0].values())
+        index = 0
+        while index < len(queue):
+            node = queue[index]
+            index += 1
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                child_fail = self._goto[fail].get(char, 0)
+                self._fail[child] = child_fail if child_fail != child else 0
+                suffix_rank = self._rank[self._fail[child]]
+                if suffix_rank is not None and (self._rank[child] is None or suffix_rank < self._rank[child]):
+                    self._rank[child] = suffix_rank
+                queue.append(child)
+
+    def search(self, text: str) -> Optional[int]:
+        """Lowest rank of any fragment contained in text, or None"""
+        goto = self._goto
+        fail = self._fail
+        ranks = self._rank
+        best = None
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            rank = ranks[node]
+            if rank is not None and (best is None or rank < best):
+                best = rank
+                if best == 0:
+                    break
+        return best
+
+
+class CompiledLootRules:
+    """Loot lists compiled for single-pass item classification
+
+    Item ID rules go into one dict (ID -> best list) and name rules into one
+    NameMatcher, so classify() costs one lookup plus one scan of the item name
+    regardless of the list lengths. never_take beats always_take beats
+    take_if_space, as when the lists were checked one after another.
+    """
+
+    def __init__(self, loot_lists: Dict[str, List[Any]]) -> None:
+        """
+        Args:
+            loot_lists: Normalized loot lists (int item IDs and lowercase name fragments)
+        """
+        self.id_rules: Dict[int, int] = {}
+        self.name_matcher = NameMatcher()
+        for rank, list_name in enumerate(LOOT_LIST_PRIORITY):
+            for rule in loot_lists.get(list_name, []):
+                if isinstance(rule, int):
+                    self.id_rules.setdefault(rule, rank)
+                else:
+                    self.name_matcher.add(rule, rank)
+        self.name_matcher.build()
+
+    def classify(self, item_id: int, item_name: str) -> Optional[str]:
+        """Name of the loot list that decides an item, or None if no rule matches
+
+        Args:
+            item_id: The item's ID
+            item_name: The item's name in lowercase
+        """
+        rank = self.id_rules.get(item_id)
+        if rank != 0:
+            name_rank = self.name_matcher.search(item_name)
+            if name_rank is not None and (rank is None or name_rank < rank):
+                rank = name_rank
+        return LOOT_LIST_PRIORITY[rank] if rank is not None else None
+
+    def get_stats(self) -> Dict[str, int]:
+        """Rule counts"""
+        return {
+            "id_rules": len(self.id_rules),
+            "name_rules": self.name_matcher.pattern_count,
+        }
+
+
+class LootDecisionCache:
+    """Bounded LRU cache with a time-to-live per entry
+
+    Holds the loot decision per (ItemID, name, hue). When full, the least
+    recently used entry is evicted; entries older than ttl_seconds are treated
+    as misses and dropped on access or by purge_expired().
+    """
+
+    def __init__(
+        self,
+        max_entries: int = EVALUATION_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = EVALUATION_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Cached value for key, or None on a miss (absent or expired)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if self._clock() >= entry[1]:
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry if the cache is full
+
+        Args:
+            ttl_seconds: Lifetime of this entry (default: the cache's ttl_seconds)
+        """
+        if key in self._entries:
+            del self._entries[key]
+        elif len(self._entries) >= self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        if ttl_seconds is None:
+            ttl_seconds = self.ttl_seconds
+        self._entries[key] = (value, self._clock() + ttl_seconds)
+
+    def purge_expired(self) -> int:
+        """Drop every expired entry; returns how many were dropped"""
+        now = self._clock()
+        expired = [key for key, (_, expires_at) in self._entries.items() if now >= expires_at]
+        for key in expired:
+            del self._entries[key]
+        self.expirations += len(expired)
+        return len(expired)
+
+    def clear(self) -> None:
+        """Drop every entry (the counters are kept)"""
+        self._entries.clear()
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """(key, value) pairs from least to most recently used"""
+        return [(key, value) for key, (value, _) in self._entries.items()]
+
+    def items_with_ttl(self) -> List[Tuple[Hashable, Any, float]]:
+        """(key, value, seconds left) for every unexpired entry, least recently used first"""
+        now = self._clock()
+        return [
+            (key, value, expires_at - now)
+            for key, (value, expires_at) in self._entries.items()
+            if expires_at > now
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Size and hit/miss/eviction counters"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate_percent": round(self.hits * 100.0 / lookups, 1) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class LootCandidate:
+    """An item the loot rules want to take, with its worth and weight
+
+    Args:
+        item: The item object
+        rank: Index of its loot list in LOOT_LIST_PRIORITY order (lower is taken first)
+        value_tier: The item database value tier ("unknown" if not in the database)
+        amount: Stack size
+        weight: Weight of the whole stack in stones
+    """
+
+    def __init__(self, item: Any, rank: int, value_tier: str, amount: int, weight: float) -> None:
+        self.item = item
+        self.rank = rank
+        self.value = VALUE_TIER_SCORES.get(value_tier, VALUE_TIER_SCORES["low"]) * max(amount, 1)
+        self.weight = max(weight, 0)
+
+
+def plan_loot(candidates: List[LootCandidate], weight_budget: float, item_budget: int) -> List[Any]:
+    """Order loot best-first and leave out what cannot fit
+
+    A greedy knapsack: within each rank, candidates are taken by value per
+    stone (highest first, more valuable stacks winning ties) for as long as
+    the remaining weight and item budgets allow. A candidate too heavy for
+    what is left is skipped so lighter ones can still fill the space.
+
+    Args:
+        candidates: The items to consider
+        weight_budget: Stones that can still be carried
+        item_budget: Number of items the backpack can still hold
+
+    Returns:
+        The items to move, in move order
+    """
+    ordered = sorted(
+        candidates,
+        key=lambda c: (c.rank, -c.value / max(c.weight, MIN_PLAN_ITEM_WEIGHT), -c.value),
+    )
+    plan = []
+    for candidate in ordered:
+        if len(plan) >= item_budget:
+            break
+        if candidate.weight > weight_budget:
+            continue
+        weight_budget -= candidate.weight
+        plan.append(candidate.item)
+    return plan
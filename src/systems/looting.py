@@ -3,20 +3,26 @@ Looting System Module for DexBot
 Automates looting corpses and skinning creatures with intelligent item filtering.
 """
 
+import json
 import time
+import zlib
 from datetime import datetime
-from typing import List, Optional, Dict, Tuple, Any
+from typing import Any, Dict, Generator, List, Optional, Tuple
 from enum import Enum
 
 from ..config.config_manager import ConfigManager
+from ..core.event_log import EventType, get_event_log
 from ..core.logger import Logger, SystemStatus
 from ..utils.imports import Items, Misc, Mobiles, Player, Target, Timer
 from ..utils.uo_items import get_item_database
+from ..systems.loot_rules import LOOT_LIST_PRIORITY, CompiledLootRules, LootCandidate, LootDecisionCache, plan_loot
 
 # Constants for system performance tuning
-CACHE_CLEANUP_INTERVAL_SECONDS = 60  # Clean cache every minute
-MAX_EVALUATION_CACHE_SIZE = 1000  # Maximum cache entries before cleanup
-MAX_EVALUATION_CACHE_GROWTH_LIMIT = 500  # Prevent unbounded cache growth during evaluation
+CACHE_CLEANUP_INTERVAL_SECONDS = 60  # Purge expired evaluation cache entries every minute
+
+# A corpse job yields the number of milliseconds to wait before its next step and
+# returns its result when finished
+LootSteps = Generator[int, None, Any]
 
 
 class LootDecision(Enum):
@@ -75,6 +81,15 @@ class LootingSystem:
         self.corpse_queue: List[CorpseInfo] = []
         self.processing_corpse = None
         
+        # Resumable corpse job: advanced one step (e.g. one item move) per update so
+        # healing and combat keep running while a corpse is being looted
+        self._corpse_job: Optional[LootSteps] = None
+        self._corpse_job_resume_time = 0.0
+        
+        # Phase timing histograms (loot.scan / loot.open / loot.move / loot.evaluate)
+        self.profiler = SystemStatus().profiler
+        self.event_log = get_event_log()
+        
         # Initialize UO Item Database for enhanced item identification
         try:
             self.item_db = get_item_database()
@@ -83,10 +98,9 @@ class LootingSystem:
             Logger.warning(f"Failed to load UO Item Database: {e}. Using fallback mode.")
             self.item_db = None
         
-        # Enhanced configuration with database validation
+        # Enhanced configuration with database validation (dropped on looting config changes)
         self._enhanced_config_cache = None
-        self._config_cache_timestamp = 0
-        self._config_cache_duration = 300  # 5 minutes
+        self._loot_rules: Optional[CompiledLootRules] = None
         self._load_enhanced_config()
         
         # Corpse processing cache to avoid reprocessing empty/looted corpses
@@ -103,14 +117,17 @@ class LootingSystem:
             'last_reset': time.time()
         }
         
-        # Cache for item evaluation to improve performance
-        self.item_evaluation_cache: Dict[str, LootDecision] = {}
-        self.cache_expiry = 300  # 5 minutes
+        # Loot decisions per (ItemID, name, hue): bounded LRU, entries expire after 5 minutes
+        self.item_evaluation_cache = LootDecisionCache()
         self.last_cache_cleanup = time.time()
         
         # PHASE 3.1.1: Ignore list optimization for performance
         self._load_ignore_list_settings()
         
+        # Drop derived state only when the settings it came from change
+        self.config_manager.subscribe("looting", self._on_config_changed)
+        self.config_manager.subscribe("main", self._on_config_changed)
+        
         Logger.info(f"Looting System initialized with ignore list optimization: {self.use_ignore_list}")
     
     def _get_currency_ids(self) -> List[int]:
@@ -139,26 +156,51 @@ class LootingSystem:
             Dictionary with item identification information
         """
         item_id = getattr(item, 'ItemID', 0)
-        item_name = getattr(item, 'Name', 'Unknown')
-        
+        db_item = None
         if self.item_db:
             try:
                 db_item = self.item_db.get_item_by_id(item_id)
-                if db_item:
-                    return {
-                        'id': item_id,
-                        'name': db_item['name'],
-                        'category': db_item.get('category', 'unknown'),
-                        'value_tier': db_item.get('value_tier', 'unknown'),
-                        'from_database': True
-                    }
             except Exception as e:
-                Logger.debug(f"Database lookup failed for item {item_id}: {e}")
+                Logger.debug("Database lookup failed for item %s: %s", item_id, e)
+        return self._build_item_info(item, db_item)
+
+    def _identify_items(self, items: List[Any]) -> List[Dict[str, Any]]:
+        """Identify a batch of items with a single database call.
+        
+        Args:
+            items: The item objects to identify
+            
+        Returns:
+            Identification information for each item, in the same order
+        """
+        evaluations = {}
+        if self.item_db:
+            item_ids = list({getattr(item, 'ItemID', 0) for item in items})
+            try:
+                evaluations = self.item_db.evaluate_items_for_looting(item_ids)
+            except Exception as e:
+                Logger.debug("Database lookup failed for items %s: %s", item_ids, e)
+        return [
+            self._build_item_info(item, evaluations.get(getattr(item, 'ItemID', 0), {}).get('item_data'))
+            for item in items
+        ]
+
+    def _build_item_info(self, item: Any, db_item: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Item identification from its database entry, or basic item information if there is none."""
+        item_id = getattr(item, 'ItemID', 0)
+        if db_item:
+            return {
+                'id': item_id,
+                'name': db_item['name'],
+                'category': db_item.get('category', 'unknown'),
+                'value_tier': db_item.get('value_tier', 'unknown'),
+                'from_database': True
+            }
         
         # Fallback to basic item information
         return {
             'id': item_id,
-            'name': item_name,
+            'name': getattr(item, 'Name', 'Unknown'),
             'category': 'unknown',
             'value_tier': 'unknown',
             'from_database': False
@@ -178,19 +220,36 @@ class LootingSystem:
         
         return item_id in self._currency_ids_cache
 
+    def _on_config_changed(self, section: str, key_path: Optional[str]) -> None:
+        """ConfigManager subscriber: invalidate caches derived from the changed section.
+        
+        Args:
+            section: The config section that changed ("looting" or "main")
+            key_path: The dotted path that was set, or None if the whole section changed
+        """
+        if section == "looting":
+            # Loot lists and filters feed both caches
+            self._enhanced_config_cache = None
+            self._loot_rules = None
+            self.item_evaluation_cache.clear()
+            Logger.debug("LOOTING: Config changed (%s), evaluation cache cleared", key_path or "all")
+        elif key_path is None or key_path.startswith("performance_optimization"):
+            self._read_ignore_list_settings()
+
+    def _read_ignore_list_settings(self) -> None:
+        """Read the ignore list options from the main config."""
+        looting_opts = self.config_manager.get_main_setting('performance_optimization.looting_optimizations', {})
+        self.use_ignore_list = looting_opts.get('use_ignore_list', True)
+        self.ignore_list_cleanup_interval = looting_opts.get('ignore_list_cleanup_interval_seconds', 180)
+
     def _load_ignore_list_settings(self) -> None:
         """Load ignore list optimization settings from configuration."""
         try:
-            # Get performance optimization settings from main config
-            main_config = self.config_manager.get_main_setting('performance_optimization', {})
-            looting_opts = main_config.get('looting_optimizations', {})
-            
-            self.use_ignore_list = looting_opts.get('use_ignore_list', True)
-            self.ignore_list_cleanup_interval = looting_opts.get('ignore_list_cleanup_interval_seconds', 180)
+            self._read_ignore_list_settings()
             self.last_ignore_cleanup = time.time()
             self.ignored_corpses_count = 0  # Track ignored corpses for stats
             
-            Logger.debug(f"LOOTING: Ignore list optimization: {self.use_ignore_list}, cleanup interval: {self.ignore_list_cleanup_interval}s")
+            Logger.debug("LOOTING: Ignore list optimization: %s, cleanup interval: %ss", self.use_ignore_list, self.ignore_list_cleanup_interval)
         except Exception as e:
             # Fallback to defaults if config loading fails
             Logger.warning(f"LOOTING: Failed to load ignore list settings, using defaults: {e}")
@@ -229,7 +288,7 @@ class LootingSystem:
         if not self._is_system_ready():
             return
             
-        Logger.debug(f"LOOTING: System is ENABLED - proceeding with update")
+        Logger.debug("LOOTING: System is ENABLED - proceeding with update")
 
         try:
             current_time = time.time()
@@ -269,7 +328,7 @@ class LootingSystem:
         self._cleanup_cache_if_needed(current_time)
         cache_duration = (time.time() - cache_start) * 1000
         if cache_duration > 10:
-            Logger.debug(f"LOOTING: Cache cleanup completed in {cache_duration:.1f}ms")
+            Logger.debug("LOOTING: Cache cleanup completed in %.1fms", cache_duration)
 
     def _perform_corpse_operations(self, current_time: float) -> None:
         """Perform corpse scanning and processing operations.
@@ -282,14 +341,14 @@ class LootingSystem:
         self._scan_for_corpses_if_needed(current_time)
         scan_duration = (time.time() - scan_start) * 1000
         if len(self.corpse_queue) > 0:
-            Logger.debug(f"LOOTING: Found {len(self.corpse_queue)} corpses to process (scan: {scan_duration:.1f}ms)")
+            Logger.debug("LOOTING: Found %s corpses to process (scan: %.1fms)", len(self.corpse_queue), scan_duration)
         
         # Process corpse queue
         process_start = time.time()
         self._process_corpse_queue()
         process_duration = (time.time() - process_start) * 1000
         if process_duration > 50:
-            Logger.debug(f"LOOTING: Corpse queue processing completed in {process_duration:.1f}ms")
+            Logger.debug("LOOTING: Corpse queue processing completed in %.1fms", process_duration)
 
     def _log_performance_timing(self, system_start_time: float) -> None:
         """Log performance timing information.
@@ -305,7 +364,7 @@ class LootingSystem:
         elif system_duration > 200:  # More than 200ms
             Logger.info(f"LOOTING: System took {system_duration:.1f}ms - monitor performance")
         else:
-            Logger.debug(f"LOOTING: System completed in {system_duration:.1f}ms")
+            Logger.debug("LOOTING: System completed in %.1fms", system_duration)
 
     def scan_for_corpses(self) -> List[CorpseInfo]:
         """Scan for nearby corpses within configured range.
@@ -330,7 +389,7 @@ class LootingSystem:
             # Process found corpses into CorpseInfo objects
             corpses = self._process_found_corpses(corpse_items, max_range)
             
-            Logger.debug(f"Found {len(corpses)} corpses in range")
+            Logger.debug("Found %s corpses in range", len(corpses))
             return corpses
             
         except Exception as e:
@@ -353,7 +412,7 @@ class LootingSystem:
         corpse_filter.CheckIgnoreObject = True  # OPTIMIZATION: Exclude ignored corpses from search
         corpse_items = Items.ApplyFilter(corpse_filter)
         
-        Logger.debug(f"LOOTING: Found {len(corpse_items) if corpse_items else 0} corpses in range {max_range} (excluding ignored)")
+        Logger.debug("LOOTING: Found %s corpses in range %s (excluding ignored)", len(corpse_items) if corpse_items else 0, max_range)
         
         return corpse_items if corpse_items else []
 
@@ -382,13 +441,13 @@ class LootingSystem:
                 dy = player_y - corpse_item.Position.Y
                 distance = (dx * dx + dy * dy) ** 0.5
                 
-                Logger.debug(f"LOOTING: Processing corpse {corpse_item.Serial} at distance {distance:.1f}")
+                Logger.debug("LOOTING: Processing corpse %s at distance %.1f", corpse_item.Serial, distance)
                 
                 if distance <= max_range:
                     # Create corpse info
                     corpse_info = self._create_corpse_info(corpse_item, distance)
                     corpses.append(corpse_info)
-                    Logger.debug(f"LOOTING: Added corpse {corpse_item.Serial} to queue")
+                    Logger.debug("LOOTING: Added corpse %s to queue", corpse_item.Serial)
         
         return corpses
 
@@ -415,49 +474,103 @@ class LootingSystem:
         )
 
     def process_corpse_queue(self) -> None:
-        """Process the queue of corpses to loot."""
-        if not self.corpse_queue or self.processing_corpse:
+        """Advance the corpse queue by one step.
+
+        A corpse is skinned and looted by a resumable job that performs a single
+        game action (open, skin, item move) per call and then returns, so the main
+        loop is never blocked for the whole corpse.
+        """
+        if self._corpse_job is None:
+            if not self.corpse_queue:
+                return
+
+            # Get the next corpse to process
+            next_corpse = self._get_next_corpse_to_process()
+            if not next_corpse:
+                return
+
+            self.processing_corpse = next_corpse
+            self._corpse_job = self._process_corpse_steps(next_corpse)
+            self._corpse_job_resume_time = 0.0
+            Logger.debug("Processing corpse: %s at distance %.1f", next_corpse.creature_type, next_corpse.distance)
+
+        # Still waiting for the previous action to settle
+        if time.time() < self._corpse_job_resume_time:
             return
 
-        # Get the next corpse to process
-        next_corpse = self._get_next_corpse_to_process()
-        if not next_corpse:
+        corpse = self.processing_corpse
+        try:
+            wait_ms = next(self._corpse_job)
+            self._corpse_job_resume_time = time.time() + wait_ms / 1000.0
             return
+        except StopIteration:
+            pass
+        except Exception as e:
+            Logger.error(f"Error processing corpse {corpse.serial}: {e}")
+
+        # Job finished (or failed) - remove the corpse from the queue
+        if corpse in self.corpse_queue:
+            self.corpse_queue.remove(corpse)
+        self._corpse_job = None
+        self.processing_corpse = None
+
+    def _process_corpse_steps(self, corpse: CorpseInfo) -> LootSteps:
+        """Skin then loot a corpse, yielding between game actions.
 
-        self.processing_corpse = next_corpse
-        Logger.debug(f"Processing corpse: {next_corpse.creature_type} at distance {next_corpse.distance:.1f}")
+        Args:
+            corpse: The corpse to process
+        """
+        # Skin first if applicable
+        if corpse.is_skinnable and not corpse.skinned:
+            skin_result = yield from self._skin_creature_steps(corpse.serial)
+            corpse.skinned = True
+            if skin_result.success:
+                self.stats['creatures_skinned'] += 1
+                Logger.info(f"Skinned {corpse.creature_type}: {skin_result.message}")
+
+        # Then loot the corpse
+        if not corpse.looted:
+            loot_result = yield from self._loot_corpse_steps(corpse.serial)
+            corpse.looted = True
+            if loot_result.success:
+                self.stats['corpses_processed'] += 1
+                self.stats['items_collected'] += loot_result.items_taken
+                Logger.info(f"Looted {corpse.creature_type}: {loot_result.message}")
+
+    def _run_steps(self, steps: LootSteps) -> Any:
+        """Drive a step generator to completion, pausing between steps.
+
+        Used by the synchronous loot_corpse() and skin_creature() entry points.
 
+        Args:
+            steps: Generator yielding wait times in milliseconds
+
+        Returns:
+            The generator's return value
+        """
         try:
-            # Skin first if applicable
-            if next_corpse.is_skinnable and not next_corpse.skinned:
-                skin_result = self.skin_creature(next_corpse.serial)
-                next_corpse.skinned = True
-                if skin_result.success:
-                    self.stats['creatures_skinned'] += 1
-                    Logger.info(f"Skinned {next_corpse.creature_type}: {skin_result.message}")
-
-            # Then loot the corpse
-            if not next_corpse.looted:
-                loot_result = self.loot_corpse(next_corpse.serial)
-                next_corpse.looted = True
-                if loot_result.success:
-                    self.stats['corpses_processed'] += 1
-                    self.stats['items_collected'] += loot_result.items_taken
-                    Logger.info(f"Looted {next_corpse.creature_type}: {loot_result.message}")
-
-            # Remove from queue when complete
-            self.corpse_queue.remove(next_corpse)
-            
-        except Exception as e:
-            Logger.error(f"Error processing corpse {next_corpse.serial}: {e}")
-            # Remove problematic corpse from queue
-            if next_corpse in self.corpse_queue:
-                self.corpse_queue.remove(next_corpse)
-        finally:
-            self.processing_corpse = None
+            while True:
+                wait_ms = next(steps)
+                if wait_ms > 0:
+                    Misc.Pause(wait_ms)
+        except StopIteration as done:
+            return done.value
 
     def loot_corpse(self, corpse_serial: int) -> LootResult:
-        """Loot a specific corpse.
+        """Loot a specific corpse, blocking until it is finished.
+        
+        The main loop uses the resumable job in process_corpse_queue() instead.
+        
+        Args:
+            corpse_serial: Serial number of the corpse to loot
+            
+        Returns:
+            LootResult: Result of the looting operation
+        """
+        return self._run_steps(self._loot_corpse_steps(corpse_serial))
+
+    def _loot_corpse_steps(self, corpse_serial: int) -> LootSteps:
+        """Loot a specific corpse, yielding between game actions.
         
         Args:
             corpse_serial: Serial number of the corpse to loot
@@ -484,7 +597,8 @@ class LootingSystem:
                 return LootResult(False, 0, "Inventory full")
 
             # Open the corpse container
-            if not self._open_corpse_container(corpse_serial):
+            opened = yield from self._open_corpse_container_steps(corpse_serial)
+            if not opened:
                 Logger.info(f"LOOTING: Failed to open corpse {corpse_serial} - may be out of range, will retry later")
                 return LootResult(False, 0, "Failed to open corpse")
 
@@ -500,9 +614,10 @@ class LootingSystem:
                 return LootResult(True, 0, "Corpse empty")
             
             # Process items from corpse
-            items_taken = self._process_corpse_items(corpse_items, corpse_serial)
+            items_taken = yield from self._process_corpse_items_steps(corpse_items, corpse_serial)
             
             # Mark corpse as processed if successful or empty
+            self.event_log.record(EventType.CORPSE_LOOTED, serial=corpse_serial, value=items_taken)
             if items_taken > 0 or not corpse_items:
                 self._mark_corpse_as_processed(corpse_serial)
                 Logger.info(f"LOOTING: Finished processing corpse {corpse_serial}, collected {items_taken} items")
@@ -551,7 +666,7 @@ class LootingSystem:
         corpse_items = []
         
         try:
-            Logger.debug(f"LOOTING: Attempting to access corpse {corpse_serial} contents")
+            Logger.debug("LOOTING: Attempting to access corpse %s contents", corpse_serial)
             
             # Get the corpse item
             corpse_item = Items.FindBySerial(corpse_serial)
@@ -561,25 +676,24 @@ class LootingSystem:
             
             # Use corpse.Contains to access items directly (proven working method)
             if hasattr(corpse_item, 'Contains') and corpse_item.Contains:
-                Logger.debug(f"LOOTING: Corpse has {len(corpse_item.Contains)} items")
+                Logger.debug("LOOTING: Corpse has %s items", len(corpse_item.Contains))
                 
                 # Access items directly from corpse.Contains
-                for item in corpse_item.Contains:
-                    corpse_items.append(item)
-                    item_name = getattr(item, 'Name', 'Unknown')
-                    item_id = getattr(item, 'ItemID', 'Unknown')
-                    Logger.debug(f"LOOTING: Available item: {item_name} (ID: {item_id})")
+                corpse_items.extend(corpse_item.Contains)
+                if Logger.debug_enabled:
+                    for item in corpse_items:
+                        Logger.debug("LOOTING: Available item: %s (ID: %s)", getattr(item, 'Name', 'Unknown'), getattr(item, 'ItemID', 'Unknown'))
                 
-                Logger.debug(f"LOOTING: Successfully found {len(corpse_items)} items via corpse.Contains")
+                Logger.debug("LOOTING: Successfully found %s items via corpse.Contains", len(corpse_items))
             else:
-                Logger.debug(f"LOOTING: Corpse has no Contains property or is empty")
+                Logger.debug("LOOTING: Corpse has no Contains property or is empty")
                 
                 # Fallback: Try to find specific items by ID as backup (no retry needed)
                 Logger.info(f"LOOTING: Fallback - trying Items.FindByID for gold (1712)")
                 gold_item = Items.FindByID(1712, -1, corpse_serial)
                 if gold_item:
                     corpse_items.append(gold_item)
-                    Logger.debug(f"LOOTING: Found gold item via fallback: {gold_item.Name} (Amount: {gold_item.Amount})")
+                    Logger.debug("LOOTING: Found gold item via fallback: %s (Amount: %s)", gold_item.Name, gold_item.Amount)
                     
         except Exception as e:
             Logger.error(f"LOOTING: Error accessing corpse contents: {e}")
@@ -587,8 +701,8 @@ class LootingSystem:
         
         return corpse_items
 
-    def _process_corpse_items(self, corpse_items: List[Any], corpse_serial: int) -> int:
-        """Process and loot items from a corpse.
+    def _process_corpse_items_steps(self, corpse_items: List[Any], corpse_serial: int) -> LootSteps:
+        """Process and loot items from a corpse, yielding after every item move.
         
         Args:
             corpse_items: List of items in the corpse
@@ -601,34 +715,35 @@ class LootingSystem:
         config = self.config_manager.get_looting_config()
         action_delay = config.get('timing', {}).get('loot_action_delay_ms', 200)
         
-        Logger.debug(f"LOOTING: Processing {len(corpse_items)} items from corpse {corpse_serial}")
-        
-        # Loot the items
-        for item in corpse_items:
-            if not self._has_inventory_space():
-                Logger.warning("Inventory full, stopping loot")
-                break
-
-            if item and self._should_loot_item(item):
-                Logger.debug(f"LOOTING: Evaluating item: {item.Name} (ID: {item.ItemID})")
-                if self._take_item(item):
-                    items_taken += 1
-                    Logger.info(f"LOOTING: Successfully took item: {item.Name}")
-                    
-                    # Track gold specifically (using database lookup)
-                    item_id = getattr(item, 'ItemID', 0)
-                    if self._is_currency_item(item_id):
-                        gold_amount = getattr(item, 'Amount', 1)
-                        self.stats['gold_collected'] += gold_amount
-                        Logger.info(f"LOOTING: Collected {gold_amount} gold")
-                else:
-                    Logger.info(f"LOOTING: Failed to take item: {item.Name}")
+        Logger.debug("LOOTING: Processing %s items from corpse %s", len(corpse_items), corpse_serial)
+        
+        # Classify the whole corpse first, then move items in plan order; the plan
+        # already fits the backpack budget, so space is only re-checked after a failed move
+        evaluate_start = time.time()
+        loot_plan = self._plan_corpse_loot(corpse_items)
+        self.profiler.record_since("loot.evaluate", evaluate_start)
+        for item in loot_plan:
+            Logger.debug("LOOTING: Taking item: %s (ID: %s)", item.Name, item.ItemID)
+            taken = yield from self._take_item_steps(item)
+            if taken:
+                items_taken += 1
+                Logger.info(f"LOOTING: Successfully took item: {item.Name}")
                 
-                # Small delay between item actions
-                if action_delay > 0:
-                    Misc.Pause(action_delay)
+                # Track gold specifically (using database lookup)
+                item_id = getattr(item, 'ItemID', 0)
+                if self._is_currency_item(item_id):
+                    gold_amount = getattr(item, 'Amount', 1)
+                    self.stats['gold_collected'] += gold_amount
+                    Logger.info(f"LOOTING: Collected {gold_amount} gold")
             else:
-                Logger.info(f"LOOTING: Skipping item: {item.Name if item else 'Unknown'}")
+                Logger.info(f"LOOTING: Failed to take item: {item.Name}")
+                if not self._has_inventory_space():
+                    Logger.warning("Inventory full, stopping loot")
+                    break
+            
+            # Small delay between item actions
+            if action_delay > 0:
+                yield action_delay
         
         return items_taken
 
@@ -657,7 +772,18 @@ class LootingSystem:
             return LootResult(False, 0, f"Critical error: {str(error)}")
 
     def skin_creature(self, corpse_serial: int) -> SkinResult:
-        """Skin a creature corpse.
+        """Skin a creature corpse, blocking until it is finished.
+        
+        Args:
+            corpse_serial: Serial number of the corpse to skin
+            
+        Returns:
+            SkinResult: Result of the skinning operation
+        """
+        return self._run_steps(self._skin_creature_steps(corpse_serial))
+
+    def _skin_creature_steps(self, corpse_serial: int) -> LootSteps:
+        """Skin a creature corpse, yielding while waiting on the game.
         
         Args:
             corpse_serial: Serial number of the corpse to skin
@@ -680,10 +806,10 @@ class LootingSystem:
 
             # Use the skinning knife on the corpse
             Items.UseItem(skinning_knife.Serial)
-            Misc.Pause(500)  # Wait for targeting cursor
+            yield 500  # Wait for targeting cursor
             
             Target.TargetExecute(corpse_serial)
-            Misc.Pause(1000)  # Wait for skinning to complete
+            yield 1000  # Wait for skinning to complete
 
             # Check for skinning success (simplified)
             # In a real implementation, you'd check journal messages
@@ -702,25 +828,43 @@ class LootingSystem:
         Returns:
             LootDecision: The decision for this item
         """
-        if not item or not hasattr(item, 'Name'):
-            return LootDecision.NEVER_TAKE
-
-        # Optimized cache key using ItemID only for performance (items with same ID have same rules)
-        item_id = getattr(item, 'ItemID', 0)
-        cache_key = f"id_{item_id}"
-        
-        # Check cache first
-        if cache_key in self.item_evaluation_cache:
-            return self.item_evaluation_cache[cache_key]
+        return self.evaluate_items([item])[0]
 
-        # Evaluate the item
-        decision = self._evaluate_item_by_rules(item)
+    def evaluate_items(self, items: List[Any], item_infos: Optional[List[Dict[str, Any]]] = None) -> List[LootDecision]:
+        """Evaluate a batch of items, e.g. a corpse's contents.
         
-        # Cache the decision (limit cache size for memory efficiency)
-        if len(self.item_evaluation_cache) < MAX_EVALUATION_CACHE_GROWTH_LIMIT:
-            self.item_evaluation_cache[cache_key] = decision
+        Cached decisions are reused; the remaining items are identified with a
+        single database call before the loot rules are applied.
         
-        return decision
+        Args:
+            items: The items to evaluate
+            item_infos: The items' identification if already looked up (see _identify_items)
+            
+        Returns:
+            List[LootDecision]: The decision for each item, in the same order
+        """
+        decisions: List[Optional[LootDecision]] = []
+        misses = []  # (index, item, cache key) of items without a cached decision
+        for item in items:
+            if not item or not hasattr(item, 'Name'):
+                decisions.append(LootDecision.NEVER_TAKE)
+                continue
+            # Rules match on ID and name, so both are part of the key (hue tells variants apart)
+            cache_key = (getattr(item, 'ItemID', 0), (item.Name or "").lower(), getattr(item, 'Hue', 0))
+            decisions.append(self.item_evaluation_cache.get(cache_key))
+            if decisions[-1] is None:
+                misses.append((len(decisions) - 1, item, cache_key))
+
+        if misses:
+            if item_infos is None:
+                miss_infos = self._identify_items([item for _, item, _ in misses])
+            else:
+                miss_infos = [item_infos[index] for index, _, _ in misses]
+            for (index, item, cache_key), item_info in zip(misses, miss_infos):
+                decision = self._evaluate_item_by_rules(item, item_info)
+                self.item_evaluation_cache.put(cache_key, decision)
+                decisions[index] = decision
+        return decisions
 
     def get_status(self) -> Dict[str, Any]:
         """Get current status of the looting system.
@@ -732,7 +876,9 @@ class LootingSystem:
             'enabled': self.is_enabled(),
             'corpses_in_queue': len(self.corpse_queue),
             'processing_corpse': self.processing_corpse is not None,
+            'processing_corpse_serial': self.processing_corpse.serial if self.processing_corpse else None,
             'stats': self.stats.copy(),
+            'evaluation_cache': self.item_evaluation_cache.get_stats(),
             'inventory_space': self._get_inventory_space_info()
         }
 
@@ -748,8 +894,49 @@ class LootingSystem:
         }
         Logger.info("Looting system statistics reset")
 
+    def get_state(self) -> Dict[str, Any]:
+        """State kept across script restarts (see RuntimeStateStore)"""
+        return {
+            'processed_corpses': {str(serial): timestamp for serial, timestamp in self.processed_corpses.items()},
+            'evaluation_cache': [
+                list(key) + [decision.value, round(ttl_seconds, 1)]
+                for key, decision, ttl_seconds in self.item_evaluation_cache.items_with_ttl()
+            ],
+            'rules_fingerprint': self._get_rules_fingerprint(),
+            'stats': {key: value for key, value in self.stats.items() if key != 'last_reset'},
+        }
+
+    def restore_state(self, state: Dict[str, Any], age_seconds: float) -> None:
+        """Restore a previous run's state, dropping what has expired since
+
+        Corpses older than corpse_cache_duration are not restored, and the item
+        evaluation cache is only reused if the loot rules are unchanged, each
+        entry keeping what was left of its TTL minus the snapshot's age.
+        """
+        cutoff_time = time.time() - self.corpse_cache_duration
+        for serial, timestamp in state.get('processed_corpses', {}).items():
+            if timestamp >= cutoff_time:
+                self.processed_corpses[int(serial)] = timestamp
+
+        if state.get('rules_fingerprint') == self._get_rules_fingerprint():
+            for item_id, name, hue, value, ttl_seconds in state.get('evaluation_cache', []):
+                if ttl_seconds > age_seconds:
+                    self.item_evaluation_cache.put((item_id, name, hue), LootDecision(value), ttl_seconds - age_seconds)
+
+        for key, value in state.get('stats', {}).items():
+            if key in self.stats:
+                self.stats[key] = value
+
+        Logger.debug("LOOTING: Restored %s processed corpses and %s cached decisions",
+                     len(self.processed_corpses), len(self.item_evaluation_cache))
+
     # Private helper methods
 
+    def _get_rules_fingerprint(self) -> int:
+        """Checksum of the loot lists the evaluation cache was built from"""
+        loot_lists = self.config_manager.get_looting_setting('loot_lists', {})
+        return zlib.crc32(json.dumps(loot_lists, sort_keys=True).encode('utf-8'))
+
     def _scan_for_corpses_if_needed(self, current_time: float) -> None:
         """Scan for corpses if enough time has passed."""
         config = self.config_manager.get_looting_config()
@@ -759,11 +946,14 @@ class LootingSystem:
             # Early exit if we already have too many corpses queued (optimization)
             max_queue_size = config.get('behavior', {}).get('max_corpse_queue_size', 10)
             if len(self.corpse_queue) >= max_queue_size:
-                Logger.debug(f"LOOTING: Corpse queue at max size ({max_queue_size}), skipping scan")
+                Logger.debug("LOOTING: Corpse queue at max size (%s), skipping scan", max_queue_size)
                 self.last_corpse_scan = current_time
                 return
                 
+            scan_start = time.time()
             new_corpses = self.scan_for_corpses()
+            self.profiler.record_since("loot.scan", scan_start)
+            self.event_log.record(EventType.CORPSE_SCANNED, value=len(new_corpses))
             # Add new corpses to queue (avoid duplicates)
             added_count = 0
             for corpse in new_corpses:
@@ -775,13 +965,13 @@ class LootingSystem:
                         break
             
             if added_count > 0:
-                Logger.debug(f"LOOTING: Added {added_count} new corpses to queue")
+                Logger.debug("LOOTING: Added %s new corpses to queue", added_count)
             
             self.last_corpse_scan = current_time
 
     def _process_corpse_queue(self) -> None:
         """Process the corpse queue."""
-        if self.corpse_queue and not self.processing_corpse:
+        if self.corpse_queue or self._corpse_job is not None:
             self.process_corpse_queue()
 
     def _update_status_if_needed(self, current_time: float) -> None:
@@ -792,10 +982,9 @@ class LootingSystem:
     def _cleanup_cache_if_needed(self, current_time: float) -> None:
         """Clean up expired cache entries and manage ignore list."""
         if current_time - self.last_cache_cleanup >= CACHE_CLEANUP_INTERVAL_SECONDS:
-            # Simple cache cleanup - in a real implementation you'd track timestamps
-            if len(self.item_evaluation_cache) > MAX_EVALUATION_CACHE_SIZE:
-                self.item_evaluation_cache.clear()
-                Logger.debug("Cleared item evaluation cache")
+            expired = self.item_evaluation_cache.purge_expired()
+            if expired:
+                Logger.debug("LOOTING: Dropped %s expired item evaluations", expired)
             self.last_cache_cleanup = current_time
         
         # PHASE 3.1.1: Periodic ignore list cleanup to prevent it from growing too large
@@ -842,16 +1031,16 @@ class LootingSystem:
         weight_percent = (current_weight / max_weight) * 100
         
         if weight_percent >= weight_limit:
-            Logger.debug(f"Weight limit exceeded: {weight_percent:.1f}% >= {weight_limit}%")
+            Logger.debug("Weight limit exceeded: %.1f%% >= %s%%", weight_percent, weight_limit)
             return False
         
         # Check item count limit
         current_item_count = self._count_backpack_items()
         if current_item_count >= item_limit:
-            Logger.debug(f"Item count limit exceeded: {current_item_count} >= {item_limit}")
+            Logger.debug("Item count limit exceeded: %s >= %s", current_item_count, item_limit)
             return False
             
-        Logger.debug(f"Inventory space available: {weight_percent:.1f}% weight, {current_item_count}/{item_limit} items")
+        Logger.debug("Inventory space available: %.1f%% weight, %s/%s items", weight_percent, current_item_count, item_limit)
         return True
         
     def _count_backpack_items(self) -> int:
@@ -866,11 +1055,11 @@ class LootingSystem:
                 return len(backpack_items)
             return 0
         except Exception as e:
-            Logger.debug(f"Error counting backpack items: {e}")
+            Logger.debug("Error counting backpack items: %s", e)
             return 0  # Assume empty on error
 
-    def _open_corpse_container(self, corpse_serial: int) -> bool:
-        """Open a corpse container with retry logic.
+    def _open_corpse_container_steps(self, corpse_serial: int) -> LootSteps:
+        """Open a corpse container with retry logic, yielding between attempts.
         
         Args:
             corpse_serial: Serial number of the corpse to open
@@ -883,18 +1072,19 @@ class LootingSystem:
         max_attempts = 3
         
         for attempt in range(max_attempts):
-            if self._attempt_corpse_open(corpse_serial, attempt + 1, max_attempts):
+            opened = yield from self._attempt_corpse_open_steps(corpse_serial, attempt + 1, max_attempts)
+            if opened:
                 return True
             
             # Wait before retry (except on last attempt)
             if attempt < max_attempts - 1:
                 retry_delay_ms = 250
-                Misc.Pause(retry_delay_ms)
+                yield retry_delay_ms
         
         Logger.warning(f"Failed to open corpse {corpse_serial} after {max_attempts} attempts")
         return False
 
-    def _attempt_corpse_open(self, corpse_serial: int, attempt: int, max_attempts: int) -> bool:
+    def _attempt_corpse_open_steps(self, corpse_serial: int, attempt: int, max_attempts: int) -> LootSteps:
         """Attempt to open a corpse container.
         
         Args:
@@ -909,10 +1099,12 @@ class LootingSystem:
             Logger.info(f"LOOTING: Opening corpse {corpse_serial}, attempt {attempt}/{max_attempts}")
             
             # Use Items.UseItem to open the corpse container (correct RazorEnhanced API)
+            open_start = time.time()
             Items.UseItem(corpse_serial)
+            self.profiler.record_since("loot.open", open_start)
             
             # Give time for the corpse to open
-            Misc.Pause(300)  # Shorter pause for faster response
+            yield 300  # Shorter pause for faster response
             
             # For corpses, assume opening was successful and proceed to loot
             # Corpses don't always behave like regular containers in UO
@@ -973,39 +1165,63 @@ class LootingSystem:
             Logger.error(f"Container verification exception for {corpse_serial}: {e}")
             return False
 
-    def _should_loot_item(self, item: Any) -> bool:
-        """Determine if an item should be looted based on decision logic.
+    def _plan_corpse_loot(self, corpse_items: List[Any]) -> List[Any]:
+        """Classify a corpse's items in one batch and order the ones to take.
+        
+        always_take items come first, then take_if_space items, then unknown
+        items if take_unknown_items is set. Within each group the most valuable
+        items per stone (database value tier x stack size / weight) go first, and
+        items that no longer fit the remaining weight and item budget are left
+        out, so a nearly full backpack fills with gems rather than junk.
         
         Args:
-            item: The item to evaluate
+            corpse_items: List of items in the corpse
             
         Returns:
-            bool: True if item should be looted
+            List of items to take, in the order they should be moved
         """
-        decision = self.evaluate_item(item)
-        
-        if decision == LootDecision.ALWAYS_TAKE:
-            return True
-        elif decision == LootDecision.NEVER_TAKE:
-            return False
-        elif decision == LootDecision.TAKE_IF_SPACE:
-            # Only take if we have adequate inventory space
-            return self._has_inventory_space()
-        elif decision == LootDecision.UNKNOWN:
-            # For unknown items, check if configured to take unknowns
-            config = self.config_manager.get_looting_config()
-            take_unknowns = config.get('behavior', {}).get('take_unknown_items', False)
-            
-            if take_unknowns and self._has_inventory_space():
-                Logger.debug(f"Taking unknown item: {getattr(item, 'Name', 'Unknown')}")
-                return True
+        take_unknowns = self.config_manager.get_looting_setting('behavior.take_unknown_items', False)
+        ranks = {LootDecision(list_name): rank for rank, list_name in enumerate(LOOT_LIST_PRIORITY)}
+        if take_unknowns:
+            ranks[LootDecision.UNKNOWN] = len(LOOT_LIST_PRIORITY)
+        del ranks[LootDecision.NEVER_TAKE]
+        
+        item_infos = self._identify_items(corpse_items)
+        candidates = []
+        for item, item_info, decision in zip(corpse_items, item_infos, self.evaluate_items(corpse_items, item_infos)):
+            if decision in ranks:
+                candidates.append(LootCandidate(
+                    item,
+                    ranks[decision],
+                    item_info['value_tier'],
+                    getattr(item, 'Amount', 1),
+                    float(getattr(item, 'Weight', 0)),
+                ))
             else:
-                Logger.debug(f"Skipping unknown item: {getattr(item, 'Name', 'Unknown')}")
-                return False
+                Logger.info(f"LOOTING: Skipping item: {item.Name if item else 'Unknown'}")
         
-        return False
+        weight_budget, item_budget = self._get_inventory_budget()
+        loot_plan = plan_loot(candidates, weight_budget, item_budget)
+        Logger.debug("LOOTING: Loot plan has %s of %s items (budget %.1f stones, %s items)",
+                     len(loot_plan), len(corpse_items), weight_budget, item_budget)
+        return loot_plan
+
+    def _get_inventory_budget(self) -> Tuple[float, int]:
+        """Weight and item count the backpack can still take under the looting limits.
+        
+        Returns:
+            Tuple of (stones, items) left before inventory_weight_limit_percent
+            or inventory_item_limit is reached
+        """
+        config = self.config_manager.get_looting_config()
+        weight_limit = config.get('behavior', {}).get('inventory_weight_limit_percent', 80)
+        item_limit = config.get('behavior', {}).get('inventory_item_limit', 120)
+        
+        weight_budget = Player.MaxWeight * weight_limit / 100.0 - Player.Weight
+        item_budget = item_limit - self._count_backpack_items()
+        return max(weight_budget, 0.0), max(item_budget, 0)
 
-    def _take_item(self, item: Any) -> bool:
+    def _take_item_steps(self, item: Any) -> LootSteps:
         """Take an item from a container with error handling.
         
         Args:
@@ -1021,18 +1237,21 @@ class LootingSystem:
             item_name = getattr(item, 'Name', 'Unknown')
             item_amount = getattr(item, 'Amount', 1)
             
-            Logger.debug(f"Attempting to take item: {item_name} (Amount: {item_amount})")
-            
-            # Check if we have space before attempting to move
-            if not self._has_inventory_space():
-                Logger.debug(f"No inventory space for {item_name}")
-                return False
+            Logger.debug("Attempting to take item: %s (Amount: %s)", item_name, item_amount)
             
             # Perform the item move operation
-            success = self._perform_item_move(item, item_name, item_amount)
-            
+            source_container = getattr(item, 'Container', 0) or 0
+            success = yield from self._perform_item_move_steps(item, item_name, item_amount)
+            
+            self.event_log.record(
+                EventType.ITEM_MOVED if success else EventType.ITEM_MOVE_FAILED,
+                serial=item.Serial,
+                item_id=getattr(item, 'ItemID', 0),
+                aux=source_container,
+                value=item_amount,
+            )
             if success:
-                self._track_item_taken(item, item_amount)
+                self._track_item_taken(item, item_amount, source_container)
                 
             return success
                 
@@ -1054,8 +1273,8 @@ class LootingSystem:
             return False
         return True
 
-    def _perform_item_move(self, item: Any, item_name: str, item_amount: int) -> bool:
-        """Perform the actual item move operation.
+    def _perform_item_move_steps(self, item: Any, item_name: str, item_amount: int) -> LootSteps:
+        """Perform the actual item move operation, yielding while it settles.
         
         Args:
             item: The item to move
@@ -1065,28 +1284,34 @@ class LootingSystem:
         Returns:
             bool: True if move was successful
         """
-        # Move the item to player's backpack
+        # Move the item to player's backpack (the settle wait below is not profiled)
+        move_start = time.time()
         Items.Move(item.Serial, Player.Backpack.Serial, item_amount)
+        move_duration = (time.time() - move_start) * 1000
         
         # Wait for the move to process
         config = self.config_manager.get_looting_config()
         action_delay = config.get('timing', {}).get('loot_action_delay_ms', 200)
-        Misc.Pause(action_delay)
+        yield action_delay
         
         # Verify the item was moved successfully
-        if self._verify_item_moved(item.Serial):
-            Logger.debug(f"Successfully took {item_name}")
+        verify_start = time.time()
+        moved = self._verify_item_moved(item.Serial)
+        self.profiler.record("loot.move", move_duration + (time.time() - verify_start) * 1000)
+        if moved:
+            Logger.debug("Successfully took %s", item_name)
             return True
         else:
-            Logger.debug(f"Failed to verify {item_name} was moved")
+            Logger.debug("Failed to verify %s was moved", item_name)
             return False
 
-    def _track_item_taken(self, item: Any, item_amount: int) -> None:
+    def _track_item_taken(self, item: Any, item_amount: int, source_container: int = 0) -> None:
         """Track statistics for items that were successfully taken.
         
         Args:
             item: The item that was taken
             item_amount: Amount of the item taken
+            source_container: Serial of the corpse the item was taken from
         """
         self.stats['items_collected'] += 1
         
@@ -1094,6 +1319,9 @@ class LootingSystem:
         item_id = getattr(item, 'ItemID', 0)
         if self._is_currency_item(item_id):
             self.stats['gold_collected'] += item_amount
+            self.event_log.record(
+                EventType.GOLD_COLLECTED, serial=item.Serial, item_id=item_id, aux=source_container, value=item_amount
+            )
             
     def _verify_item_moved(self, item_serial: int) -> bool:
         """Verify that an item was successfully moved to backpack.
@@ -1111,14 +1339,15 @@ class LootingSystem:
                 return item_in_backpack.Container == Player.Backpack.Serial
             return False
         except Exception as e:
-            Logger.debug(f"Error verifying item move for {item_serial}: {e}")
+            Logger.debug("Error verifying item move for %s: %s", item_serial, e)
             return False
 
-    def _evaluate_item_by_rules(self, item: Any) -> LootDecision:
+    def _evaluate_item_by_rules(self, item: Any, item_info: Optional[Dict[str, Any]] = None) -> LootDecision:
         """Evaluate an item based on configured rules.
         
         Args:
             item: The item to evaluate
+            item_info: The item's identification if already looked up (see _identify_items)
             
         Returns:
             LootDecision: The looting decision for this item
@@ -1126,91 +1355,39 @@ class LootingSystem:
         if not item or not hasattr(item, 'Name'):
             return LootDecision.NEVER_TAKE
             
-        config = self.config_manager.get_looting_config()
-        loot_lists = config.get('loot_lists', {})
-        
         # Enhanced item identification using database
-        item_info = self._identify_item(item)
+        if item_info is None:
+            item_info = self._identify_item(item)
         item_name = item.Name.lower() if item.Name else ""
         item_id = item_info['id']
         
         # Enhanced logging with database information
         if item_info['from_database']:
-            Logger.debug(f"Evaluating {item_info['name']} (ID: {item_id}, Category: {item_info['category']}, Value: {item_info['value_tier']})")
+            Logger.debug("Evaluating %s (ID: %s, Category: %s, Value: %s)", item_info['name'], item_id, item_info['category'], item_info['value_tier'])
         else:
-            Logger.debug(f"Evaluating {item_name} (ID: {item_id}) - not in database")
-        
-        # Check never take list first (highest priority)
-        never_take = loot_lists.get('never_take', [])
-        if self._matches_loot_rules(item_name, item_id, never_take):
-            Logger.debug(f"Item {item_info['name']} matches never_take rules")
-            return LootDecision.NEVER_TAKE
-        
-        # Check always take list (second priority) 
-        always_take = loot_lists.get('always_take', [])
-        if self._matches_loot_rules(item_name, item_id, always_take):
-            Logger.debug(f"Item {item_info['name']} matches always_take rules")
-            return LootDecision.ALWAYS_TAKE
+            Logger.debug("Evaluating %s (ID: %s) - not in database", item_name, item_id)
         
-        # Check take if space list (third priority)
-        take_if_space = loot_lists.get('take_if_space', [])
-        if self._matches_loot_rules(item_name, item_id, take_if_space):
-            Logger.debug(f"Item {item_info['name']} matches take_if_space rules")
-            return LootDecision.TAKE_IF_SPACE
+        # One pass over all three lists; never_take beats always_take beats take_if_space
+        list_name = self._get_loot_rules().classify(item_id, item_name)
+        if list_name is not None:
+            Logger.debug("Item %s matches %s rules", item_info['name'], list_name)
+            return LootDecision(list_name)
         
         # Default: unknown items are not taken unless explicitly configured
-        Logger.debug(f"Item {item_info['name']} (ID: {item_id}) not in any loot list - marked as unknown")
+        Logger.debug("Item %s (ID: %s) not in any loot list - marked as unknown", item_info['name'], item_id)
         return LootDecision.UNKNOWN
+
+    def _get_loot_rules(self) -> CompiledLootRules:
+        """Loot lists compiled into ID lookups and a name matcher (rebuilt after config changes)
         
-    def _matches_loot_rules(self, item_name: str, item_id: int, rule_list: List[str]) -> bool:
-        """Check if an item matches any rule in a loot list.
-        
-        Args:
-            item_name: The item name (lowercase)
-            item_id: The item ID
-            rule_list: List of rules to check against
-            
         Returns:
-            bool: True if item matches any rule
+            CompiledLootRules: The compiled rules for the current looting config
         """
-        for rule in rule_list:
-            # Handle integer item IDs directly (e.g., 1712 for gold)
-            if isinstance(rule, int):
-                if item_id == rule:
-                    Logger.debug(f"Item ID {item_id} matches rule ID {rule}")
-                    return True
-                continue
-                
-            # Handle string rules
-            rule_str = str(rule)
-            rule_lower = rule_str.lower()
-            
-            # Check for exact item ID match (hex format like "0x0F0C")
-            if rule_lower.startswith('0x'):
-                try:
-                    rule_id = int(rule_lower, 16)
-                    if item_id == rule_id:
-                        Logger.debug(f"Item ID {item_id} matches hex rule {rule_lower}")
-                        return True
-                except ValueError:
-                    pass  # Invalid hex format, continue with name matching
-            
-            # Check for decimal item ID as string (e.g., "1712")
-            elif rule_str.isdigit():
-                try:
-                    rule_id = int(rule_str)
-                    if item_id == rule_id:
-                        Logger.debug(f"Item ID {item_id} matches decimal string rule {rule_str}")
-                        return True
-                except ValueError:
-                    pass  # Invalid number format, continue with name matching
-                    
-            # Check for partial name match
-            elif rule_lower in item_name:
-                Logger.debug(f"Item name '{item_name}' matches name rule '{rule_lower}'")
-                return True
-                
-        return False
+        if self._loot_rules is None:
+            # Loot lists are normalized by the config schema: ints for IDs, lowercase names
+            self._loot_rules = CompiledLootRules(self.config_manager.looting_settings.loot_lists)
+            Logger.debug("LOOTING: Compiled loot rules %s", self._loot_rules.get_stats())
+        return self._loot_rules
 
     def _is_corpse_already_processed(self, corpse_serial: int) -> bool:
         """Check if a corpse has already been processed.
@@ -1236,9 +1413,9 @@ class LootingSystem:
             try:
                 Misc.IgnoreObject(corpse_serial)
                 self.ignored_corpses_count += 1
-                Logger.debug(f"LOOTING: Added corpse {corpse_serial} to ignore list (total ignored: {self.ignored_corpses_count})")
+                Logger.debug("LOOTING: Added corpse %s to ignore list (total ignored: %s)", corpse_serial, self.ignored_corpses_count)
             except Exception as e:
-                Logger.debug(f"LOOTING: Failed to add corpse {corpse_serial} to ignore list: {e}")
+                Logger.debug("LOOTING: Failed to add corpse %s to ignore list: %s", corpse_serial, e)
         
         Logger.info(f"LOOTING: Marked corpse {corpse_serial} as processed")
 
@@ -1295,6 +1472,8 @@ class LootingSystem:
         validated_config = {}
         
         for list_name, items in loot_lists.items():
+            # Rule lists come back normalized (item IDs already ints)
+            items = self.config_manager.get_looting_setting(f'loot_lists.{list_name}', items)
             validated_ids = []
             
             for item in items:
@@ -1302,7 +1481,7 @@ class LootingSystem:
                 validated_ids.extend(converted_ids)
                 
             validated_config[list_name] = list(set(validated_ids))  # Remove duplicates
-            Logger.debug(f"Validated {list_name}: {len(validated_ids)} items")
+            Logger.debug("Validated %s: %s items", list_name, len(validated_ids))
         
         return validated_config
     
@@ -1332,26 +1511,18 @@ class LootingSystem:
                 tier = item_lower.replace('tier:', '')
                 return self._get_value_tier_item_ids(tier)
             
-            # Handle string names - search in database
+            # Handle string names - search in database (IDs were normalized to ints at load time)
             if self.item_db:
                 try:
                     items = self.item_db.find_items_by_name(item_lower)
                     if items:
                         ids = [item_data['decimal_id'] for item_data in items]
-                        Logger.debug(f"'{item}' resolved to {len(ids)} items: {ids}")
+                        Logger.debug("'%s' resolved to %s items: %s", item, len(ids), ids)
                         return ids
                     else:
                         Logger.warning(f"Item name '{item}' not found in database")
                 except Exception as e:
                     Logger.warning(f"Database lookup failed for '{item}': {e}")
-            
-            # Try to parse as hex string (e.g., "0x0EED")
-            try:
-                if item_lower.startswith('0x'):
-                    hex_id = int(item_lower, 16)
-                    return [hex_id]
-            except ValueError:
-                pass
         
         Logger.warning(f"Could not convert config item '{item}' to item ID(s)")
         return []
@@ -1371,7 +1542,7 @@ class LootingSystem:
         try:
             category_items = self.item_db.get_items_by_category(category)
             ids = [item_data['decimal_id'] for item_data in category_items.values()]
-            Logger.debug(f"Category '{category}': {len(ids)} items")
+            Logger.debug("Category '%s': %s items", category, len(ids))
             return ids
         except Exception as e:
             Logger.warning(f"Failed to get category '{category}' items: {e}")
@@ -1392,7 +1563,7 @@ class LootingSystem:
         try:
             tier_items = self.item_db.get_items_by_value_tier(tier)
             ids = [item_data['decimal_id'] for item_data in tier_items]
-            Logger.debug(f"Value tier '{tier}': {len(ids)} items")
+            Logger.debug("Value tier '%s': %s items", tier, len(ids))
             return ids
         except Exception as e:
             Logger.warning(f"Failed to get value tier '{tier}' items: {e}")
@@ -1401,11 +1572,8 @@ class LootingSystem:
     def _load_enhanced_config(self) -> None:
         """Load and cache enhanced configuration with database validation."""
         try:
-            current_time = time.time()
-            
-            # Check if cache is still valid
-            if (self._enhanced_config_cache is not None and 
-                current_time - self._config_cache_timestamp < self._config_cache_duration):
+            # The cache stays valid until _on_config_changed drops it
+            if self._enhanced_config_cache is not None:
                 return
             
             # Load base configuration
@@ -1422,13 +1590,12 @@ class LootingSystem:
                     # Add currency information
                     enhanced_config['currency_ids'] = self._get_currency_ids()
                     
-                    Logger.debug(f"Enhanced config with {len(db_categories)} database categories")
+                    Logger.debug("Enhanced config with %s database categories", len(db_categories))
                 except Exception as e:
                     Logger.warning(f"Failed to enhance config with database info: {e}")
             
             # Cache the enhanced configuration
             self._enhanced_config_cache = enhanced_config
-            self._config_cache_timestamp = current_time
             
             Logger.debug("Enhanced configuration loaded and cached successfully")
             
@@ -1437,13 +1604,12 @@ class LootingSystem:
             # Fallback to basic config if available
             try:
                 self._enhanced_config_cache = self.config_manager.get_looting_config()
-                self._config_cache_timestamp = time.time()
             except Exception as fallback_error:
                 Logger.error(f"Failed to load fallback configuration: {fallback_error}")
                 self._enhanced_config_cache = {}
 
     def get_enhanced_config(self) -> Dict[str, Any]:
-        """Get the enhanced configuration, reloading if cache is expired.
+        """Get the enhanced configuration, reloading it after a looting config change.
         
         Returns:
             Dictionary containing enhanced configuration
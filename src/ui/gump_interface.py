@@ -11,6 +11,9 @@ from ..core.logger import Logger, SystemStatus
 from ..utils.helpers import get_resource_color
 from ..utils.imports import Gumps, Items, Player
 
+# Console status line interval in debug mode
+DEBUG_STATUS_INTERVAL_SECONDS = 5.0
+
 
 class GumpSection:
     """Reusable component for creating consistent UI sections in the gump"""
@@ -1348,28 +1351,16 @@ def update_gump_system():
     # Handle any GUMP responses
     gump_active = GumpInterface.handle_gump_response()
 
-    # Check if any displayed data has changed
-    data_changed = status.check_gump_data_changed()
-
-    # Update GUMP only if data has changed or on periodic intervals
-    if gump_active:
-        status.gump_update_counter += 1
-        should_update = (
-            status.gump_update_counter >= config.GUMP_UPDATE_INTERVAL_CYCLES or data_changed
-        )
+    # The system registry sets how often this runs (system_scheduling.gump.period_ms),
+    # so the GUMP is rebuilt whenever its data changed since the last call
+    if gump_active and status.check_gump_data_changed():
+        GumpInterface.create_status_gump()
+        Logger.debug("GUMP updated due to data changes")
 
-        if should_update and data_changed:
-            # Only update if data actually changed
-            GumpInterface.create_status_gump()
-            status.gump_update_counter = 0
-            Logger.debug("GUMP updated due to data changes")
-        elif should_update and not data_changed:
-            # Reset counter but don't update gump since no data changed
-            status.gump_update_counter = 0
-            Logger.debug("GUMP update skipped - no data changes")
-
-    # Show console status every 20 cycles (~5 seconds) only when debug mode is enabled
-    if config.DEBUG_MODE and status.gump_update_counter == 0 and status.runtime_cycles % 20 == 0:
+    # Show console status every few seconds only when debug mode is enabled
+    now = time.time()
+    if config.DEBUG_MODE and now - status.last_debug_status_time >= DEBUG_STATUS_INTERVAL_SECONDS:
+        status.last_debug_status_time = now
         runtime_minutes = status.get_runtime_minutes()
         bandage_count = Items.FindByID(
             config.BANDAGE_ID, -1, Player.Backpack.Serial, config.SEARCH_RANGE
@@ -5,10 +5,68 @@ This module provides convenient access to the Ultima Online item database
 for DexBot scripts and configuration.
 """
 
+import builtins
+import hashlib
 import json
 import os
+import pickle
 from typing import Dict, List, Optional, Union, Any
 
+# Value tiers from least to most valuable
+VALUE_TIER_ORDER = ['low', 'medium', 'high', 'very_high']
+
+# Compiled database (invoke compile-item-db): pickled data + lookup tables next to the JSON file.
+# Bump the format version whenever the lookup tables built by _build_index change shape.
+ITEM_DB_FORMAT_VERSION = 1
+COMPILED_ITEM_DB_SUFFIX = '.pickle'
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is read-only")
+
+
+class FrozenDict(dict):
+    """Read-only dict shared by every lookup that returns it (copy() gives a mutable dict)"""
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = __ior__ = _read_only
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """Read-only list shared by every lookup that returns it (list(...) gives a mutable copy)"""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+EMPTY_ITEM_MAP = FrozenDict()
+EMPTY_ITEM_LIST = FrozenList()
+
+
+class _CompiledItemDbUnpickler(pickle.Unpickler):
+    """Unpickler that only rebuilds builtin containers and the frozen record types
+    
+    The compiled file may have been written with this module imported under a
+    different name (src.utils.uo_items, utils.uo_items or the bundled script),
+    so the frozen types are resolved here rather than by module path.
+    """
+
+    ALLOWED_BUILTINS = ('dict', 'list', 'set', 'frozenset', 'tuple')
+
+    def find_class(self, module, name):
+        if name == 'FrozenDict':
+            return FrozenDict
+        if name == 'FrozenList':
+            return FrozenList
+        if module == 'builtins' and name in self.ALLOWED_BUILTINS:
+            return getattr(builtins, name)
+        raise pickle.UnpicklingError(f"Unexpected type in compiled item database: {module}.{name}")
+
 
 class UOItemDatabase:
     """Utility class for working with UO item IDs and data."""
@@ -17,41 +75,57 @@ class UOItemDatabase:
         """Initialize the database.
         
         Args:
-            database_path: Path to the JSON database file. If None, uses default location.
+            database_path: Path to the JSON database file. If None, uses the database
+                embedded in the bundled script, or else the default location.
         """
-        if database_path is None:
-            # Default to the ref directory - handle multiple execution contexts
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            
-            # Try multiple possible locations for the database file
-            possible_paths = [
-                # For bundled script in DexBot directory
-                os.path.join(script_dir, 'ref', 'uo_item_database.json'),
-                # For bundled script in RazorEnhanced Scripts directory
-                os.path.join(script_dir, 'DexBot', 'ref', 'uo_item_database.json'),
-                # For development from src/utils/
-                os.path.join(script_dir, '..', '..', 'ref', 'uo_item_database.json'),
-                # For bundled script from dist/ directory
-                os.path.join(script_dir, '..', 'ref', 'uo_item_database.json'),
-                # Absolute path fallback
-                r'C:\Program Files (x86)\Ultima Online Unchained\Data\Plugins\RazorEnhanced\Scripts\DexBot\ref\uo_item_database.json'
-            ]
-            
-            database_path = None
-            for path in possible_paths:
-                if os.path.exists(path):
-                    database_path = path
-                    break
-            
-            # If still not found, use the first path as default (will show proper error)
-            if database_path is None:
-                database_path = possible_paths[0]
-        
-        self.database_path = database_path
-        self.data = self._load_database()
+        self.loaded_from = 'json'
+        self._compiled_index = None
+        # The bundle task inlines the database into DexBot.py, which shares this namespace
+        bundled = globals().get('_BUNDLED_ITEM_DB') if database_path is None else None
+        if bundled is not None:
+            self.database_path = None
+            self.loaded_from = 'bundled'
+            self.data = bundled
+        else:
+            self.database_path = database_path or self._find_database_path()
+            self.data = self._load_database()
+        self._set_index(self._compiled_index or self._build_index(self.data))
+        self._compiled_index = None
+
+    @staticmethod
+    def _find_database_path() -> str:
+        """Locate the JSON database file (or its compiled copy) for the current execution context."""
+        # Default to the ref directory - handle multiple execution contexts
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        
+        # Try multiple possible locations for the database file
+        possible_paths = [
+            # For bundled script in DexBot directory
+            os.path.join(script_dir, 'ref', 'uo_item_database.json'),
+            # For bundled script in RazorEnhanced Scripts directory
+            os.path.join(script_dir, 'DexBot', 'ref', 'uo_item_database.json'),
+            # For development from src/utils/
+            os.path.join(script_dir, '..', '..', 'ref', 'uo_item_database.json'),
+            # For bundled script from dist/ directory
+            os.path.join(script_dir, '..', 'ref', 'uo_item_database.json'),
+            # Absolute path fallback
+            r'C:\Program Files (x86)\Ultima Online Unchained\Data\Plugins\RazorEnhanced\Scripts\DexBot\ref\uo_item_database.json'
+        ]
+        
+        for path in possible_paths:
+            if os.path.exists(path) or os.path.exists(get_compiled_item_db_path(path)):
+                return path
+        
+        # If still not found, use the first path as default (will show proper error)
+        return possible_paths[0]
     
     def _load_database(self) -> Dict[str, Any]:
-        """Load the item database from JSON file."""
+        """Load the item database, from the compiled file when it matches the JSON file."""
+        compiled = self._load_compiled()
+        if compiled is not None:
+            self.loaded_from = 'compiled'
+            self._compiled_index = compiled['index']
+            return compiled['data']
         try:
             with open(self.database_path, 'r', encoding='utf-8') as f:
                 return json.load(f)
@@ -61,6 +135,104 @@ class UOItemDatabase:
         except json.JSONDecodeError as e:
             print(f"Error: Invalid JSON in item database: {e}")
             return {}
+
+    def _load_compiled(self) -> Optional[Dict[str, Any]]:
+        """Read the compiled database if its source hash matches the JSON file.
+        
+        Returns:
+            Dict with 'data' and 'index', or None to load the JSON file instead
+        """
+        compiled_path = get_compiled_item_db_path(self.database_path)
+        if not os.path.exists(compiled_path):
+            return None
+        try:
+            with open(compiled_path, 'rb') as f:
+                compiled = _CompiledItemDbUnpickler(f).load()
+            if compiled.get('format_version') != ITEM_DB_FORMAT_VERSION:
+                return None
+            # Without the JSON file there is nothing to check against: use the compiled copy
+            if os.path.exists(self.database_path):
+                with open(self.database_path, 'rb') as f:
+                    if compute_item_db_hash(f.read()) != compiled.get('source_hash'):
+                        print(f"Warning: {compiled_path} is out of date, loading {self.database_path}")
+                        return None
+            return compiled
+        except Exception as e:
+            print(f"Warning: Could not read compiled item database {compiled_path}: {e}")
+            return None
+
+    @staticmethod
+    def _build_index(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten the loaded data into lookup tables so every query is one dict lookup.
+        
+        Each item becomes one read-only record (its data plus 'key' and 'category')
+        shared by all tables: by int ID, by hex ID, by lowercase name or alias,
+        by value tier and by category. Queries return these shared records and
+        lists without copying them.
+        
+        Returns:
+            Dictionary of table name -> table (see _set_index)
+        """
+        categories = data.get('categories', {})
+        quick_lookup = data.get('quick_lookup', {})
+        
+        records_by_path: Dict[str, FrozenDict] = {}
+        by_category: Dict[str, FrozenDict] = {}
+        by_hex: Dict[int, FrozenDict] = {}
+        for category_name, category_data in categories.items():
+            category_records = {}
+            for item_key, item_data in category_data.get('items', {}).items():
+                record = dict(item_data)
+                record['key'] = item_key
+                record['category'] = category_name
+                record = FrozenDict(record)
+                records_by_path[f"{category_name}.{item_key}"] = record
+                category_records[item_key] = record
+                hex_value = _parse_hex(item_data.get('hex_id', ''))
+                if hex_value is not None:
+                    by_hex.setdefault(hex_value, record)
+            by_category[category_name] = FrozenDict(category_records)
+        
+        by_id: Dict[int, FrozenDict] = {}
+        for item_id, path in quick_lookup.get('by_decimal_id', {}).items():
+            if path in records_by_path and str(item_id).isdigit():
+                by_id[int(item_id)] = records_by_path[path]
+        
+        def records_for(paths: List[str]) -> FrozenList:
+            return FrozenList(records_by_path[path] for path in paths if path in records_by_path)
+        
+        by_name = {name.lower(): records_for(paths) for name, paths in quick_lookup.get('by_name', {}).items()}
+        by_tier = {tier: records_for(paths) for tier, paths in quick_lookup.get('by_value_tier', {}).items()}
+        
+        def ids_of(records: List[FrozenDict]) -> FrozenList:
+            return FrozenList(record['decimal_id'] for record in records if 'decimal_id' in record)
+        
+        ids_from_tier = {}
+        for index, tier in enumerate(VALUE_TIER_ORDER):
+            ids = set()
+            for higher_tier in VALUE_TIER_ORDER[index:]:
+                ids.update(ids_of(by_tier.get(higher_tier, [])))
+            ids_from_tier[tier] = FrozenList(ids)
+        
+        return {
+            'by_id': by_id,
+            'by_hex': by_hex,
+            'by_name': by_name,
+            'by_tier': by_tier,
+            'by_category': by_category,
+            'ids_by_name': {name: ids_of(records) for name, records in by_name.items()},
+            'ids_from_tier': ids_from_tier,
+        }
+
+    def _set_index(self, index: Dict[str, Any]) -> None:
+        """Install the lookup tables built by _build_index."""
+        self._by_id = index['by_id']
+        self._by_hex = index['by_hex']
+        self._by_name = index['by_name']
+        self._by_tier = index['by_tier']
+        self._by_category = index['by_category']
+        self._ids_by_name = index['ids_by_name']
+        self._ids_from_tier = index['ids_from_tier']
     
     def get_item_by_id(self, item_id: Union[int, str]) -> Optional[Dict[str, Any]]:
         """Get item data by decimal ID.
@@ -69,16 +241,11 @@ class UOItemDatabase:
             item_id: The decimal item ID (int or str)
             
         Returns:
-            Dict with item data or None if not found
+            Read-only item record or None if not found
         """
-        item_id_str = str(item_id)
-        lookup = self.data.get('quick_lookup', {}).get('by_decimal_id', {})
-        
-        if item_id_str in lookup:
-            item_path = lookup[item_id_str]
-            return self._get_item_by_path(item_path)
-        
-        return None
+        if isinstance(item_id, str):
+            item_id = int(item_id) if item_id.isdigit() else None
+        return self._by_id.get(item_id)
     
     def get_item_by_hex(self, hex_id: str) -> Optional[Dict[str, Any]]:
         """Get item data by hex ID.
@@ -87,27 +254,9 @@ class UOItemDatabase:
             hex_id: The hex item ID (e.g., '0x0F16')
             
         Returns:
-            Dict with item data or None if not found
+            Read-only item record or None if not found
         """
-        # Normalize hex format
-        if not hex_id.startswith('0x'):
-            hex_id = '0x' + hex_id.upper()
-        else:
-            hex_id = '0x' + hex_id[2:].upper()
-        
-        # Search through all categories
-        categories = self.data.get('categories', {})
-        for category_name, category_data in categories.items():
-            items = category_data.get('items', {})
-            for item_key, item_data in items.items():
-                if item_data.get('hex_id', '').upper() == hex_id.upper():
-                    # Return a copy with additional metadata
-                    result = item_data.copy()
-                    result['key'] = item_key
-                    result['category'] = category_name
-                    return result
-        
-        return None
+        return self._by_hex.get(_parse_hex(hex_id))
 
     def get_items_by_name(self, name: str) -> List[Dict[str, Any]]:
         """Get items by name or alias.
@@ -116,19 +265,9 @@ class UOItemDatabase:
             name: The item name or alias to search for
             
         Returns:
-            List of item data dictionaries
+            Read-only list of item records
         """
-        name_lower = name.lower()
-        lookup = self.data.get('quick_lookup', {}).get('by_name', {})
-        
-        items = []
-        if name_lower in lookup:
-            for item_path in lookup[name_lower]:
-                item_data = self._get_item_by_path(item_path)
-                if item_data:
-                    items.append(item_data)
-        
-        return items
+        return self._by_name.get(name.lower(), EMPTY_ITEM_LIST)
     
     def find_items_by_name(self, name: str) -> List[Dict[str, Any]]:
         """Find items by name or alias (alias for get_items_by_name for compatibility).
@@ -148,18 +287,9 @@ class UOItemDatabase:
             tier: Value tier ('very_high', 'high', 'medium', 'low')
             
         Returns:
-            List of item data dictionaries
+            Read-only list of item records
         """
-        lookup = self.data.get('quick_lookup', {}).get('by_value_tier', {})
-        
-        items = []
-        if tier in lookup:
-            for item_path in lookup[tier]:
-                item_data = self._get_item_by_path(item_path)
-                if item_data:
-                    items.append(item_data)
-        
-        return items
+        return self._by_tier.get(tier, EMPTY_ITEM_LIST)
     
     def get_items_by_category(self, category: str) -> Dict[str, Dict[str, Any]]:
         """Get all items in a category.
@@ -168,12 +298,9 @@ class UOItemDatabase:
             category: Category name (e.g., 'gems', 'reagents', 'potions')
             
         Returns:
-            Dictionary of items in the category
+            Read-only dictionary of item key -> item record
         """
-        categories = self.data.get('categories', {})
-        if category in categories:
-            return categories[category].get('items', {})
-        return {}
+        return self._by_category.get(category, EMPTY_ITEM_MAP)
     
     def get_item_ids_by_name(self, name: str) -> List[int]:
         """Get decimal item IDs by name or alias.
@@ -182,10 +309,9 @@ class UOItemDatabase:
             name: The item name or alias
             
         Returns:
-            List of decimal item IDs
+            Read-only list of decimal item IDs
         """
-        items = self.get_items_by_name(name)
-        return [item['decimal_id'] for item in items if 'decimal_id' in item]
+        return self._ids_by_name.get(name.lower(), EMPTY_ITEM_LIST)
     
     def get_valuable_items(self, min_tier: str = 'medium') -> List[int]:
         """Get item IDs for valuable items.
@@ -194,21 +320,9 @@ class UOItemDatabase:
             min_tier: Minimum value tier ('low', 'medium', 'high', 'very_high')
             
         Returns:
-            List of decimal item IDs
+            Read-only list of decimal item IDs
         """
-        tier_order = ['low', 'medium', 'high', 'very_high']
-        if min_tier not in tier_order:
-            return []
-        
-        min_index = tier_order.index(min_tier)
-        valuable_tiers = tier_order[min_index:]
-        
-        item_ids = []
-        for tier in valuable_tiers:
-            items = self.get_items_by_value_tier(tier)
-            item_ids.extend([item['decimal_id'] for item in items if 'decimal_id' in item])
-        
-        return list(set(item_ids))  # Remove duplicates
+        return self._ids_from_tier.get(min_tier, EMPTY_ITEM_LIST)
     
     def _get_item_by_path(self, path: str) -> Optional[Dict[str, Any]]:
         """Get item data by internal path (e.g., 'currency.gold_coins').
@@ -217,28 +331,10 @@ class UOItemDatabase:
             path: Dot-separated path to item
             
         Returns:
-            Item data dictionary or None
+            Read-only item record or None
         """
-        try:
-            parts = path.split('.')
-            if len(parts) != 2:
-                return None
-            
-            category, item_key = parts
-            categories = self.data.get('categories', {})
-            
-            if category in categories and 'items' in categories[category]:
-                items = categories[category]['items']
-                if item_key in items:
-                    # Add the item key for reference
-                    item_data = items[item_key].copy()
-                    item_data['key'] = item_key
-                    item_data['category'] = category
-                    return item_data
-        except Exception:
-            pass
-        
-        return None
+        category, _, item_key = path.partition('.')
+        return self._by_category.get(category, EMPTY_ITEM_MAP).get(item_key)
 
     def get_items_by_ids(self, item_ids: List[Union[int, str]]) -> Dict[Union[int, str], Optional[Dict[str, Any]]]:
         """
@@ -259,18 +355,7 @@ class UOItemDatabase:
                 if item_data:
                     print(f"Found {item_data['name']} (ID: {item_id})")
         """
-        results = {}
-        lookup = self.data.get('quick_lookup', {}).get('by_decimal_id', {})
-        
-        for item_id in item_ids:
-            item_id_str = str(item_id)
-            if item_id_str in lookup:
-                item_path = lookup[item_id_str]
-                results[item_id] = self._get_item_by_path(item_path)
-            else:
-                results[item_id] = None
-        
-        return results
+        return {item_id: self.get_item_by_id(item_id) for item_id in item_ids}
 
     def get_items_by_names(self, names: List[str]) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -287,22 +372,7 @@ class UOItemDatabase:
             for name, items in results.items():
                 print(f"Found {len(items)} items for '{name}'")
         """
-        results = {}
-        lookup = self.data.get('quick_lookup', {}).get('by_name', {})
-        
-        for name in names:
-            name_lower = name.lower()
-            items = []
-            
-            if name_lower in lookup:
-                for item_path in lookup[name_lower]:
-                    item_data = self._get_item_by_path(item_path)
-                    if item_data:
-                        items.append(item_data)
-            
-            results[name] = items
-        
-        return results
+        return {name: self.get_items_by_name(name) for name in names}
 
     def get_items_by_categories(self, categories: List[str]) -> Dict[str, Dict[str, Dict[str, Any]]]:
         """
@@ -319,16 +389,7 @@ class UOItemDatabase:
             for category, items in results.items():
                 print(f"Category '{category}' has {len(items)} items")
         """
-        results = {}
-        db_categories = self.data.get('categories', {})
-        
-        for category in categories:
-            if category in db_categories:
-                results[category] = db_categories[category].get('items', {})
-            else:
-                results[category] = {}
-        
-        return results
+        return {category: self.get_items_by_category(category) for category in categories}
 
     def evaluate_items_for_looting(self, item_ids: List[Union[int, str]], 
                                  value_threshold: str = 'medium') -> Dict[Union[int, str], Dict[str, Any]]:
@@ -356,7 +417,7 @@ class UOItemDatabase:
                 if eval_result['should_loot']:
                     print(f"LOOT: {eval_result['reason']}")
         """
-        tier_order = ['low', 'medium', 'high', 'very_high']
+        tier_order = VALUE_TIER_ORDER
         threshold_index = tier_order.index(value_threshold) if value_threshold in tier_order else 1
         
         items_data = self.get_items_by_ids(item_ids)
@@ -461,6 +522,53 @@ class UOItemDatabase:
         return list(categories.keys())
 
 
+def get_compiled_item_db_path(database_path: str) -> str:
+    """Path of the compiled database that belongs to a JSON database file."""
+    return os.path.splitext(database_path)[0] + COMPILED_ITEM_DB_SUFFIX
+
+
+def compute_item_db_hash(source: bytes) -> str:
+    """Version hash of the JSON database contents (and the compiled format)."""
+    return hashlib.sha1(str(ITEM_DB_FORMAT_VERSION).encode('ascii') + b':' + source).hexdigest()
+
+
+def compile_item_database(database_path: str, output_path: Optional[str] = None) -> str:
+    """Compile a JSON item database into the pickled format loaded at startup.
+    
+    Args:
+        database_path: Path to the JSON database file
+        output_path: Where to write the compiled file (default: next to the JSON file)
+        
+    Returns:
+        The path of the compiled file
+    """
+    with open(database_path, 'rb') as f:
+        source = f.read()
+    data = json.loads(source.decode('utf-8'))
+    compiled = {
+        'format_version': ITEM_DB_FORMAT_VERSION,
+        'source_hash': compute_item_db_hash(source),
+        'data': data,
+        'index': UOItemDatabase._build_index(data),
+    }
+    
+    output_path = output_path or get_compiled_item_db_path(database_path)
+    temp_path = output_path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        # Protocol 2 keeps the file readable by every Python the bot runs under
+        pickle.dump(compiled, f, protocol=2)
+    os.replace(temp_path, output_path)
+    return output_path
+
+
+def _parse_hex(hex_id: str) -> Optional[int]:
+    """Item ID from a hex string with or without the 0x prefix ('0x0F16', '0f16'), or None."""
+    try:
+        return int(hex_id, 16)
+    except (TypeError, ValueError):
+        return None
+
+
 # Convenience functions for common usage
 def get_item_database() -> UOItemDatabase:
     """Get a shared instance of the item database."""
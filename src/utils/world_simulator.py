@@ -0,0 +1,813 @@
+"""
+Simulated RazorEnhanced World for DexBot
+Deterministic in-process stand-ins for the RazorEnhanced API (Player, Mobiles, Items,
+Journal, Misc, Target, Timer, Gumps) backed by a small world model and a virtual clock,
+so run_dexbot, CombatSystem and LootingSystem can run headless for load testing
+
+Development/testing only - this module is not part of the bundled script.
+
+Usage:
+    world = WorldSimulator(seed=1)
+    world.spawn_mobile("Orc", x_offset=6, loot=[(3821, "Gold Coins", (50, 150), 0.02)])
+    world.disconnect_after(3600)
+    with world:                      # patches the API names and `time` in loaded src modules
+        run_dexbot()                 # one simulated hour; Misc.Pause only advances the clock
+    print(world.get_stats())
+"""
+
+import heapq
+import random
+import sys
+import time as _real_time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..core.profiler import PhaseHistogram
+
+# Package whose loaded modules get patched (e.g. "src")
+PACKAGE = __name__.rsplit(".", 2)[0]
+
+API_NAMES = ("Player", "Mobiles", "Items", "Journal", "Misc", "Target", "Timer", "Gumps")
+
+# Graphics used by the simulated world
+CORPSE_ITEM_ID = 0x2006
+BACKPACK_ITEM_ID = 0x0E75
+BANDAGE_ITEM_ID = 0x0E21
+HEAL_POTION_ITEM_ID = 0x0F0C
+SKINNING_KNIFE_ITEM_ID = 0x0EC4
+HIDES_ITEM_ID = 0x1079
+
+BANDAGE_SUCCESS_MESSAGE = "You finish applying the bandages."
+
+# Loot template entries: (item_id, name, amount or (min, max), weight per unit)
+LootTemplate = List[Tuple[int, str, Any, float]]
+DEFAULT_LOOT: LootTemplate = [
+    (3821, "Gold Coins", (40, 160), 0.02),
+    (3862, "Diamond", (0, 1), 0.1),
+    (3962, "Black Pearl", (0, 5), 0.1),
+    (3786, "Bones", 1, 1.0),
+]
+
+
+class VirtualClock:
+    """Simulated time source with scheduled callbacks
+
+    Time only moves when sleep/advance is called, so it can stand in for the `time`
+    module in patched code. Attributes it does not provide fall through to `time`.
+    """
+
+    def __init__(self, start: float = 1700000000.0) -> None:
+        self.now = start
+        self._events: List[Tuple[float, int, Callable[[], None]]] = []
+        self._sequence = 0
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def perf_counter(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.advance(seconds * 1000)
+
+    def call_later(self, delay_ms: float, callback: Callable[[], None]) -> None:
+        """Run callback once the clock has advanced by delay_ms"""
+        self._sequence += 1
+        heapq.heappush(self._events, (self.now + delay_ms / 1000.0, self._sequence, callback))
+
+    def advance(self, duration_ms: float) -> None:
+        """Move time forward, running every callback that falls due in order"""
+        target = self.now + max(0.0, duration_ms) / 1000.0
+        while self._events and self._events[0][0] <= target:
+            when, _, callback = heapq.heappop(self._events)
+            self.now = max(self.now, when)
+            callback()
+        self.now = target
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_real_time, name)
+
+
+class SimPosition:
+    """Tile position (RazorEnhanced Point3D)"""
+
+    def __init__(self, x: int, y: int, z: int = 0) -> None:
+        self.X = x
+        self.Y = y
+        self.Z = z
+
+    def distance_to(self, other: "SimPosition") -> int:
+        """UO tile distance (Chebyshev)"""
+        return max(abs(self.X - other.X), abs(self.Y - other.Y))
+
+
+class SimItem:
+    """Simulated item; attribute names follow RazorEnhanced.Item"""
+
+    def __init__(
+        self,
+        serial: int,
+        item_id: int,
+        name: str,
+        amount: int = 1,
+        unit_weight: float = 1.0,
+        container: int = 0,
+        position: Optional[SimPosition] = None,
+        hue: int = 0,
+    ) -> None:
+        self.Serial = serial
+        self.ItemID = item_id
+        self.Name = name
+        self.Amount = amount
+        self.Hue = hue
+        self.Container = container
+        self.Position = position or SimPosition(0, 0)
+        self.Movable = True
+        self.IsCorpse = False
+        self.IsContainer = False
+        self.Opened = False
+        self.Contains: List["SimItem"] = []
+        self.unit_weight = unit_weight
+
+    @property
+    def OnGround(self) -> bool:
+        return self.Container == 0
+
+    @property
+    def Weight(self) -> int:
+        return int(self.unit_weight * self.Amount + sum(item.Weight for item in self.Contains))
+
+
+class SimMobile:
+    """Simulated creature; attribute names follow RazorEnhanced.Mobile"""
+
+    def __init__(
+        self,
+        serial: int,
+        name: str,
+        position: SimPosition,
+        hits: int = 50,
+        notoriety: int = 3,
+        damage: int = 5,
+        loot: Optional[LootTemplate] = None,
+        hides: int = 0,
+        respawn_ms: Optional[float] = None,
+    ) -> None:
+        self.Serial = serial
+        self.Name = name
+        self.Hits = hits
+        self.HitsMax = hits
+        self.Notoriety = notoriety
+        self.Position = position
+        self.Body = 0x11
+        self.WarMode = damage > 0
+        self.damage = damage
+        self.loot = DEFAULT_LOOT if loot is None else loot
+        self.hides = hides
+        self.respawn_ms = respawn_ms
+        self.spawn_position = SimPosition(position.X, position.Y, position.Z)
+
+
+class SimFilter:
+    """Items/Mobiles filter; -1 and None mean 'any' as in RazorEnhanced"""
+
+    def __init__(self) -> None:
+        self.Enabled = True
+        self.RangeMin = -1
+        self.RangeMax = -1
+        self.IsCorpse = -1
+        self.OnGround = -1
+        self.Container = None
+        self.CheckIgnoreObject = False
+        self.Serials: List[int] = []
+        self.Graphics: List[int] = []
+
+
+class WorldSimulator:
+    """Deterministic simulated world exposing the RazorEnhanced API
+
+    The player stands still; aggressive mobiles walk toward them one tile per swing
+    and hit when adjacent. Player attacks resolve every player_swing_ms against the
+    attacked mobile, killed mobiles leave corpses filled from their loot template and
+    may respawn. Bandages finish after bandage_ms with the journal success message.
+    The player's hits never drop below 1, so sessions do not stall on resurrection.
+
+    heal_latency measures simulated time from the first damage taken since the last
+    heal action to the next bandage or potion.
+
+    Args:
+        seed: Seed for loot amounts and item move failures
+        bandages: Bandages in the starting backpack
+        heal_potions: Heal potions in the starting backpack
+        player_hits: Player max hits
+        player_damage: Damage per player swing
+        player_swing_ms: Time between player swings
+        mobile_swing_ms: Time between mobile swings/steps
+        bandage_ms: Bandage application time
+        bandage_heal: Hits restored by a bandage
+        potion_heal: Hits restored by a heal potion
+        max_weight: Player carrying capacity (stones)
+        move_failure_rate: Probability (0-1) that an Items.Move is rejected
+        corpse_decay_ms: Corpses disappear after this long (None keeps them)
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        bandages: int = 200,
+        heal_potions: int = 10,
+        player_hits: int = 100,
+        player_damage: int = 10,
+        player_swing_ms: float = 2000,
+        mobile_swing_ms: float = 2500,
+        bandage_ms: float = 4000,
+        bandage_heal: int = 25,
+        potion_heal: int = 20,
+        max_weight: int = 400,
+        move_failure_rate: float = 0.0,
+        corpse_decay_ms: Optional[float] = 420000,
+    ) -> None:
+        self.clock = VirtualClock()
+        self.random = random.Random(seed)
+        self.player_damage = player_damage
+        self.player_swing_ms = player_swing_ms
+        self.mobile_swing_ms = mobile_swing_ms
+        self.bandage_ms = bandage_ms
+        self.bandage_heal = bandage_heal
+        self.potion_heal = potion_heal
+        self.move_failure_rate = move_failure_rate
+        self.corpse_decay_ms = corpse_decay_ms
+
+        self._next_serial = {"mobile": 0x00010000, "item": 0x40000000}
+        self.mobiles: Dict[int, SimMobile] = {}
+        self.items: Dict[int, SimItem] = {}
+        self.journal: List[Tuple[str, str]] = []
+        self.timers: Dict[str, float] = {}
+        self.ignored: set = set()
+        self.connected = True
+        self.session_end: Optional[float] = None
+
+        self.attack_serial: Optional[int] = None
+        self.last_target: Optional[int] = None
+        self._player_swinging = False
+        self._pending_target: Optional[str] = None
+
+        self.stats = {
+            "mobiles_killed": 0,
+            "corpses_created": 0,
+            "items_moved": 0,
+            "item_moves_failed": 0,
+            "bandages_applied": 0,
+            "potions_used": 0,
+            "damage_taken": 0,
+            "gumps_sent": 0,
+        }
+        self.heal_latency = PhaseHistogram()
+        self._heal_needed_at: Optional[float] = None
+
+        self.player = SimPlayer(self, player_hits, max_weight)
+        self.backpack = self._new_item(BACKPACK_ITEM_ID, "Backpack", container=self.player.Serial)
+        self.backpack.IsContainer = True
+        self.add_backpack_item(BANDAGE_ITEM_ID, "Bandage", bandages, 0.1)
+        self.add_backpack_item(HEAL_POTION_ITEM_ID, "Greater Heal Potion", heal_potions, 1.0)
+        self.add_backpack_item(SKINNING_KNIFE_ITEM_ID, "Skinning Knife", 1, 1.0)
+
+        self.api = {
+            "Player": self.player,
+            "Mobiles": SimMobiles(self),
+            "Items": SimItems(self),
+            "Journal": SimJournal(self),
+            "Misc": SimMisc(self),
+            "Target": SimTarget(self),
+            "Timer": SimTimer(self),
+            "Gumps": SimGumps(self),
+        }
+        self._saved: List[Tuple[Any, str, Any]] = []
+
+    # World setup
+
+    def spawn_mobile(
+        self,
+        name: str = "Orc",
+        x_offset: int = 5,
+        y_offset: int = 0,
+        hits: int = 50,
+        notoriety: int = 3,
+        damage: int = 5,
+        loot: Optional[LootTemplate] = None,
+        hides: int = 0,
+        respawn_ms: Optional[float] = None,
+    ) -> SimMobile:
+        """Place a creature relative to the player (damage 0 makes it passive)"""
+        position = SimPosition(self.player.Position.X + x_offset, self.player.Position.Y + y_offset)
+        mobile = SimMobile(
+            self._allocate("mobile"), name, position, hits, notoriety, damage, loot, hides, respawn_ms
+        )
+        self.mobiles[mobile.Serial] = mobile
+        if damage > 0:
+            self.clock.call_later(self.mobile_swing_ms, lambda: self._mobile_swing(mobile))
+        return mobile
+
+    def spawn_corpse(
+        self, name: str = "Orc", x_offset: int = 1, y_offset: int = 0, loot: Optional[LootTemplate] = None
+    ) -> SimItem:
+        """Place a corpse with freshly generated loot next to the player"""
+        position = SimPosition(self.player.Position.X + x_offset, self.player.Position.Y + y_offset)
+        return self._create_corpse(name, position, DEFAULT_LOOT if loot is None else loot, 0)
+
+    def add_backpack_item(self, item_id: int, name: str, amount: int = 1, unit_weight: float = 1.0) -> SimItem:
+        """Put an item into the player's backpack"""
+        item = self._new_item(item_id, name, amount, unit_weight, container=self.backpack.Serial)
+        self.backpack.Contains.append(item)
+        return item
+
+    def add_damage_source(self, damage: int, interval_ms: float, delay_ms: float = 0) -> None:
+        """Damage the player every interval_ms (e.g. poison or an unseen attacker)"""
+
+        def hit():
+            self.damage_player(damage)
+            self.clock.call_later(interval_ms, hit)
+
+        self.clock.call_later(delay_ms or interval_ms, hit)
+
+    def damage_player(self, damage: int) -> None:
+        """Apply damage to the player (never below 1 hit)"""
+        damage = max(0, min(damage, self.player.Hits - 1))
+        if damage and self._heal_needed_at is None:
+            self._heal_needed_at = self.clock.now
+        self.player.Hits -= damage
+        self.stats["damage_taken"] += damage
+
+    def add_journal(self, text: str, message_type: str = "System") -> None:
+        """Append a journal line"""
+        self.journal.append((text, message_type))
+
+    def disconnect_after(self, seconds: float) -> None:
+        """End the session (Player.Connected becomes False) after this much simulated time"""
+        self.session_end = self.clock.now + seconds
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters of what happened in the world"""
+        stats = dict(self.stats)
+        stats["mobiles_alive"] = len(self.mobiles)
+        stats["corpses_on_ground"] = sum(1 for item in self.items.values() if item.IsCorpse and item.OnGround)
+        stats["backpack_items"] = len(self.backpack.Contains)
+        stats["player_hits"] = self.player.Hits
+        return stats
+
+    # Patching
+
+    def install(self) -> None:
+        """Replace the API names and `time` in every loaded module of the package"""
+        imports_module = sys.modules.get(f"{PACKAGE}.utils.imports")
+        originals = {name: getattr(imports_module, name, None) for name in API_NAMES}
+        for module_name, module in list(sys.modules.items()):
+            if module is None or not (module_name == PACKAGE or module_name.startswith(PACKAGE + ".")):
+                continue
+            if module_name == __name__:
+                continue
+            for name in API_NAMES:
+                current = getattr(module, name, None)
+                if current is not None and (imports_module is None or current is originals[name]):
+                    self._saved.append((module, name, current))
+                    setattr(module, name, self.api[name])
+            if getattr(module, "time", None) is _real_time:
+                self._saved.append((module, "time", _real_time))
+                module.time = self.clock
+
+    def uninstall(self) -> None:
+        """Restore everything install() replaced"""
+        for module, name, original in reversed(self._saved):
+            setattr(module, name, original)
+        self._saved = []
+
+    def __enter__(self) -> "WorldSimulator":
+        self.install()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.uninstall()
+
+    # World mechanics
+
+    def _allocate(self, kind: str) -> int:
+        serial = self._next_serial[kind]
+        self._next_serial[kind] += 1
+        return serial
+
+    def _new_item(
+        self,
+        item_id: int,
+        name: str,
+        amount: int = 1,
+        unit_weight: float = 1.0,
+        container: int = 0,
+        position: Optional[SimPosition] = None,
+    ) -> SimItem:
+        item = SimItem(self._allocate("item"), item_id, name, amount, unit_weight, container, position)
+        self.items[item.Serial] = item
+        return item
+
+    def _roll_amount(self, amount: Any) -> int:
+        if isinstance(amount, tuple):
+            return self.random.randint(amount[0], amount[1])
+        return amount
+
+    def _create_corpse(self, name: str, position: SimPosition, loot: LootTemplate, hides: int) -> SimItem:
+        corpse = self._new_item(CORPSE_ITEM_ID, f"corpse of {name}", unit_weight=0, position=position)
+        corpse.IsCorpse = True
+        corpse.IsContainer = True
+        corpse.hides = hides
+        for item_id, item_name, amount, unit_weight in loot:
+            rolled = self._roll_amount(amount)
+            if rolled > 0:
+                item = self._new_item(item_id, item_name, rolled, unit_weight, container=corpse.Serial)
+                corpse.Contains.append(item)
+        self.stats["corpses_created"] += 1
+        if self.corpse_decay_ms is not None:
+            self.clock.call_later(self.corpse_decay_ms, lambda: self._remove_item(corpse))
+        return corpse
+
+    def _remove_item(self, item: SimItem) -> None:
+        for child in item.Contains:
+            self.items.pop(child.Serial, None)
+        self.items.pop(item.Serial, None)
+        parent = self.items.get(item.Container)
+        if parent is not None and item in parent.Contains:
+            parent.Contains.remove(item)
+
+    def _kill(self, mobile: SimMobile) -> None:
+        self.mobiles.pop(mobile.Serial, None)
+        mobile.Hits = 0
+        self.stats["mobiles_killed"] += 1
+        if self.attack_serial == mobile.Serial:
+            self.attack_serial = None
+        self._create_corpse(mobile.Name, mobile.Position, mobile.loot, mobile.hides)
+        if mobile.respawn_ms is not None:
+            self.clock.call_later(mobile.respawn_ms, lambda: self._respawn(mobile))
+
+    def _respawn(self, mobile: SimMobile) -> None:
+        self.spawn_mobile(
+            mobile.Name,
+            mobile.spawn_position.X - self.player.Position.X,
+            mobile.spawn_position.Y - self.player.Position.Y,
+            mobile.HitsMax,
+            mobile.Notoriety,
+            mobile.damage,
+            mobile.loot,
+            mobile.hides,
+            mobile.respawn_ms,
+        )
+
+    def _mobile_swing(self, mobile: SimMobile) -> None:
+        if mobile.Serial not in self.mobiles:
+            return
+        position = mobile.Position
+        player_position = self.player.Position
+        if position.distance_to(player_position) > 1:
+            # Step one tile toward the player
+            position.X += (player_position.X > position.X) - (player_position.X < position.X)
+            position.Y += (player_position.Y > position.Y) - (player_position.Y < position.Y)
+        else:
+            self.damage_player(mobile.damage)
+        self.clock.call_later(self.mobile_swing_ms, lambda: self._mobile_swing(mobile))
+
+    def _player_attack(self, serial: int) -> None:
+        self.attack_serial = serial
+        if not self._player_swinging:
+            self._player_swinging = True
+            self.clock.call_later(self.player_swing_ms, self._player_swing)
+
+    def _player_swing(self) -> None:
+        mobile = self.mobiles.get(self.attack_serial) if self.attack_serial else None
+        if mobile is None:
+            self._player_swinging = False
+            return
+        if mobile.Position.distance_to(self.player.Position) <= 1:
+            mobile.Hits -= self.player_damage
+            if mobile.Hits <= 0:
+                self._kill(mobile)
+        self.clock.call_later(self.player_swing_ms, self._player_swing)
+
+    def _heal(self, amount: int) -> None:
+        self.player.Hits = min(self.player.HitsMax, self.player.Hits + amount)
+
+    def _record_heal_action(self) -> None:
+        if self._heal_needed_at is not None:
+            self.heal_latency.record((self.clock.now - self._heal_needed_at) * 1000)
+            self._heal_needed_at = None
+
+    def _consume(self, item_id: int) -> bool:
+        for item in self.backpack.Contains:
+            if item.ItemID == item_id and item.Amount > 0:
+                item.Amount -= 1
+                if item.Amount == 0:
+                    self._remove_item(item)
+                return True
+        return False
+
+    def _finish_bandage(self) -> None:
+        self._heal(self.bandage_heal)
+        self.player.Poisoned = False
+        self.stats["bandages_applied"] += 1
+        self.add_journal(BANDAGE_SUCCESS_MESSAGE)
+
+    def _resolve_target(self, serial: int) -> None:
+        action, self._pending_target = self._pending_target, None
+        if action == "bandage" and serial == self.player.Serial:
+            self._record_heal_action()
+            self.clock.call_later(self.bandage_ms, self._finish_bandage)
+        elif action == "skin":
+            corpse = self.items.get(serial)
+            if corpse is not None and corpse.IsCorpse and getattr(corpse, "hides", 0) > 0:
+                hides = self._new_item(HIDES_ITEM_ID, "Hides", corpse.hides, 1.0, container=corpse.Serial)
+                corpse.Contains.append(hides)
+                corpse.hides = 0
+
+    def _move_item(self, serial: int, destination: int, amount: int) -> bool:
+        item = self.items.get(serial)
+        target = self.items.get(destination)
+        if item is None or target is None or not item.Movable:
+            self.stats["item_moves_failed"] += 1
+            return False
+        source = self.items.get(item.Container)
+        if source is not None and source.OnGround and source.Position.distance_to(self.player.Position) > 2:
+            self.stats["item_moves_failed"] += 1
+            return False
+        if self.move_failure_rate and self.random.random() < self.move_failure_rate:
+            self.stats["item_moves_failed"] += 1
+            return False
+
+        if 0 < amount < item.Amount:
+            # Split the stack; the moved part becomes a new item
+            item.Amount -= amount
+            item = self._new_item(item.ItemID, item.Name, amount, item.unit_weight)
+        elif source is not None:
+            source.Contains.remove(item)
+        item.Container = destination
+        target.Contains.append(item)
+        self.stats["items_moved"] += 1
+        return True
+
+
+class SimPlayer:
+    """Player API"""
+
+    def __init__(self, world: WorldSimulator, hits: int, max_weight: int) -> None:
+        self._world = world
+        self.Serial = 0x00001000
+        self.Name = "Simulated Player"
+        self.Hits = hits
+        self.HitsMax = hits
+        self.MaxWeight = max_weight
+        self.Position = SimPosition(1000, 1000)
+        self.IsGhost = False
+        self.Visible = True
+        self.Poisoned = False
+        self.WarMode = True
+
+    @property
+    def Connected(self) -> bool:
+        world = self._world
+        return world.connected and (world.session_end is None or world.clock.now < world.session_end)
+
+    @property
+    def Backpack(self) -> SimItem:
+        return self._world.backpack
+
+    @property
+    def Weight(self) -> int:
+        return self._world.backpack.Weight
+
+    def Attack(self, serial: int) -> None:
+        self._world._player_attack(serial)
+
+
+class SimMobiles:
+    """Mobiles API"""
+
+    def __init__(self, world: WorldSimulator) -> None:
+        self._world = world
+
+    def Filter(self) -> SimFilter:
+        return SimFilter()
+
+    def ApplyFilter(self, mobile_filter: SimFilter) -> List[SimMobile]:
+        player_position = self._world.player.Position
+        result = []
+        for mobile in self._world.mobiles.values():
+            if mobile_filter.RangeMax >= 0 and mobile.Position.distance_to(player_position) > mobile_filter.RangeMax:
+                continue
+            result.append(mobile)
+        return result
+
+    def FindBySerial(self, serial: int) -> Optional[SimMobile]:
+        return self._world.mobiles.get(serial)
+
+    def Message(self, serial: int, color: int, text: str) -> None:
+        pass
+
+
+class SimItems:
+    """Items API"""
+
+    def __init__(self, world: WorldSimulator) -> None:
+        self._world = world
+
+    def Filter(self) -> SimFilter:
+        return SimFilter()
+
+    def ApplyFilter(self, item_filter: SimFilter) -> List[SimItem]:
+        world = self._world
+        if item_filter.Container:
+            container = world.items.get(item_filter.Container)
+            return list(container.Contains) if container else []
+
+        player_position = world.player.Position
+        result = []
+        for item in world.items.values():
+            if not item.OnGround:
+                continue
+            if item_filter.IsCorpse != -1 and bool(item.IsCorpse) != bool(item_filter.IsCorpse):
+                continue
+            if item_filter.CheckIgnoreObject and item.Serial in world.ignored:
+                continue
+            if item_filter.RangeMax >= 0 and item.Position.distance_to(player_position) > item_filter.RangeMax:
+                continue
+            result.append(item)
+        return result
+
+    def FindBySerial(self, serial: int) -> Optional[SimItem]:
+        return self._world.items.get(serial)
+
+    def FindAllBySerial(self, serial: int) -> List[SimItem]:
+        container = self._world.items.get(serial)
+        return list(container.Contains) if container else []
+
+    def FindByID(self, item_id: int, color: int = -1, container: int = -1, search_range: Any = None) -> Optional[SimItem]:
+        if container is not None and container != -1:
+            parent = self._world.items.get(container)
+            candidates = parent.Contains if parent else []
+        else:
+            candidates = self._world.items.values()
+        for item in candidates:
+            if item.ItemID == item_id and (color == -1 or item.Hue == color):
+                return item
+        return None
+
+    def BackpackCount(self, item_id: int, color: int = -1) -> int:
+        return sum(
+            item.Amount
+            for item in self._world.backpack.Contains
+            if item.ItemID == item_id and (color == -1 or item.Hue == color)
+        )
+
+    def UseItemByID(self, item_id: int, color: int = -1) -> bool:
+        world = self._world
+        if not world._consume(item_id):
+            return False
+        if item_id == BANDAGE_ITEM_ID:
+            world._pending_target = "bandage"
+        elif item_id == HEAL_POTION_ITEM_ID:
+            world._record_heal_action()
+            world._heal(world.potion_heal)
+            world.stats["potions_used"] += 1
+        return True
+
+    def UseItem(self, serial: int) -> None:
+        world = self._world
+        item = world.items.get(serial)
+        if item is None:
+            return
+        if item.IsContainer:
+            item.Opened = True
+        elif item.ItemID == SKINNING_KNIFE_ITEM_ID:
+            world._pending_target = "skin"
+
+    def Move(self, serial: int, destination: int, amount: int = 0) -> bool:
+        return self._world._move_item(serial, destination, amount)
+
+
+class SimJournal:
+    """Journal API"""
+
+    def __init__(self, world: WorldSimulator) -> None:
+        self._world = world
+
+    def Search(self, text: str) -> bool:
+        return any(text in line for line, _ in self._world.journal)
+
+    def SearchByType(self, text: str, message_type: str) -> bool:
+        return any(text in line and kind == message_type for line, kind in self._world.journal)
+
+    def Clear(self) -> None:
+        self._world.journal = []
+
+
+class SimMisc:
+    """Misc API"""
+
+    def __init__(self, world: WorldSimulator) -> None:
+        self._world = world
+        self.messages: List[str] = []
+
+    def Pause(self, duration_ms: float) -> None:
+        self._world.clock.advance(duration_ms)
+
+    def SendMessage(self, message: Any, color: int = 0) -> None:
+        self.messages.append(str(message))
+        del self.messages[:-100]
+
+    def IgnoreObject(self, serial: int) -> None:
+        self._world.ignored.add(serial)
+
+    def CheckIgnoreObject(self, serial: int) -> bool:
+        return serial in self._world.ignored
+
+    def ClearIgnore(self) -> None:
+        self._world.ignored.clear()
+
+
+class SimTarget:
+    """Target API"""
+
+    def __init__(self, world: WorldSimulator) -> None:
+        self._world = world
+
+    def WaitForTarget(self, timeout_ms: float, noshow: bool = False) -> bool:
+        if self._world._pending_target is not None:
+            return True
+        self._world.clock.advance(timeout_ms)
+        return False
+
+    def Self(self) -> None:
+        self._world._resolve_target(self._world.player.Serial)
+
+    def TargetExecute(self, serial: int) -> None:
+        self._world._resolve_target(serial)
+
+    def SetLast(self, serial: int) -> None:
+        self._world.last_target = serial
+
+    def Cancel(self) -> None:
+        self._world._pending_target = None
+
+
+class SimTimer:
+    """Timer API (Check is True while the timer is running)"""
+
+    def __init__(self, world: WorldSimulator) -> None:
+        self._world = world
+
+    def Create(self, name: str, duration_ms: float) -> None:
+        self._world.timers[name] = self._world.clock.now + duration_ms / 1000.0
+
+    def Check(self, name: str) -> bool:
+        return self._world.clock.now < self._world.timers.get(name, 0.0)
+
+    def Remaining(self, name: str) -> int:
+        return max(0, int((self._world.timers.get(name, 0.0) - self._world.clock.now) * 1000))
+
+
+class SimGumpDefinition:
+    def __init__(self) -> None:
+        self.gumpDefinition = ""
+        self.gumpStrings: List[str] = []
+
+
+class SimGumpData:
+    def __init__(self, button_id: int = 0) -> None:
+        self.buttonid = button_id
+
+
+class SimGumps:
+    """Gumps API; layout calls (Add*) are accepted and ignored"""
+
+    def __init__(self, world: WorldSimulator) -> None:
+        self._world = world
+        self.pressed_button = 0
+
+    def CreateGump(self, movable: bool = True, *args: Any) -> SimGumpDefinition:
+        return SimGumpDefinition()
+
+    def SendGump(self, *args: Any) -> None:
+        self._world.stats["gumps_sent"] += 1
+
+    def CloseGump(self, gump_id: int) -> None:
+        pass
+
+    def GetGumpData(self, gump_id: int) -> SimGumpData:
+        data = SimGumpData(self.pressed_button)
+        self.pressed_button = 0
+        return data
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        if name.startswith("Add"):
+            return _ignore_layout_call
+        raise AttributeError(name)
+
+
+def _ignore_layout_call(*args: Any, **kwargs: Any) -> None:
+    pass
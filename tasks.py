@@ -62,6 +62,7 @@ BUNDLED_FILE = f"{DIST_DIR}/{MAIN_FILE}"
 DEFAULT_MAIN_CONFIG_PATH = "src/config/default_main_config.json"
 DEFAULT_AUTO_HEAL_CONFIG_PATH = "src/config/default_auto_heal_config.json"
 DEFAULT_LOOTING_CONFIG_PATH = "src/config/default_looting_config.json"
+ITEM_DATABASE_PATH = "ref/uo_item_database.json"
 
 # AI Validation Integration
 def get_validation_integration():
@@ -238,7 +239,8 @@ def test(c):
         pass
     
     # Run unit tests if available
-    unit_tests = ["test_uo_items.py", "test_looting_system.py", "test_uo_item_database.py"]
+    unit_tests = ["test_uo_items.py", "test_looting_system.py", "test_uo_item_database.py", "test_scheduler.py", "test_profiler.py", "test_logger.py", "test_event_log.py", "test_session_analyzer.py", "test_world_simulator.py", "test_benchmark_main_loop.py", "test_config_manager.py", "test_config_schema.py", "test_bot_config.py",
+                  "test_runtime_state.py", "test_loot_rules.py"]
     test_passed = True
     
     if has_pytest:
@@ -273,6 +275,18 @@ def test(c):
     
     return test_passed
 
+@task
+def compile_item_db(c):
+    """Compile ref/uo_item_database.json into the pickled index loaded at startup"""
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from src.utils.uo_items import compile_item_database
+
+    if not os.path.exists(ITEM_DATABASE_PATH):
+        print(f"[ERROR] Item database not found: {ITEM_DATABASE_PATH}")
+        return
+    output_path = compile_item_database(ITEM_DATABASE_PATH)
+    print(f"[SUCCESS] Compiled item database: {output_path} ({os.path.getsize(output_path):,} bytes)")
+
 @task
 def bundle(c):
     """Bundle all source files into a single distribution file"""
@@ -281,18 +295,30 @@ def bundle(c):
     # Create dist directory
     os.makedirs(DIST_DIR, exist_ok=True)
     
+    # Keep the compiled item database in step with the JSON it was built from
+    compile_item_db(c)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from src.config.config_schema import normalize_section
+    from src.utils.uo_items import compute_item_db_hash
+    
     if os.path.exists(SRC_DIR):
         print("[TOOL] Bundling modular source files...")
         
         # Source files in dependency order
         source_files = [
+            "src/config/config_schema.py",
             "src/config/config_manager.py",
             "src/core/bot_config.py", 
+            "src/core/profiler.py",
+            "src/core/event_log.py",
             "src/core/logger.py",
+            "src/core/scheduler.py",
+            "src/core/runtime_state.py",
             "src/utils/helpers.py",
             "src/utils/uo_items.py",
             "src/systems/auto_heal.py",
             "src/systems/combat.py",
+            "src/systems/loot_rules.py",
             "src/systems/looting.py",
             "src/ui/gump_interface.py",
             "src/core/main_loop.py"
@@ -324,9 +350,7 @@ def bundle(c):
                 out_f.write('import json\n')
                 out_f.write('import os\n\n')
                 
-                # Write embedded version constants for bundled script
-                version, version_name, build_date = get_version_info()
-                branch = get_branch_info()
+                # Write embedded version constants for bundled script (read lazily by BotConfig)
                 out_f.write('# Embedded version information for bundled script\n')
                 out_f.write(f'_BUNDLED_VERSION = "{version}"\n')
                 out_f.write(f'_BUNDLED_VERSION_NAME = "{version_name}"\n')
@@ -355,13 +379,25 @@ def bundle(c):
                         auto_heal_config_content = pformat(auto_heal_config_json, indent=2)
                         out_f.write(f'DEFAULT_AUTO_HEAL_CONFIG = {auto_heal_config_content}\n\n')
                     with open(DEFAULT_LOOTING_CONFIG_PATH, 'r', encoding='utf-8') as f:
-                        looting_config_json = json.load(f)
+                        # Normalized up front (item IDs as ints, lowercase names) like the loaded config
+                        looting_config_json = normalize_section("looting", json.load(f))
                         looting_config_content = pformat(looting_config_json, indent=2)
                         out_f.write(f'DEFAULT_LOOTING_CONFIG = {looting_config_content}\n\n')
                     print("  [PACKAGE] Added default configurations (as Python dicts)")
                 except Exception as e:
                     print(f"  [WARNING]  Warning: Could not prepend default configs: {e}")
                 
+                # Inline the item database so the bundled script never reads or parses the JSON file
+                try:
+                    with open(ITEM_DATABASE_PATH, 'rb') as f:
+                        item_db_source = f.read()
+                    item_db_content = pformat(json.loads(item_db_source.decode('utf-8')), indent=2)
+                    out_f.write(f'# Item database from {ITEM_DATABASE_PATH} (hash {compute_item_db_hash(item_db_source)})\n')
+                    out_f.write(f'_BUNDLED_ITEM_DB = {item_db_content}\n\n')
+                    print("  [PACKAGE] Added item database (as a Python dict)")
+                except Exception as e:
+                    print(f"  [WARNING]  Warning: Could not embed item database: {e}")
+                
                 # Process each source file
                 for src_file in source_files:
                     if os.path.exists(src_file):
@@ -389,7 +425,7 @@ def bundle(c):
                                     continue
                                 
                                 # Remove relative imports only
-                                if line.strip().startswith('from ..'):
+                                if line.strip().startswith('from .'):
                                     continue
                                 
                                 # Keep everything else
@@ -501,6 +537,7 @@ def help(c):
         ("test-results", "List and display available test result files"),
         ("test-all", "Run all test suites (unit, interactive, enhanced)"),
         ("build", "Build the bundled DexBot.py file"),
+        ("compile-item-db", "Compile the item database JSON into the fast-loading pickled index"),
         ("dev", "Run development version (source files)"),
         ("run", "Run the bundled DexBot.py file"),
         ("run-with-logging", "Run DexBot with comprehensive output logging to file"),
@@ -514,7 +551,9 @@ def help(c):
         ("release", "Prepare a release with version bump and validation"),
         ("info", "Show project information and structure"),
         ("extract-api-data", "Extract API data using Python script (TECH-001)"),
-        ("analyze-journal-logs", "Analyze UO journal logs for DexBot activity and debugging"),
+        ("benchmark", "Benchmark the main loop under simulated combat/loot scenarios"),
+        ("analyze-session-logs", "Analyze session logs: gold/hour, heal latency, loop times, loot success"),
+        ("analyze-journal-logs", "Alias of analyze-session-logs"),
         ("help", "Show this help message")
     ]
     
@@ -1174,30 +1213,49 @@ def run_with_logging(c):
             print(f"\n[WARNING]  Log file not created: {log_file}")
 
 @task
-def analyze_journal_logs(c):
-    """Analyze Ultima Online journal logs for DexBot activity"""
-    print("[SEARCH] Analyzing UO Journal Logs for DexBot Activity")
+def analyze_session_logs(c, path="logs", json_output=None, include_text=False):
+    """Analyze DexBot session logs (gold/hour, heal latency, loop times, loot success)"""
+    print("[SEARCH] Analyzing DexBot Session Logs")
     print("=" * 50)
-    
-    # Check if the analyzer script exists
-    analyzer_script = "reports/journal_log_analyzer.py"
+
+    analyzer_script = "dev-tools/analysis/analyze_session_logs.py"
     if not os.path.exists(analyzer_script):
-        print(f"[ERROR] Journal log analyzer script not found: {analyzer_script}")
-        print("   Run this task again to create the analyzer script")
+        print(f"[ERROR] Session log analyzer script not found: {analyzer_script}")
         return
-    
+
+    cmd = f'python {analyzer_script} "{path}"'
+    if json_output:
+        cmd += f' --json "{json_output}"'
+    if include_text:
+        cmd += " --include-text"
+
     try:
-        # Run the journal log analyzer
-        print("📂 Searching for journal logs in standard UO location...")
-        c.run(f"python {analyzer_script}")
-        
-        print("\n💡 Analysis complete!")
-        print("   Check logs/ and reports/ directories for generated reports and extracts")
-        
+        c.run(cmd)
     except Exception as e:
-        print(f"[ERROR] Error running journal log analyzer: {e}")
+        print(f"[ERROR] Error running session log analyzer: {e}")
         print("\n[TOOL] Manual usage:")
-        print(f"   python {analyzer_script}")
+        print(f"   {cmd}")
+
+@task
+def benchmark(c, scenario=None, seconds=600, json_output=None):
+    """Benchmark the main loop in a simulated world (ticks/sec, per-system cost, heal latency)"""
+    benchmark_script = "dev-tools/analysis/benchmark_main_loop.py"
+    if not os.path.exists(benchmark_script):
+        print(f"[ERROR] Benchmark script not found: {benchmark_script}")
+        return
+
+    cmd = f"python {benchmark_script} --seconds {seconds}"
+    if scenario:
+        for name in scenario.split(","):
+            cmd += f" --scenario {name.strip()}"
+    if json_output:
+        cmd += f' --json "{json_output}"'
+    c.run(cmd)
+
+@task
+def analyze_journal_logs(c, path="logs"):
+    """Analyze DexBot logs for activity and debugging (alias of analyze-session-logs)"""
+    analyze_session_logs(c, path=path)
 
 @task
 def organize(c):
@@ -0,0 +1,50 @@
+"""
+Unit tests for the main loop benchmark (dev-tools/analysis/benchmark_main_loop.py)
+"""
+
+import importlib.util
+import os
+import sys
+import unittest
+
+# Add the project root to path so the src package (and its relative imports) resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config.config_manager import ConfigManager
+from src.core.logger import Logger
+
+BENCHMARK_PATH = os.path.join(
+    os.path.dirname(__file__), '..', 'dev-tools', 'analysis', 'benchmark_main_loop.py'
+)
+_spec = importlib.util.spec_from_file_location("benchmark_main_loop", BENCHMARK_PATH)
+benchmark = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(benchmark)
+
+
+class TestMainLoopBenchmark(unittest.TestCase):
+    """Test scenario runs against the simulated world"""
+
+    def test_scenario_measurements_pass_case(self):
+        """A scenario reports ticks, per-system cost and heal latency"""
+        result = benchmark.run_scenario("low_health", simulated_seconds=60)
+
+        self.assertEqual(result['ticks'], 240)  # 60s at the default 250ms tick
+        self.assertGreater(result['ticks_per_second'], 0)
+        self.assertIn('healing', result['system_cost_ms'])
+        self.assertGreater(result['heal_latency_ms']['count'], 0)
+        self.assertGreater(result['world']['damage_taken'], 0)
+
+    def test_config_and_logging_restored_edge_case(self):
+        """Benchmark overrides are in memory only and are undone afterwards"""
+        config_manager = ConfigManager()
+        combat_config = config_manager.combat_config
+        console_enabled = Logger.console_enabled
+
+        benchmark.run_scenario("idle", simulated_seconds=5)
+
+        self.assertIs(config_manager.combat_config, combat_config)
+        self.assertEqual(Logger.console_enabled, console_enabled)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,50 @@
+"""
+Unit tests for BotConfig version information
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add the project root to path so the src package (and its relative imports) resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core import bot_config
+from src.core.bot_config import BotConfig
+
+
+class TestVersionInfo(unittest.TestCase):
+    """Test that version information is read lazily, once"""
+
+    def setUp(self):
+        self.saved = getattr(bot_config._get_version_info, 'cached', None)
+        if hasattr(bot_config._get_version_info, 'cached'):
+            del bot_config._get_version_info.cached
+
+    def tearDown(self):
+        if hasattr(bot_config._get_version_info, 'cached'):
+            del bot_config._get_version_info.cached
+        if self.saved is not None:
+            bot_config._get_version_info.cached = self.saved
+
+    def test_version_read_once_pass_case(self):
+        """version.txt is read on first use and cached for later calls"""
+        config = BotConfig()
+        with patch.object(bot_config, '_read_version_info', wraps=bot_config._read_version_info) as reader:
+            version = config.VERSION
+            self.assertIn(version, config.get_version_info())
+            self.assertEqual(config.BUILD_DATE, bot_config._get_version_info()[2])
+        self.assertEqual(reader.call_count, 1)
+        self.assertNotEqual(version, 'UNKNOWN')
+
+    def test_bundled_constants_skip_file_edge_case(self):
+        """Constants baked into the bundle are used without touching the filesystem"""
+        bundled = {'_BUNDLED_VERSION': '9.9.9', '_BUNDLED_VERSION_NAME': 'Test', '_BUNDLED_BUILD_DATE': '2030-01-01'}
+        with patch.dict(bot_config.__dict__, bundled), \
+                patch.object(bot_config.os.path, 'exists', side_effect=AssertionError("file probed")):
+            self.assertEqual(BotConfig().get_version_info(), "DexBot v9.9.9 (Test) - Build: 2030-01-01")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,364 @@
+"""
+Unit tests for ConfigManager compiled setting lookups, snapshots, change notifications,
+debounced config saving, hot-reload and profiles
+"""
+
+import copy
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+# Add the project root to path so the src package (and its relative imports) resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config.config_manager import DEFAULT_PROFILE, ConfigManager, ConfigSnapshot, ConfigWriter
+from src.config.config_schema import ConfigValidationError
+from src.core.logger import Logger
+from src.systems.looting import LootingSystem
+
+
+class TestCompiledSettings(unittest.TestCase):
+    """Test that lookups and snapshots follow every kind of config change"""
+
+    def setUp(self):
+        self.config_manager = ConfigManager()
+        self.saved_combat = self.config_manager.combat_config
+        # Work on a copy so nothing leaks into other tests (and nothing is saved)
+        self.config_manager.combat_config = copy.deepcopy(self.saved_combat)
+
+    def tearDown(self):
+        self.config_manager.combat_config = self.saved_combat
+
+    def test_set_setting_updates_lookups_pass_case(self):
+        """set_*_setting is visible through dotted paths and the snapshot"""
+        version = self.config_manager.config_version
+        self.config_manager.set_combat_setting('target_selection.max_range', 14)
+
+        self.assertEqual(self.config_manager.get_combat_setting('target_selection.max_range'), 14)
+        self.assertEqual(self.config_manager.combat_settings.target_selection.max_range, 14)
+        self.assertIsInstance(self.config_manager.combat_settings.target_selection, ConfigSnapshot)
+        self.assertGreater(self.config_manager.config_version, version)
+
+    def test_missing_paths_and_read_only_snapshot_fail_case(self):
+        """Unknown paths return the default and snapshots reject writes"""
+        self.assertEqual(self.config_manager.get_combat_setting('target_selection.no_such_key', 'x'), 'x')
+        self.assertIsNone(self.config_manager.get_combat_setting('target_selection.max_range.deeper'))
+        self.assertEqual(self.config_manager.combat_settings.get('no_such_section', 5), 5)
+
+        with self.assertRaises(AttributeError):
+            self.config_manager.combat_settings.system_toggles = None
+
+    def test_replaced_and_in_place_edits_edge_case(self):
+        """Replacing a section recompiles it; in-place edits need recompile_settings()"""
+        replacement = copy.deepcopy(self.saved_combat)
+        replacement['system_toggles']['combat_system_enabled'] = True
+        self.config_manager.combat_config = replacement
+        self.assertTrue(self.config_manager.combat_settings.system_toggles.combat_system_enabled)
+
+        # Section paths return the live dict, so callers reading whole sections see it
+        toggles = self.config_manager.get_combat_setting('system_toggles')
+        self.assertIs(toggles, replacement['system_toggles'])
+
+        replacement['system_toggles']['combat_system_enabled'] = False
+        self.assertTrue(self.config_manager.get_combat_setting('system_toggles.combat_system_enabled'))
+        self.config_manager.recompile_settings()
+        self.assertFalse(self.config_manager.get_combat_setting('system_toggles.combat_system_enabled'))
+
+
+class TestConfigNotifications(unittest.TestCase):
+    """Test the per-section subscribe/notify bus"""
+
+    def setUp(self):
+        self.config_manager = ConfigManager()
+        self.saved_looting = self.config_manager.looting_config
+        self.config_manager.looting_config = copy.deepcopy(self.saved_looting)
+        self.calls = []
+
+    def tearDown(self):
+        self.config_manager.unsubscribe('looting', self._record)
+        self.config_manager.looting_config = self.saved_looting
+
+    def _record(self, section, key_path):
+        self.calls.append((section, key_path))
+
+    def test_set_and_replace_notify_pass_case(self):
+        """Subscribers hear set_*_setting with its path and replacements with None"""
+        self.config_manager.subscribe('looting', self._record)
+
+        self.config_manager.set_looting_setting('behavior.max_looting_range', 1)
+        max_range = self.config_manager.get_combat_setting('target_selection.max_range')
+        self.config_manager.set_combat_setting('target_selection.max_range', max_range)  # other section
+        self.config_manager.looting_config = copy.deepcopy(self.saved_looting)
+
+        self.assertEqual(self.calls, [('looting', 'behavior.max_looting_range'), ('looting', None)])
+
+    def test_failing_callback_and_unsubscribe_fail_case(self):
+        """A raising subscriber does not stop the others; unsubscribed callbacks are not called"""
+        def broken(section, key_path):
+            raise RuntimeError("subscriber bug")
+
+        self.config_manager.subscribe('looting', broken)
+        self.config_manager.subscribe('looting', self._record)
+        self.config_manager.set_looting_setting('enabled', not self.config_manager.get_looting_setting('enabled'))
+        self.assertEqual(len(self.calls), 1)
+
+        self.config_manager.unsubscribe('looting', broken)
+        self.config_manager.unsubscribe('looting', self._record)
+        self.config_manager.set_looting_setting('enabled', not self.config_manager.get_looting_setting('enabled'))
+        self.assertEqual(len(self.calls), 1)
+
+    def test_unchanged_values_and_looting_cache_edge_case(self):
+        """Setting an equal value is silent; a real change clears LootingSystem's evaluation cache"""
+        console_enabled = Logger.console_enabled
+        Logger.console_enabled = False
+        try:
+            looting_system = LootingSystem(self.config_manager)
+        finally:
+            Logger.console_enabled = console_enabled
+        looting_system.item_evaluation_cache.put((3821, 'gold coin', 0), 'cached')
+        enhanced = looting_system.get_enhanced_config()
+
+        self.config_manager.subscribe('looting', self._record)
+        self.config_manager.set_looting_setting('enabled', self.config_manager.get_looting_setting('enabled'))
+        # Raw values that normalize to the current ones are unchanged too
+        always_take = self.config_manager.get_looting_setting('loot_lists.always_take')
+        self.config_manager.set_looting_setting(
+            'loot_lists.always_take',
+            [hex(rule) if isinstance(rule, int) else rule.upper() for rule in always_take],
+        )
+        self.config_manager.set_looting_setting('timing.loot_action_delay_ms', str(
+            self.config_manager.get_looting_setting('timing.loot_action_delay_ms')))
+        self.assertEqual(self.calls, [])
+        self.assertIn((3821, 'gold coin', 0), looting_system.item_evaluation_cache)
+        self.assertIs(looting_system.get_enhanced_config(), enhanced)
+
+        self.config_manager.set_looting_setting('enabled', not self.config_manager.get_looting_setting('enabled'))
+        self.assertEqual(len(looting_system.item_evaluation_cache), 0)
+        self.assertIsNot(looting_system.get_enhanced_config(), enhanced)
+
+
+class TestConfigWriter(unittest.TestCase):
+    """Test debounced, atomic background config saves"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'looting_config.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _read(self):
+        with open(self.path, 'r') as f:
+            return json.load(f)
+
+    def test_rapid_saves_coalesce_pass_case(self):
+        """A burst of saves becomes one background write of the latest config"""
+        writer = ConfigWriter(delay_seconds=0.05)
+        for value in range(5):
+            writer.schedule(self.path, {'value': value})
+
+        deadline = time.monotonic() + 5.0
+        while writer.get_stats()['writes'] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        writer.close()
+
+        self.assertEqual(self._read(), {'value': 4})
+        self.assertEqual(writer.get_stats(), {'pending': 0, 'writes': 1, 'coalesced': 4, 'write_errors': 0})
+        self.assertEqual(os.listdir(self.temp_dir), ['looting_config.json'])
+
+    def test_failed_write_keeps_old_file_fail_case(self):
+        """A config that cannot be serialized leaves the existing file untouched"""
+        writer = ConfigWriter()
+        self.assertTrue(writer.write_file(self.path, {'value': 1}))
+
+        self.assertFalse(writer.write_file(self.path, {'value': object()}))
+        self.assertEqual(self._read(), {'value': 1})
+        self.assertEqual(writer.write_errors, 1)
+        self.assertEqual(os.listdir(self.temp_dir), ['looting_config.json'])
+
+    def test_save_queues_until_flush_edge_case(self):
+        """save_*_config returns at once; flush_saves writes what is pending"""
+        config_manager = ConfigManager()
+        saved_path = config_manager.looting_config_path
+        saved_delay = config_manager._writer.delay_seconds
+        config_manager.looting_config_path = self.path
+        config_manager._writer.delay_seconds = 60.0
+        try:
+            self.assertTrue(config_manager.save_looting_config())
+            self.assertFalse(os.path.exists(self.path))
+            self.assertEqual(config_manager.get_save_stats()['pending'], 1)
+
+            self.assertTrue(config_manager.flush_saves())
+            self.assertEqual(self._read(), config_manager.looting_config)
+        finally:
+            config_manager.looting_config_path = saved_path
+            config_manager._writer.delay_seconds = saved_delay
+
+
+class TestConfigHotReload(unittest.TestCase):
+    """Test applying config files edited on disk"""
+
+    def setUp(self):
+        self.config_manager = ConfigManager()
+        self.saved_combat = self.config_manager.combat_config
+        self.saved_path = self.config_manager.combat_config_path
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'combat_config.json')
+
+        self.config_manager.combat_config = copy.deepcopy(self.saved_combat)
+        self.config_manager.combat_config_path = self.path
+        self.assertTrue(self.config_manager._writer.write_file(self.path, self.config_manager.combat_config))
+        self.calls = []
+        self.config_manager.subscribe('combat', self._record)
+
+    def tearDown(self):
+        self.config_manager.unsubscribe('combat', self._record)
+        self.config_manager._writer.cancel(self.path)
+        self.config_manager.combat_config_path = self.saved_path
+        self.config_manager.combat_config = self.saved_combat
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _record(self, section, key_path):
+        self.calls.append((section, key_path))
+
+    def _edit_file(self, text):
+        """Write the file as an editor would, with a new modification time"""
+        mtime = os.stat(self.path).st_mtime + 10
+        with open(self.path, 'w') as f:
+            f.write(text)
+        os.utime(self.path, (mtime, mtime))
+
+    def test_edited_setting_applied_pass_case(self):
+        """Only the edited section reloads and subscribers hear each changed path"""
+        self.assertEqual(self.config_manager.check_for_changes(), [])
+
+        edited = copy.deepcopy(self.config_manager.combat_config)
+        edited['target_selection']['max_range'] = 3
+        self._edit_file(json.dumps(edited))
+
+        self.assertEqual(self.config_manager.check_for_changes(), ['combat'])
+        self.assertEqual(self.config_manager.combat_settings.target_selection.max_range, 3)
+        self.assertEqual(self.calls, [('combat', 'target_selection.max_range')])
+        self.assertEqual(self.config_manager.check_for_changes(), [])
+
+    def test_invalid_file_ignored_fail_case(self):
+        """A half-written file keeps the current settings and is not retried until it changes"""
+        max_range = self.config_manager.get_combat_setting('target_selection.max_range')
+        self._edit_file('{"target_selection": {"max_range": ')
+
+        self.assertEqual(self.config_manager.check_for_changes(), [])
+        self.assertEqual(self.config_manager.get_combat_setting('target_selection.max_range'), max_range)
+        self.assertEqual(self.calls, [])
+
+    def test_reformatted_file_and_pending_save_edge_case(self):
+        """Rewriting identical values notifies no one; a real edit replaces a queued save"""
+        self._edit_file(json.dumps(self.config_manager.combat_config))
+        self.assertEqual(self.config_manager.check_for_changes(), [])
+        self.assertEqual(self.calls, [])
+
+        delay = self.config_manager._writer.delay_seconds
+        self.config_manager._writer.delay_seconds = 60.0
+        try:
+            self.config_manager.set_combat_setting('target_selection.max_range', 5)
+            self.config_manager.save_combat_config()
+            edited = copy.deepcopy(self.saved_combat)
+            edited['target_selection']['max_range'] = 7
+            self._edit_file(json.dumps(edited))
+
+            self.assertEqual(self.config_manager.check_for_changes(), ['combat'])
+            self.assertEqual(self.config_manager.get_save_stats()['pending'], 0)
+            self.assertEqual(self.config_manager.get_combat_setting('target_selection.max_range'), 7)
+        finally:
+            self.config_manager._writer.delay_seconds = delay
+
+
+class TestConfigProfiles(unittest.TestCase):
+    """Test per-character profiles layered over the defaults"""
+
+    def setUp(self):
+        self.config_manager = ConfigManager()
+        self.saved_main = self.config_manager.main_config
+        self.saved_combat = self.config_manager.combat_config
+        self.saved_config_dir = self.config_manager.config_dir
+
+        # Profiles (and the config/ fallback files) live in a temp dir for the test
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_manager.config_dir = self.temp_dir
+        self._write_profile('tamer', 'combat', {'target_selection': {'max_range': 4}})
+
+    def tearDown(self):
+        self.config_manager.config_dir = self.saved_config_dir
+        self.config_manager.switch_profile(DEFAULT_PROFILE)
+        self.config_manager._profile_cache.clear()
+        self.config_manager.main_config = self.saved_main
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write_profile(self, profile, section, config):
+        profile_dir = os.path.join(self.temp_dir, 'profiles', profile)
+        os.makedirs(profile_dir, exist_ok=True)
+        with open(os.path.join(profile_dir, f'{section}_config.json'), 'w') as f:
+            json.dump(config, f)
+
+    def test_switch_and_back_pass_case(self):
+        """A profile overrides its sections, and switching back restores the same objects"""
+        self.assertEqual(self.config_manager.list_profiles(), [DEFAULT_PROFILE, 'tamer'])
+        self.assertTrue(self.config_manager.switch_profile('tamer'))
+
+        self.assertEqual(self.config_manager.active_profile, 'tamer')
+        self.assertEqual(self.config_manager.combat_settings.target_selection.max_range, 4)
+        self.assertEqual(self.config_manager.get_combat_setting('target_selection.priority_mode'), 'closest')
+        self.assertEqual(self.config_manager.combat_config_path,
+                         os.path.join(self.temp_dir, 'profiles', 'tamer', 'combat_config.json'))
+
+        self.config_manager.config_dir = self.saved_config_dir
+        self.assertTrue(self.config_manager.switch_profile(DEFAULT_PROFILE))
+        self.assertIs(self.config_manager.combat_config, self.saved_combat)
+        self.assertEqual(self.config_manager.combat_config_path,
+                         os.path.join(self.saved_config_dir, 'combat_config.json'))
+
+    def test_unknown_and_invalid_profiles_fail_case(self):
+        """Missing profiles are refused and invalid ones leave the current settings active"""
+        self.assertFalse(self.config_manager.switch_profile('nobody'))
+        self._write_profile('broken', 'combat', {'target_selection': {'max_range': 'far'}})
+
+        with self.assertRaises(ConfigValidationError):
+            self.config_manager.switch_profile('broken')
+        self.assertEqual(self.config_manager.active_profile, DEFAULT_PROFILE)
+        self.assertIs(self.config_manager.combat_config, self.saved_combat)
+
+    def test_inherited_section_hot_reloaded_edge_case(self):
+        """Edits to a config/ file a profile inherits are applied without forking a profile copy"""
+        self.assertTrue(self.config_manager.switch_profile('tamer'))
+        inherited_path = os.path.join(self.temp_dir, 'auto_heal_config.json')
+        edited = copy.deepcopy(self.config_manager.auto_heal_config)
+        edited['health_thresholds']['bandage_threshold_hp'] = 42
+        mtime = os.stat(inherited_path).st_mtime + 10
+        with open(inherited_path, 'w') as f:
+            json.dump(edited, f)
+        os.utime(inherited_path, (mtime, mtime))
+
+        self.assertEqual(self.config_manager.check_for_changes(), ['auto_heal'])
+        self.assertEqual(self.config_manager.get_auto_heal_setting('health_thresholds.bandage_threshold_hp'), 42)
+        self.assertFalse(os.path.exists(self.config_manager.auto_heal_config_path))
+
+    def test_character_selection_and_cache_edge_case(self):
+        """Characters map to profiles by serial, and a profile is parsed only once"""
+        main_config = copy.deepcopy(self.saved_main)
+        main_config['profiles'] = {'active_profile': DEFAULT_PROFILE, 'by_character': {'4096': 'tamer'}}
+        self.config_manager.main_config = main_config
+
+        self.assertEqual(self.config_manager.select_profile_for_character('Someone Else', 1), DEFAULT_PROFILE)
+        self.assertEqual(self.config_manager.select_profile_for_character('Tamer', 4096), 'tamer')
+
+        self._write_profile('tamer', 'combat', {'target_selection': {'max_range': 9}})
+        self.config_manager.switch_profile(DEFAULT_PROFILE)
+        self.config_manager.switch_profile('tamer')
+        self.assertEqual(self.config_manager.get_combat_setting('target_selection.max_range'), 4)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
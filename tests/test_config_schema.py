@@ -0,0 +1,93 @@
+"""
+Unit tests for config schema validation and value normalization
+"""
+
+import copy
+import os
+import sys
+import unittest
+
+# Add the project root to path so the src package (and its relative imports) resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config.config_manager import ConfigManager
+from src.config.config_schema import ConfigValidationError, TargetPriority, normalize_section
+
+
+class TestConfigSchema(unittest.TestCase):
+    """Test that configs are validated once and stored as typed values"""
+
+    def test_values_normalized_pass_case(self):
+        """IDs become ints, loot names lowercase, durations numbers and modes enums"""
+        looting = normalize_section('looting', {
+            'timing': {'loot_action_delay_ms': '200'},
+            'loot_lists': {'always_take': [1712, '0x0EED', '3821', ' Black Pearl ', 'gems:*']},
+        })
+        self.assertEqual(looting['timing']['loot_action_delay_ms'], 200)
+        self.assertEqual(looting['loot_lists']['always_take'], [1712, 0x0EED, 3821, 'black pearl', 'gems:*'])
+
+        combat = normalize_section('combat', {'target_selection': {'priority_mode': 'Lowest_Health'}})
+        self.assertIs(combat['target_selection']['priority_mode'], TargetPriority.LOWEST_HEALTH)
+        self.assertEqual(combat['target_selection']['priority_mode'], 'lowest_health')
+
+        config_manager = ConfigManager()
+        self.assertIsInstance(config_manager.get_auto_heal_setting('item_ids.bandage_id'), int)
+        self.assertIsInstance(config_manager.combat_settings.target_selection.priority_mode, TargetPriority)
+
+    def test_invalid_values_rejected_fail_case(self):
+        """Every bad value is reported, and rejected changes keep the previous config"""
+        with self.assertRaises(ConfigValidationError) as context:
+            normalize_section('auto_heal', {
+                'item_ids': {'bandage_id': 'bandage'},
+                'health_thresholds': {'critical_health_threshold': 150},
+                'healing_toggles': {'potion_healing_enabled': 'yes'},
+            })
+        self.assertEqual(len(context.exception.errors), 3)
+        self.assertIn('item_ids.bandage_id', str(context.exception))
+
+        config_manager = ConfigManager()
+        saved_combat = config_manager.combat_config
+        config_manager.combat_config = copy.deepcopy(saved_combat)
+        try:
+            with self.assertRaises(ConfigValidationError):
+                config_manager.set_combat_setting('target_selection.priority_mode', 'random')
+            self.assertEqual(config_manager.combat_config['target_selection']['priority_mode'],
+                             saved_combat['target_selection']['priority_mode'])
+
+            broken = copy.deepcopy(saved_combat)
+            broken['target_selection']['max_range'] = 'far'
+            current = config_manager.combat_config
+            with self.assertRaises(ConfigValidationError):
+                config_manager.combat_config = broken
+            self.assertIs(config_manager.combat_config, current)
+        finally:
+            config_manager.combat_config = saved_combat
+
+    def test_bad_scheduling_value_rejected_fail_case(self):
+        """Scheduler cadences must be numbers so a typo fails at load, not on every tick"""
+        with self.assertRaises(ConfigValidationError) as context:
+            normalize_section('main', {
+                'system_scheduling': {'looting': {'period_ms': 'fast', 'priority': 1.5, 'budget_ms': 300}},
+                'logging': {'log_level': 'verbose'},
+            })
+        self.assertEqual(len(context.exception.errors), 3)
+        self.assertIn('system_scheduling.looting.period_ms', str(context.exception))
+
+        main = normalize_section('main', {'system_scheduling': {'gump': {'period_ms': '500', 'priority': '1'}}})
+        self.assertEqual(main['system_scheduling']['gump'], {'period_ms': 500, 'priority': 1})
+
+    def test_optional_and_unknown_settings_edge_case(self):
+        """Optional IDs may be null and settings outside the schema pass through untouched"""
+        auto_heal = normalize_section('auto_heal', {
+            'item_ids': {'lesser_heal_potion_id': None},
+            'custom': {'note': ['anything', 1]},
+        })
+        self.assertIsNone(auto_heal['item_ids']['lesser_heal_potion_id'])
+        self.assertEqual(auto_heal['custom'], {'note': ['anything', 1]})
+
+        with self.assertRaises(ConfigValidationError):
+            normalize_section('auto_heal', {'item_ids': {'bandage_id': None}})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
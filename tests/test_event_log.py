@@ -0,0 +1,72 @@
+"""
+Unit tests for the DexBot binary session event log
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Add the project root to path so the src package (and its relative imports) resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.event_log import EVENT_HEADER, EVENT_RECORD, EventLog, EventType, iter_events
+
+
+class TestEventLog(unittest.TestCase):
+    """Test recording, flushing and streaming events back"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "logs", "session.dxev")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_round_trip_pass_case(self):
+        """Recorded events are read back with all fields intact"""
+        log = EventLog()
+        self.assertTrue(log.open(self.path))
+        log.record(EventType.ITEM_MOVED, serial=0x40001234, item_id=0x0EED, aux=0x40000001, value=250, timestamp=100.5)
+        log.record(EventType.LOOP_TICK, value=12500, timestamp=101.0)
+        log.close()
+
+        events = list(iter_events(self.path))
+        types = [event[1] for event in events]
+        self.assertEqual(types, [EventType.SESSION_START, EventType.ITEM_MOVED, EventType.LOOP_TICK, EventType.SESSION_END])
+        self.assertEqual(events[1], (100.5, EventType.ITEM_MOVED, 0x0EED, 0x40001234, 0x40000001, 250))
+        self.assertEqual(os.path.getsize(self.path), EVENT_HEADER.size + 4 * EVENT_RECORD.size)
+        self.assertEqual(EVENT_RECORD.size, 24)
+
+    def test_closed_log_ignores_events_and_bad_files_rejected_fail_case(self):
+        """A closed log records nothing, and non-event files are rejected"""
+        log = EventLog()
+        log.record(EventType.HEAL_NEEDED, value=40)
+        self.assertFalse(log.enabled)
+        self.assertEqual(log.records_written, 0)
+
+        bogus = os.path.join(self.temp_dir, "bogus.dxev")
+        with open(bogus, 'wb') as f:
+            f.write(b"not an event log at all")
+        with self.assertRaises(ValueError):
+            list(iter_events(bogus))
+
+    def test_truncated_record_and_value_clamping_edge_case(self):
+        """A partial trailing record is skipped and out-of-range values are clamped"""
+        log = EventLog()
+        log.open(self.path)
+        log.record(EventType.TARGET_ACQUIRED, serial=-1, value=10 ** 12)
+        log.flush()
+        with open(self.path, 'ab') as f:
+            f.write(b"\x00" * 10)  # Simulate a crash mid-write
+
+        events = list(iter_events(self.path))
+        self.assertEqual(len(events), 2)
+        self.assertEqual(events[1][3], 0xFFFFFFFF)
+        self.assertEqual(events[1][5], 0x7FFFFFFF)
+        self.assertEqual(EventType.NAMES[EventType.TARGET_ACQUIRED], "TARGET_ACQUIRED")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,124 @@
+"""
+Unit tests for the DexBot logger
+"""
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+# Add the project root to path so the src package (and its relative imports) resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.logger import LogFileSink, Logger
+
+
+class TestLazyDebugLogging(unittest.TestCase):
+    """Test the cached debug level check and lazy message formatting"""
+
+    def setUp(self):
+        self.previous = Logger.debug_enabled
+
+    def tearDown(self):
+        Logger.debug_enabled = self.previous
+
+    def _capture(self, *args):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            Logger.debug(*args)
+        return output.getvalue()
+
+    def test_enabled_debug_formats_arguments_pass_case(self):
+        """%-style arguments and callables are formatted when debug is on"""
+        Logger.debug_enabled = True
+        self.assertEqual(self._capture("Took %.1fms on %s", 12.345, "looting"), "[DEBUG] Took 12.3ms on looting\n")
+        self.assertEqual(self._capture(lambda: "built lazily"), "[DEBUG] built lazily\n")
+        self.assertEqual(self._capture("Health 50% exactly"), "[DEBUG] Health 50% exactly\n")
+
+    def test_disabled_debug_skips_formatting_fail_case(self):
+        """Nothing is printed, formatted or called while debug is off"""
+        Logger.debug_enabled = False
+        calls = []
+
+        def build():
+            calls.append(1)
+            return "never"
+
+        self.assertEqual(self._capture(build), "")
+        self.assertEqual(self._capture("%d items", "not a number"), "")  # Would raise if formatted
+        self.assertEqual(calls, [])
+
+    def test_bot_config_debug_mode_syncs_logger_edge_case(self):
+        """Toggling BotConfig.DEBUG_MODE updates the cached Logger flag"""
+        from src.core.bot_config import BotConfig
+
+        config = BotConfig()
+        config.DEBUG_MODE = True
+        self.assertTrue(Logger.debug_enabled)
+        config.DEBUG_MODE = False
+        self.assertFalse(Logger.debug_enabled)
+        self.assertFalse(config.DEBUG_MODE)
+
+
+class TestLogFileSink(unittest.TestCase):
+    """Test buffered writes, size rotation and Logger file output"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.temp_dir, "logs", "dexbot.log")
+
+    def tearDown(self):
+        Logger.shutdown()
+        Logger.console_enabled = True
+        shutil.rmtree(self.temp_dir)
+
+    def _read(self, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read().splitlines()
+
+    def test_buffer_flushes_at_record_threshold_pass_case(self):
+        """Lines stay in memory until the buffer threshold is reached"""
+        sink = LogFileSink(self.log_path, buffer_max_records=3)
+        sink.write("one")
+        sink.write("two")
+        self.assertFalse(os.path.exists(self.log_path))
+
+        sink.write("three")
+        self.assertEqual(self._read(self.log_path), ["one", "two", "three"])
+        self.assertEqual(sink.get_stats()['flushes'], 1)
+
+    def test_rotation_keeps_backup_count_edge_case(self):
+        """Files are rotated by size and only backup_count old files are kept"""
+        sink = LogFileSink(self.log_path, max_bytes=20, backup_count=2, buffer_max_records=1)
+        for index in range(5):
+            sink.write(f"line number {index}")  # 14 bytes each, so every write rotates
+
+        self.assertEqual(self._read(self.log_path), ["line number 4"])
+        self.assertEqual(self._read(self.log_path + ".1"), ["line number 3"])
+        self.assertEqual(self._read(self.log_path + ".2"), ["line number 2"])
+        self.assertFalse(os.path.exists(self.log_path + ".3"))
+        self.assertEqual(sink.get_stats()['rotations'], 4)
+
+    def test_logger_file_output_flushed_on_shutdown_fail_case(self):
+        """With console output off, messages only reach the file once flushed"""
+        Logger.configure(console=False, file_path=self.log_path, flush_interval_seconds=60)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            Logger.info("hello")
+            Logger.error("broken")
+
+        self.assertEqual(output.getvalue(), "")
+        self.assertFalse(os.path.exists(self.log_path))
+
+        Logger.shutdown()
+        lines = self._read(self.log_path)
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].endswith(" hello"))
+        self.assertTrue(lines[1].endswith(" [ERROR] broken"))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
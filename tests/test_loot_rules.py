@@ -0,0 +1,136 @@
+"""
+Unit tests for compiled loot rules (CompiledLootRules / NameMatcher)
+"""
+
+import os
+import sys
+import unittest
+
+# Add the project root to path so the src package (and its relative imports) resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.systems.loot_rules import CompiledLootRules, LootCandidate, LootDecisionCache, NameMatcher, plan_loot
+
+LOOT_LISTS = {
+    "always_take": [3821, "gold", "ruby", "scroll"],
+    "take_if_space": ["reagent", "ore", "black pearl"],
+    "never_take": [3786, "cursed", "bone"],
+}
+
+
+class TestCompiledLootRules(unittest.TestCase):
+    """Test single-pass classification against the loot lists"""
+
+    def setUp(self):
+        self.rules = CompiledLootRules(LOOT_LISTS)
+
+    def test_classify_pass_case(self):
+        """IDs and name fragments map to their loot list"""
+        self.assertEqual(self.rules.classify(3821, "gold coins"), "always_take")
+        self.assertEqual(self.rules.classify(1, "star sapphire ruby"), "always_take")
+        self.assertEqual(self.rules.classify(2, "iron ore"), "take_if_space")
+        self.assertEqual(self.rules.classify(3, "black pearl"), "take_if_space")
+        self.assertEqual(self.rules.classify(3786, "pile of stuff"), "never_take")
+        self.assertIsNone(self.rules.classify(4, "dagger"))
+        self.assertEqual(self.rules.get_stats(), {"id_rules": 2, "name_rules": 8})
+
+    def test_never_take_wins_edge_case(self):
+        """never_take beats the other lists whether it matches by ID or by name"""
+        self.assertEqual(self.rules.classify(3821, "cursed gold"), "never_take")
+        self.assertEqual(self.rules.classify(3786, "gold"), "never_take")
+        self.assertEqual(self.rules.classify(5, "scroll of bone"), "never_take")
+        # A take_if_space ID does not hide an always_take name
+        rules = CompiledLootRules({"take_if_space": [7], "always_take": ["gem"]})
+        self.assertEqual(rules.classify(7, "gem"), "always_take")
+
+    def test_overlapping_fragments_edge_case(self):
+        """Fragments that are suffixes of other fragments are still found"""
+        matcher = NameMatcher()
+        for fragment, rank in (("she", 2), ("he", 1), ("hers", 0), ("his", 2)):
+            matcher.add(fragment, rank)
+        matcher.build()
+        self.assertEqual(matcher.search("ushe"), 1)
+        self.assertEqual(matcher.search("ushers"), 0)
+        self.assertEqual(matcher.search("this"), 2)
+        self.assertIsNone(matcher.search("xyz"))
+
+    def test_empty_lists_fail_case(self):
+        """Without rules nothing matches"""
+        rules = CompiledLootRules({})
+        self.assertIsNone(rules.classify(3821, "gold coins"))
+        self.assertIsNone(rules.classify(0, ""))
+
+
+class TestLootDecisionCache(unittest.TestCase):
+    """Test the bounded LRU/TTL evaluation cache"""
+
+    def setUp(self):
+        self.now = 0.0
+        self.cache = LootDecisionCache(max_entries=2, ttl_seconds=10, clock=lambda: self.now)
+
+    def test_hits_and_lru_eviction_pass_case(self):
+        """The least recently used entry is evicted, not the whole cache"""
+        self.cache.put((1, "a", 0), "take")
+        self.cache.put((2, "b", 0), "skip")
+        self.assertEqual(self.cache.get((1, "a", 0)), "take")
+        self.cache.put((3, "c", 0), "take")
+
+        self.assertNotIn((2, "b", 0), self.cache)
+        self.assertIn((1, "a", 0), self.cache)
+        self.assertEqual(self.cache.get((2, "b", 0)), None)
+        stats = self.cache.get_stats()
+        self.assertEqual((stats["size"], stats["hits"], stats["misses"], stats["evictions"]), (2, 1, 1, 1))
+
+    def test_ttl_expiry_edge_case(self):
+        """Entries expire after ttl_seconds, on access or when purged"""
+        self.cache.put((1, "a", 0), "take")
+        self.now = 5.0
+        self.cache.put((2, "b", 0), "take")
+        self.now = 10.0
+        self.assertIsNone(self.cache.get((1, "a", 0)))
+        self.assertEqual(self.cache.get((2, "b", 0)), "take")
+        self.now = 15.0
+        self.assertEqual(self.cache.purge_expired(), 1)
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.get_stats()["expirations"], 2)
+
+    def test_same_id_different_name_fail_case(self):
+        """Items sharing an ID but not a name are cached separately"""
+        self.cache.put((3821, "gold coin", 0), "always_take")
+        self.assertIsNone(self.cache.get((3821, "cursed gold coin", 0)))
+        self.assertIsNone(self.cache.get((3821, "gold coin", 1153)))
+
+
+class TestLootPlan(unittest.TestCase):
+    """Test best-first loot planning under the backpack budget"""
+
+    def test_most_valuable_first_pass_case(self):
+        """Within a loot list, value per stone decides the order"""
+        candidates = [
+            LootCandidate("bones", 1, "low", 1, 1.0),
+            LootCandidate("ruby", 1, "very_high", 1, 0.1),
+            LootCandidate("reagents", 1, "medium", 20, 2.0),
+            LootCandidate("gold", 0, "high", 100, 2.0),
+        ]
+        self.assertEqual(plan_loot(candidates, 100, 10), ["gold", "ruby", "reagents", "bones"])
+
+    def test_budget_skips_heavy_items_edge_case(self):
+        """Items too heavy for what is left are skipped, lighter ones still fit"""
+        candidates = [
+            LootCandidate("armor", 1, "medium", 1, 15.0),
+            LootCandidate("gem", 1, "high", 1, 1.0),
+            LootCandidate("ingots", 1, "low", 10, 10.0),
+            LootCandidate("scroll", 1, "low", 1, 1.0),
+        ]
+        self.assertEqual(plan_loot(candidates, 12, 10), ["gem", "ingots", "scroll"])
+        self.assertEqual(plan_loot(candidates, 12, 2), ["gem", "ingots"])
+
+    def test_no_budget_fail_case(self):
+        """A full backpack plans nothing"""
+        candidates = [LootCandidate("gold", 0, "high", 100, 2.0)]
+        self.assertEqual(plan_loot(candidates, 0, 10), [])
+        self.assertEqual(plan_loot(candidates, 50, 0), [])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
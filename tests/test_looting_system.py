@@ -300,6 +300,175 @@ class TestLootingSystemPerformance(unittest.TestCase):
                 self.assertGreaterEqual(filter_count, 1, "Should have at least one item filter")
 
 
+class TestLootingSystemPreemption(unittest.TestCase):
+    """Test that corpse looting is advanced one game action per update"""
+
+    BACKPACK = 654321
+    CORPSE = 5000
+
+    def setUp(self):
+        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+        from src.systems import looting
+        self.looting = looting
+
+        self.now = 1000.0
+        self.items = [MagicMock(Serial=6000 + i, ItemID=3821, Name="Gold Coin", Amount=10, Container=self.CORPSE)
+                      for i in range(3)]
+        corpse = MagicMock(Serial=self.CORPSE, Contains=self.items)
+        corpse.Position.X, corpse.Position.Y = 100, 100
+
+        def find_by_serial(serial):
+            if serial == self.CORPSE:
+                return corpse
+            return next((item for item in self.items if item.Serial == serial), None)
+
+        def move(serial, container, amount):
+            find_by_serial(serial).Container = container
+
+        items_api = MagicMock()
+        items_api.FindBySerial.side_effect = find_by_serial
+        items_api.Move.side_effect = move
+        items_api.FindAllBySerial.return_value = []
+        player = MagicMock(Weight=50, MaxWeight=400)
+        player.Position.X, player.Position.Y = 100, 100
+        player.Backpack.Serial = self.BACKPACK
+        clock = MagicMock()
+        clock.time.side_effect = lambda: self.now
+
+        self.misc = MagicMock()
+        self.patches = [
+            patch.object(looting, 'Items', items_api),
+            patch.object(looting, 'Player', player),
+            patch.object(looting, 'Misc', self.misc),
+            patch.object(looting, 'time', clock),
+        ]
+        for p in self.patches:
+            p.start()
+        self.items_api = items_api
+
+        from src.config.config_manager import ConfigSnapshot
+        from src.config.config_schema import normalize_section
+
+        config_manager = MagicMock()
+        config_manager.get_looting_config.return_value = {
+            "enabled": True,
+            "timing": {"loot_action_delay_ms": 150},
+            "behavior": {"max_looting_range": 2, "auto_skinning_enabled": False},
+            "loot_lists": {"always_take": ["gold"]},
+        }
+        config_manager.looting_settings = ConfigSnapshot(
+            normalize_section("looting", config_manager.get_looting_config.return_value)
+        )
+        config_manager.get_main_setting.return_value = {}
+        self.system = looting.LootingSystem(config_manager)
+        self.corpse = looting.CorpseInfo(self.CORPSE, (100, 100), 0.0)
+        self.system.corpse_queue.append(self.corpse)
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+
+    def _run_ticks(self, max_ticks, tick_ms=250):
+        moves_per_tick = []
+        for _ in range(max_ticks):
+            before = self.items_api.Move.call_count
+            self.system.process_corpse_queue()
+            moves_per_tick.append(self.items_api.Move.call_count - before)
+            if not self.system.corpse_queue:
+                break
+            self.now += tick_ms / 1000.0
+        return moves_per_tick
+
+    def test_one_move_per_update_pass_case(self):
+        """Each update performs at most one item move and never pauses the loop"""
+        moves_per_tick = self._run_ticks(20)
+
+        self.assertEqual(sum(moves_per_tick), 3)
+        self.assertLessEqual(max(moves_per_tick), 1)
+        self.misc.Pause.assert_not_called()
+        self.assertEqual(self.corpse_queue_len(), 0)
+        self.assertIsNone(self.system.processing_corpse)
+        self.assertIn(self.CORPSE, self.system.processed_corpses)
+
+    def test_inventory_checked_once_per_corpse_edge_case(self):
+        """The backpack is counted for the plan, not again before every planned move"""
+        self._run_ticks(20)
+
+        self.assertEqual(self.items_api.Move.call_count, 3)
+        self.assertEqual(self.items_api.FindAllBySerial.call_count, 2)  # Pre-open check + plan budget
+
+    def test_evaluation_phase_timed_pass_case(self):
+        """Classifying a corpse is recorded as the loot.evaluate phase, once per corpse"""
+        self.system.profiler = MagicMock()
+        self._run_ticks(20)
+
+        phases = [c.args[0] for c in self.system.profiler.record_since.call_args_list]
+        self.assertEqual(phases.count("loot.evaluate"), 1)
+        self.assertIn("loot.open", phases)
+
+    def test_gold_events_name_the_corpse_pass_case(self):
+        """Moved items and collected gold are attributed to the corpse they came from"""
+        self.system.event_log = MagicMock()
+        self._run_ticks(20)
+
+        gold_events = [c for c in self.system.event_log.record.call_args_list
+                       if c.args[0] == self.looting.EventType.GOLD_COLLECTED]
+        self.assertEqual(len(gold_events), 3)
+        self.assertTrue(all(c.kwargs['aux'] == self.CORPSE for c in gold_events))
+
+    def test_waits_for_action_delay_edge_case(self):
+        """Updates arriving before the pending action settles do nothing"""
+        self.system.process_corpse_queue()  # Opens the corpse
+        self.system.process_corpse_queue()  # Too early - still waiting
+        self.assertEqual(self.items_api.Move.call_count, 0)
+
+        self.now += 0.3
+        self.system.process_corpse_queue()
+        self.assertEqual(self.items_api.Move.call_count, 1)
+
+    def test_job_error_removes_corpse_fail_case(self):
+        """An exception inside a corpse job drops the corpse instead of stalling the queue"""
+        def broken_steps(corpse):
+            yield 100
+            raise RuntimeError("corpse decayed")
+
+        self.system._process_corpse_steps = broken_steps
+        self._run_ticks(5)
+
+        self.assertEqual(self.corpse_queue_len(), 0)
+        self.assertIsNone(self.system.processing_corpse)
+        self.assertIsNone(self.system._corpse_job)
+
+    def test_blocking_loot_corpse_still_supported_edge_case(self):
+        """loot_corpse() drives the same steps synchronously with Misc.Pause"""
+        result = self.system.loot_corpse(self.CORPSE)
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.items_taken, 3)
+        self.assertTrue(self.misc.Pause.called)
+
+    def test_corpse_classified_in_one_batch_pass_case(self):
+        """A corpse is identified with one database call and always_take items are planned first"""
+        from src.systems.loot_rules import CompiledLootRules
+
+        ore = MagicMock(Serial=7000, ItemID=6585, Name="Iron Ore", Amount=5, Container=self.CORPSE)
+        bones = MagicMock(Serial=7001, ItemID=3786, Name="Bones", Amount=1, Container=self.CORPSE)
+        self.system._loot_rules = CompiledLootRules({"always_take": ["gold"], "take_if_space": ["ore"]})
+        self.system.config_manager.get_looting_setting.return_value = False
+        self.system.item_db = MagicMock()
+        self.system.item_db.evaluate_items_for_looting.return_value = {}
+
+        plan = self.system._plan_corpse_loot([ore, bones] + self.items)
+
+        self.assertEqual(plan, self.items + [ore])
+        self.system.item_db.evaluate_items_for_looting.assert_called_once()
+        self.assertEqual(sorted(self.system.item_db.evaluate_items_for_looting.call_args[0][0]), [3786, 3821, 6585])
+        self.system.item_db.get_item_by_id.assert_not_called()
+
+    def corpse_queue_len(self):
+        return len(self.system.corpse_queue)
+
+
 if __name__ == '__main__':
     # Run the tests
     unittest.main(verbosity=2)
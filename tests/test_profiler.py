@@ -0,0 +1,90 @@
+"""
+Unit tests for the DexBot phase profiler
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Add the project root to path so the src package (and its relative imports) resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.logger import SystemStatus
+from src.core.profiler import PhaseHistogram, Profiler
+from src.core.scheduler import SystemRegistry
+
+
+class TestPhaseHistogram(unittest.TestCase):
+    """Test histogram percentile estimation"""
+
+    def test_percentiles_pass_case(self):
+        """Percentiles land within one bucket (20%) of the true value"""
+        histogram = PhaseHistogram()
+        for duration in range(1, 101):  # 1..100ms
+            histogram.record(float(duration))
+
+        summary = histogram.get_summary()
+        self.assertEqual(summary['count'], 100)
+        self.assertAlmostEqual(summary['mean_ms'], 50.5, places=3)
+        self.assertEqual(summary['max_ms'], 100.0)
+        self.assertTrue(50 <= summary['p50_ms'] <= 60, summary['p50_ms'])
+        self.assertTrue(95 <= summary['p95_ms'] <= 100, summary['p95_ms'])
+        self.assertTrue(99 <= summary['p99_ms'] <= 100, summary['p99_ms'])
+
+    def test_empty_and_huge_samples_edge_case(self):
+        """Empty histograms report zeros and samples past the last bucket use max"""
+        histogram = PhaseHistogram()
+        self.assertEqual(histogram.percentile(99), 0.0)
+
+        histogram.record(10 ** 7)
+        self.assertEqual(histogram.percentile(50), 10 ** 7)
+
+
+class TestProfiler(unittest.TestCase):
+    """Test phase recording, disabling and JSON dumps"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_record_and_dump_pass_case(self):
+        """Recorded phases are summarized and written to JSON"""
+        profiler = Profiler()
+        profiler.record("combat.detect", 4.0)
+        profiler.record("combat.detect", 6.0)
+        profiler.record("loot.move", 12.0)
+
+        path = os.path.join(self.temp_dir, "logs", "profile.json")
+        self.assertTrue(profiler.dump_json(path))
+
+        with open(path, 'r') as f:
+            report = json.load(f)
+        self.assertEqual(sorted(report['phases']), ["combat.detect", "loot.move"])
+        self.assertEqual(report['phases']['combat.detect']['count'], 2)
+
+    def test_disabled_profiler_records_nothing_fail_case(self):
+        """A disabled profiler ignores samples"""
+        profiler = Profiler(enabled=False)
+        profiler.record("system.healing", 5.0)
+        self.assertEqual(profiler.get_summary(), {})
+
+    def test_registry_and_status_integration_edge_case(self):
+        """Registry runs are profiled per system and exposed through SystemStatus"""
+        status = SystemStatus()
+        status.profiler.reset()
+        registry = SystemRegistry(profiler=status.profiler)
+        registry.register('healing', lambda: None, 250, priority=0)
+        registry.run_due()
+
+        report = status.get_profile_report()
+        self.assertEqual(report['system.healing']['count'], 1)
+        status.profiler.reset()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
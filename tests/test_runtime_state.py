@@ -0,0 +1,120 @@
+"""
+Unit tests for runtime state snapshots (RuntimeStateStore)
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+# Add the project root to path so the src package (and its relative imports) resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config.config_manager import ConfigManager
+from src.core.logger import Logger
+from src.core.runtime_state import RuntimeStateStore
+from src.systems.combat import CombatSystem
+from src.systems.looting import LootDecision, LootingSystem
+
+
+class TestRuntimeState(unittest.TestCase):
+    """Test saving and restoring system state across script restarts"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.state_path = os.path.join(self.temp_dir, "state", "dexbot_state_1.json")
+        self.config_manager = ConfigManager()
+        self.console_enabled = Logger.console_enabled
+        Logger.console_enabled = False
+
+    def tearDown(self):
+        Logger.console_enabled = self.console_enabled
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _store(self, looting_system, combat_system, max_age_seconds=900):
+        store = RuntimeStateStore(self.state_path, max_age_seconds)
+        store.register("looting", looting_system)
+        store.register("combat", combat_system)
+        return store
+
+    def test_round_trip_pass_case(self):
+        """Corpses, cached decisions, stats and the current target survive a restart"""
+        now = time.time()
+        looting_system = LootingSystem(self.config_manager)
+        looting_system.processed_corpses = {0x40001: now - 10}
+        looting_system.item_evaluation_cache.put((3821, "gold coin", 0), LootDecision.ALWAYS_TAKE)
+        looting_system.stats['gold_collected'] = 250
+        combat_system = CombatSystem(self.config_manager)
+        combat_system.current_target = {'serial': 0x1234, 'name': 'Orc', 'hits': 10, 'hits_max': 30}
+        combat_system.combat_start_time = now * 1000
+        self.assertTrue(self._store(looting_system, combat_system).save())
+
+        new_looting = LootingSystem(self.config_manager)
+        new_combat = CombatSystem(self.config_manager)
+        restored = self._store(new_looting, new_combat).restore()
+
+        self.assertEqual(restored, ["looting", "combat"])
+        self.assertEqual(new_looting.processed_corpses, {0x40001: now - 10})
+        self.assertEqual(new_looting.item_evaluation_cache.items(), [((3821, "gold coin", 0), LootDecision.ALWAYS_TAKE)])
+        self.assertEqual(new_looting.stats['gold_collected'], 250)
+        self.assertEqual(new_combat.current_target['serial'], 0x1234)
+
+    def test_expired_entries_dropped_edge_case(self):
+        """Expired corpses and timed-out fights are not restored; old snapshots are ignored"""
+        now = time.time()
+        looting_system = LootingSystem(self.config_manager)
+        looting_system.processed_corpses = {1: now - 10, 2: now - looting_system.corpse_cache_duration - 1}
+        combat_system = CombatSystem(self.config_manager)
+        combat_system.current_target = {'serial': 0x1234, 'name': 'Orc'}
+        timeout = self.config_manager.combat_settings.combat_behavior.combat_timeout_ms
+        combat_system.combat_start_time = now * 1000 - timeout - 1000
+        self._store(looting_system, combat_system).save()
+
+        new_looting = LootingSystem(self.config_manager)
+        new_combat = CombatSystem(self.config_manager)
+        self._store(new_looting, new_combat).restore()
+        self.assertEqual(list(new_looting.processed_corpses), [1])
+        self.assertIsNone(new_combat.current_target)
+
+        with open(self.state_path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        snapshot["saved_at"] = now - 1000
+        with open(self.state_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        self.assertEqual(self._store(LootingSystem(self.config_manager), new_combat, max_age_seconds=900).restore(), [])
+
+    def test_cache_ttl_carried_over_edge_case(self):
+        """Restored decisions keep what was left of their TTL, less the time the bot was stopped"""
+        looting_system = LootingSystem(self.config_manager)
+        looting_system.item_evaluation_cache.put((3821, "gold coin", 0), LootDecision.ALWAYS_TAKE)
+        looting_system.item_evaluation_cache.put((3786, "bones", 0), LootDecision.NEVER_TAKE, ttl_seconds=5)
+        self._store(looting_system, CombatSystem(self.config_manager)).save()
+
+        with open(self.state_path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        snapshot["saved_at"] -= 10
+        with open(self.state_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+
+        new_looting = LootingSystem(self.config_manager)
+        self._store(new_looting, CombatSystem(self.config_manager)).restore()
+        [(key, decision, ttl_seconds)] = new_looting.item_evaluation_cache.items_with_ttl()
+        self.assertEqual((key, decision), ((3821, "gold coin", 0), LootDecision.ALWAYS_TAKE))
+        self.assertLessEqual(ttl_seconds, new_looting.item_evaluation_cache.ttl_seconds - 10)
+
+    def test_corrupt_snapshot_fail_case(self):
+        """An unreadable snapshot is ignored and the systems start fresh"""
+        os.makedirs(os.path.dirname(self.state_path))
+        with open(self.state_path, "w", encoding="utf-8") as f:
+            f.write('{"version": 2, "saved_at": ')
+
+        looting_system = LootingSystem(self.config_manager)
+        self.assertEqual(self._store(looting_system, CombatSystem(self.config_manager)).restore(), [])
+        self.assertEqual(looting_system.processed_corpses, {})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,232 @@
+"""
+Unit tests for the DexBot tick scheduler
+
+Uses a fake clock and pause function so tick timing is deterministic.
+"""
+
+import os
+import sys
+import unittest
+
+# Add the project root to path so the src package (and its relative imports) resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.main_loop import apply_schedule_changes, get_system_schedules
+from src.core.scheduler import (
+    MAX_CONSECUTIVE_DEFERRALS,
+    MIN_TICK_PAUSE_MS,
+    SystemRegistry,
+    TickScheduler,
+)
+
+
+class FakeClock:
+    """Manually advanced clock; pauses advance it like Misc.Pause would"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.pauses = []
+
+    def time(self):
+        return self.now
+
+    def advance_ms(self, ms):
+        self.now += ms / 1000.0
+
+    def pause(self, ms):
+        self.pauses.append(ms)
+        self.advance_ms(ms)
+
+
+class TestTickScheduler(unittest.TestCase):
+    """Test TickScheduler timing, overrun and jitter tracking"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = TickScheduler(250, clock=self.clock.time, sleep=self.clock.pause)
+
+    def test_sleeps_only_remaining_period_pass_case(self):
+        """A 100ms tick should pause for the remaining 150ms"""
+        self.scheduler.begin_tick()
+        self.clock.advance_ms(100)
+        duration = self.scheduler.end_tick()
+
+        self.assertAlmostEqual(duration, 100, places=3)
+        self.assertAlmostEqual(self.clock.pauses[-1], 150, places=3)
+        self.assertEqual(self.scheduler.get_stats()['overruns'], 0)
+
+    def test_overrun_is_recorded_fail_case(self):
+        """A 400ms tick overruns the 250ms period and only yields briefly"""
+        self.scheduler.begin_tick()
+        self.clock.advance_ms(400)
+        self.scheduler.end_tick()
+
+        stats = self.scheduler.get_stats()
+        self.assertEqual(stats['overruns'], 1)
+        self.assertAlmostEqual(stats['max_overrun_ms'], 150, places=3)
+        self.assertEqual(self.clock.pauses[-1], MIN_TICK_PAUSE_MS)
+
+    def test_jitter_tracking_edge_case(self):
+        """Late wakeups count as jitter, overrun ticks do not"""
+        # Tick 1 finishes inside the period
+        self.scheduler.begin_tick()
+        self.clock.advance_ms(50)
+        self.scheduler.end_tick()
+        # Simulate the pause oversleeping by 20ms
+        self.clock.advance_ms(20)
+
+        # Tick 2 starts late (jitter) and overruns
+        self.scheduler.begin_tick()
+        self.clock.advance_ms(300)
+        self.scheduler.end_tick()
+
+        # Tick 3 follows an overrun, so its start is not counted as jitter
+        self.scheduler.begin_tick()
+        self.scheduler.end_tick()
+
+        stats = self.scheduler.get_stats()
+        self.assertEqual(stats['ticks'], 3)
+        self.assertAlmostEqual(stats['max_jitter_ms'], 20, places=3)
+        self.assertAlmostEqual(stats['avg_jitter_ms'], 20, places=3)
+
+    def test_deadline_and_empty_stats_edge_case(self):
+        """Deadline is one period after tick start; stats are safe before any tick"""
+        stats = self.scheduler.get_stats()
+        self.assertEqual(stats['ticks'], 0)
+        self.assertEqual(stats['overrun_percent'], 0.0)
+
+        start = self.scheduler.begin_tick()
+        self.assertAlmostEqual(self.scheduler.get_deadline(), start + 0.25)
+
+
+class TestSystemRegistry(unittest.TestCase):
+    """Test SystemRegistry cadence, priority and deferral handling"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.registry = SystemRegistry(clock=self.clock.time)
+        self.calls = []
+
+    def _callback(self, name, cost_ms=0):
+        def run():
+            self.calls.append(name)
+            self.clock.advance_ms(cost_ms)
+        return run
+
+    def test_priority_order_and_period_gating_pass_case(self):
+        """Systems run by priority and only once their period has elapsed"""
+        self.registry.register('looting', self._callback('looting'), 500, priority=3)
+        self.registry.register('healing', self._callback('healing'), 250, priority=0)
+
+        self.assertEqual(self.registry.run_due(), ['healing', 'looting'])
+
+        self.clock.advance_ms(250)
+        self.assertEqual(self.registry.run_due(), ['healing'])
+
+        self.clock.advance_ms(250)
+        self.assertEqual(self.registry.run_due(), ['healing', 'looting'])
+
+    def test_disabled_system_is_skipped_pass_case(self):
+        """The enabled predicate is checked and a disabled system does not run"""
+        self.registry.register('combat', self._callback('combat'), 250, enabled=lambda: False)
+
+        self.assertEqual(self.registry.run_due(), [])
+        self.assertEqual(self.calls, [])
+
+    def test_deferral_after_deadline_fail_case(self):
+        """Once the deadline passes, deferrable systems wait but healing still runs"""
+        self.registry.register('gump', self._callback('gump', cost_ms=300), 250, priority=1)
+        self.registry.register('looting', self._callback('looting'), 250, priority=3)
+        self.registry.register('healing', self._callback('healing'), 250, priority=0, deferrable=False)
+
+        deadline = self.clock.time() + 0.25
+        self.assertEqual(self.registry.run_due(deadline), ['healing', 'gump'])
+        self.assertEqual(self.registry.get_stats()['looting']['deferrals'], 1)
+        self.assertEqual(self.registry.get_stats()['gump']['budget_overruns'], 1)
+
+        # Looting is still due on the next tick
+        self.assertIn('looting', self.registry.run_due())
+
+    def test_forced_run_after_max_deferrals_edge_case(self):
+        """A system deferred too many ticks in a row runs even past the deadline"""
+        self.registry.register('looting', self._callback('looting'), 250)
+        expired = self.clock.time() - 1
+
+        for _ in range(MAX_CONSECUTIVE_DEFERRALS):
+            self.assertEqual(self.registry.run_due(expired), [])
+
+        self.assertEqual(self.registry.run_due(expired), ['looting'])
+
+    def test_error_isolation_and_duplicates_edge_case(self):
+        """A failing system is counted and does not stop later systems"""
+        def fail():
+            raise RuntimeError("boom")
+
+        self.registry.register('combat', fail, 250, priority=2)
+        self.registry.register('looting', self._callback('looting'), 250, priority=3)
+
+        self.assertEqual(self.registry.run_due(), ['combat', 'looting'])
+        self.assertEqual(self.registry.get_stats()['combat']['errors'], 1)
+
+        with self.assertRaises(ValueError):
+            self.registry.register('combat', fail, 250)
+
+    def test_set_schedule_edge_case(self):
+        """A new period counts from the last run and a new priority reorders dispatch"""
+        self.registry.register('gump', self._callback('gump'), 30000, priority=1)
+        self.registry.register('looting', self._callback('looting'), 250, priority=3)
+        self.assertEqual(self.registry.run_due(), ['gump', 'looting'])
+
+        self.clock.advance_ms(1000)
+        self.assertTrue(self.registry.set_schedule('gump', 1000, 5, 20))
+        self.assertFalse(self.registry.set_schedule('missing', 1000, 5, 20))
+        self.assertEqual(self.registry.run_due(), ['looting', 'gump'])
+        self.assertEqual(self.registry.get_stats()['gump']['budget_ms'], 20)
+
+
+class FakeMainConfig:
+    """get_main_setting over a nested dict"""
+
+    def __init__(self, config):
+        self.config = config
+
+    def get_main_setting(self, key_path, default=None):
+        value = self.config
+        for key in key_path.split('.'):
+            if not isinstance(value, dict) or key not in value:
+                return default
+            value = value[key]
+        return value
+
+
+class TestScheduleReload(unittest.TestCase):
+    """Test applying edited main_config timing to a running loop"""
+
+    def test_apply_schedule_changes_pass_case(self):
+        """Loop period, system cadences and fixed-priority intervals follow the config"""
+        clock = FakeClock()
+        scheduler = TickScheduler(250, clock=clock.time, sleep=clock.pause)
+        registry = SystemRegistry(clock=clock.time)
+        for name in ('healing', 'looting', 'config_reload'):
+            registry.register(name, lambda: None, 250)
+
+        apply_schedule_changes(FakeMainConfig({
+            'global_settings': {'main_loop_delay_ms': 100, 'config_reload_check_interval_ms': 5000},
+            'system_scheduling': {'looting': {'period_ms': 750, 'priority': 7, 'budget_ms': 400}},
+        }), scheduler, registry)
+
+        stats = registry.get_stats()
+        self.assertEqual(scheduler.period_ms, 100)
+        self.assertEqual((stats['healing']['period_ms'], stats['healing']['priority']), (100, 0))
+        self.assertEqual((stats['looting']['period_ms'], stats['looting']['priority'],
+                          stats['looting']['budget_ms']), (750, 7, 400))
+        self.assertEqual(stats['config_reload']['period_ms'], 5000)
+
+    def test_gump_polls_every_tick_by_default_edge_case(self):
+        """Without system_scheduling the GUMP (button polling) runs at the loop period"""
+        schedules = get_system_schedules(FakeMainConfig({'global_settings': {'main_loop_delay_ms': 200}}))
+        self.assertEqual(schedules['gump'], (200, 1, 50))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
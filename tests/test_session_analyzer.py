@@ -0,0 +1,135 @@
+"""
+Unit tests for the DexBot session log analyzer (dev-tools/analysis/analyze_session_logs.py)
+"""
+
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Add the project root to path so the src package (and its relative imports) resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.event_log import EventLog, EventType
+
+ANALYZER_PATH = os.path.join(
+    os.path.dirname(__file__), '..', 'dev-tools', 'analysis', 'analyze_session_logs.py'
+)
+_spec = importlib.util.spec_from_file_location("analyze_session_logs", ANALYZER_PATH)
+analyzer = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(analyzer)
+
+
+class TestSessionAnalyzer(unittest.TestCase):
+    """Test aggregation of event logs and text logs"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _write_event_log(self, name, events):
+        path = os.path.join(self.temp_dir, name)
+        log = EventLog()
+        log.open(path)
+        for event_type, timestamp, fields in events:
+            log.record(event_type, timestamp=timestamp, **fields)
+        log.flush()
+        log.file_path = None  # Close without recording a wall-clock SESSION_END
+        return path
+
+    def test_event_log_report_pass_case(self):
+        """Rates, heal latency and loot success are derived from event records"""
+        base = 1000.0
+        self._write_event_log("session.dxev", [
+            (EventType.SESSION_START, base, {}),
+            (EventType.HEAL_NEEDED, base + 10.0, {"value": 50}),
+            (EventType.BANDAGE_STARTED, base + 10.2, {"value": 50}),
+            (EventType.BANDAGE_APPLIED, base + 20.0, {}),
+            (EventType.GOLD_COLLECTED, base + 30.0, {"value": 500}),
+            (EventType.ITEM_MOVED, base + 30.0, {"value": 500}),
+            (EventType.ITEM_MOVED, base + 31.0, {"value": 1}),
+            (EventType.ITEM_MOVED, base + 32.0, {"value": 1}),
+            (EventType.ITEM_MOVE_FAILED, base + 33.0, {"value": 1}),
+            (EventType.CORPSE_LOOTED, base + 34.0, {"value": 3}),
+            (EventType.LOOP_TICK, base + 35.0, {"value": 4000}),
+            (EventType.SESSION_END, base + 1800.0, {}),
+        ])
+
+        report = analyzer.analyze([self.temp_dir])
+
+        self.assertEqual(report['files'], 1)
+        self.assertAlmostEqual(report['session_hours'], 0.5, places=3)
+        self.assertEqual(report['gold'], 500)
+        self.assertEqual(report['gold_per_hour'], 1000.0)
+        self.assertEqual(report['bandages_per_hour'], 2.0)
+        self.assertEqual(report['heal_latency_ms']['count'], 1)
+        self.assertTrue(150 <= report['heal_latency_ms']['p50_ms'] <= 250)
+        self.assertEqual(report['loop_time_ms']['max_ms'], 4.0)
+        self.assertEqual(report['loot_success_percent'], 75.0)
+        self.assertEqual(report['items_per_corpse'], 3.0)
+
+    def test_invalid_file_skipped_fail_case(self):
+        """Files that are not event logs are reported and skipped, not fatal"""
+        with open(os.path.join(self.temp_dir, "broken.dxev"), 'wb') as f:
+            f.write(b"not an event log")
+
+        report = analyzer.analyze([self.temp_dir])
+        self.assertEqual(report['files'], 0)
+        self.assertEqual(report['gold_per_hour'], 0.0)
+
+    def _write_text_log(self, directory, lines):
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, "dexbot.log"), 'w', encoding='utf-8') as f:
+            f.write("".join(line + "\n" for line in lines))
+
+    def test_appended_sessions_and_text_log_edge_case(self):
+        """Idle gaps between appended sessions are excluded; text logs add what they expose"""
+        self._write_event_log("appended.dxev", [
+            (EventType.SESSION_START, 0.0, {}),
+            (EventType.SESSION_END, 600.0, {}),
+            (EventType.SESSION_START, 100000.0, {}),
+            (EventType.SESSION_END, 100600.0, {}),
+        ])
+        self._write_text_log(os.path.join(self.temp_dir, "text_only"), [
+            "2025-01-01 12:00:00.000 [INFO] [DexBot] LOOTING: Collected 250 gold",
+            "2025-01-01 12:10:00.000 [INFO] [DexBot] LOOTING: Successfully took item Gold Coin",
+        ])
+
+        report = analyzer.analyze([self.temp_dir])
+        self.assertEqual(report['files'], 2)
+        self.assertAlmostEqual(report['session_hours'], 1800 / 3600.0, places=3)
+        self.assertEqual(report['gold'], 250)
+        self.assertEqual(report['items_moved'], 1)
+
+    def test_text_log_next_to_event_log_edge_case(self):
+        """A session's dexbot.log is not counted on top of its event log"""
+        self._write_event_log("dexbot_events_20250101_120000.dxev", [
+            (EventType.SESSION_START, 1000.0, {}),
+            (EventType.GOLD_COLLECTED, 1010.0, {"value": 250}),
+            (EventType.ITEM_MOVED, 1010.0, {"value": 250}),
+            (EventType.SESSION_END, 1600.0, {}),
+        ])
+        self._write_text_log(self.temp_dir, [
+            "2025-01-01 12:00:00.000 [INFO] [DexBot] LOOTING: Collected 250 gold",
+            "2025-01-01 12:00:00.000 [INFO] [DexBot] LOOTING: Successfully took item Gold Coin",
+            "2025-01-01 12:10:00.000 [INFO] [DexBot] Main loop took 4.0ms",
+        ])
+
+        report = analyzer.analyze([self.temp_dir])
+        self.assertEqual(report['files'], 1)
+        self.assertEqual(report['gold'], 250)
+        self.assertEqual(report['items_moved'], 1)
+        self.assertAlmostEqual(report['session_hours'], 600 / 3600.0, places=3)
+        self.assertEqual(report['gold_per_hour'], 1500.0)
+
+        with_text = analyzer.analyze([self.temp_dir], include_text=True)
+        self.assertEqual(with_text['files'], 2)
+        self.assertEqual(with_text['gold'], 500)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -7,13 +7,16 @@ Focus on the new UO item database optimization work
 import unittest
 from unittest.mock import patch, mock_open, MagicMock
 import json
+import pickle
+import shutil
 import sys
 import os
+import tempfile
 
 # Add the src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from utils.uo_items import UOItemDatabase, get_item_database, get_item_id, get_gem_ids, get_reagent_ids, get_potion_ids, get_valuable_item_ids, evaluate_items_for_looting, get_items_by_ids, get_database_performance_stats
+from utils.uo_items import UOItemDatabase, get_item_database, get_item_id, get_gem_ids, get_reagent_ids, get_potion_ids, get_valuable_item_ids, evaluate_items_for_looting, get_items_by_ids, get_database_performance_stats, compile_item_database, get_compiled_item_db_path
 
 
 class TestUOItemDatabaseClass(unittest.TestCase):
@@ -309,6 +312,43 @@ class TestUOItemDatabaseClass(unittest.TestCase):
             self.assertIn("currency", stats["categories"])
             self.assertIn("gems", stats["categories"])
 
+    def test_shared_records_pass_case(self):
+        """Every lookup returns the same precomputed record for an item"""
+        with patch.object(UOItemDatabase, '_load_database', return_value=self.mock_db_data):
+            db = UOItemDatabase()
+            
+            diamond = db.get_item_by_id(3862)
+            self.assertIs(db.get_item_by_hex("0x0F16"), diamond)
+            self.assertIs(db.get_items_by_category("gems")["diamond"], diamond)
+            self.assertIn(diamond, db.get_items_by_value_tier("very_high"))
+            self.assertIs(db.get_items_by_name("gem"), db.get_items_by_name("GEM"))
+            self.assertEqual(sorted(db.get_valuable_items("high")), [3821, 3862, 3863])
+            self.assertEqual(db.get_valuable_items("very_high"), [3862])
+
+    def test_records_read_only_fail_case(self):
+        """Shared records and lists cannot be changed by callers"""
+        with patch.object(UOItemDatabase, '_load_database', return_value=self.mock_db_data):
+            db = UOItemDatabase()
+            
+            gold = db.get_item_by_id(3821)
+            with self.assertRaises(TypeError):
+                gold["name"] = "Copper"
+            with self.assertRaises(TypeError):
+                db.get_items_by_name("gem").append(gold)
+            mutable = gold.copy()
+            mutable["name"] = "Copper"
+            self.assertEqual(db.get_item_by_id(3821)["name"], "Gold Coins")
+
+    def test_lookup_keys_edge_case(self):
+        """Int and digit-string IDs share one table; hex IDs are parsed once"""
+        with patch.object(UOItemDatabase, '_load_database', return_value=self.mock_db_data):
+            db = UOItemDatabase()
+            
+            self.assertIs(db.get_item_by_id("3821"), db.get_item_by_id(3821))
+            self.assertIs(db.get_item_by_hex("eed"), db.get_item_by_id(3821))
+            self.assertIsNone(db.get_item_by_id("0x0EED"))
+            self.assertIsNone(db.get_item_by_hex(None))
+
 
 class TestConvenienceFunctions(unittest.TestCase):
     """Test the convenience functions for common usage"""
@@ -730,3 +770,74 @@ class TestBulkConvenienceFunctions(unittest.TestCase):
             3821: {'should_loot': True, 'reason': 'Gold Coins (high value currency)'},
             3862: {'should_loot': True, 'reason': 'Diamond (very_high value gems)'}
         }
+
+
+class TestCompiledItemDatabase(unittest.TestCase):
+    """Test loading the item database from the compiled (pickled) index"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.json_path = os.path.join(self.temp_dir, 'uo_item_database.json')
+        source = os.path.join(os.path.dirname(__file__), '..', 'ref', 'uo_item_database.json')
+        shutil.copyfile(source, self.json_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _load_json(self):
+        with open(self.json_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def test_compiled_round_trip_pass_case(self):
+        """The compiled file is used and answers the same as the JSON file"""
+        from_json = UOItemDatabase(self.json_path)
+        compiled_path = compile_item_database(self.json_path)
+        self.assertEqual(compiled_path, get_compiled_item_db_path(self.json_path))
+
+        db = UOItemDatabase(self.json_path)
+        self.assertEqual(from_json.loaded_from, 'json')
+        self.assertEqual(db.loaded_from, 'compiled')
+        self.assertEqual(db.get_item_by_id(3821), from_json.get_item_by_id(3821))
+        self.assertEqual(db.get_item_ids_by_name('gold'), from_json.get_item_ids_by_name('gold'))
+        self.assertEqual(db.get_valuable_items('high'), from_json.get_valuable_items('high'))
+        with self.assertRaises(TypeError):
+            db.get_item_by_id(3821)['name'] = 'Changed'
+
+    @patch('builtins.print')
+    def test_stale_compiled_file_edge_case(self, mock_print):
+        """A compiled file whose hash no longer matches the JSON file is ignored"""
+        compile_item_database(self.json_path)
+        data = self._load_json()
+        data['metadata']['version'] = 'edited'
+        with open(self.json_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+        db = UOItemDatabase(self.json_path)
+        self.assertEqual(db.loaded_from, 'json')
+        self.assertEqual(db.data['metadata']['version'], 'edited')
+
+        # Without the JSON file the compiled copy is trusted
+        os.remove(self.json_path)
+        self.assertEqual(UOItemDatabase(self.json_path).loaded_from, 'compiled')
+
+    def test_bundled_database_edge_case(self):
+        """The database embedded in the bundled script is used without touching any file"""
+        data = self._load_json()
+        with patch('builtins.open', side_effect=AssertionError("no file access expected")), \
+                patch('os.path.exists') as mock_exists, \
+                patch('utils.uo_items._BUNDLED_ITEM_DB', data, create=True):
+            db = UOItemDatabase()
+            mock_exists.assert_not_called()
+        self.assertEqual(db.loaded_from, 'bundled')
+        self.assertIsNone(db.database_path)
+        self.assertEqual(db.get_item_by_id(3821)['name'], 'Gold Coins')
+
+    @patch('builtins.print')
+    def test_unexpected_pickle_content_fail_case(self, mock_print):
+        """Compiled files holding anything but plain containers are rejected"""
+        with open(get_compiled_item_db_path(self.json_path), 'wb') as f:
+            pickle.dump({'format_version': 1, 'data': os.system}, f, protocol=2)
+
+        db = UOItemDatabase(self.json_path)
+        self.assertEqual(db.loaded_from, 'json')
+        self.assertIsNotNone(db.get_item_by_id(3821))
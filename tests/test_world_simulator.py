@@ -0,0 +1,136 @@
+"""
+Unit tests for the simulated RazorEnhanced world (src/utils/world_simulator.py)
+"""
+
+import os
+import sys
+import unittest
+
+# Add the project root to path so the src package (and its relative imports) resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config.config_manager import ConfigManager
+from src.core import main_loop
+from src.core.logger import Logger
+from src.systems import combat, looting
+from src.systems.combat import CombatSystem
+from src.systems.looting import LootingSystem
+from src.utils import imports
+from src.utils.world_simulator import WorldSimulator
+
+GOLD_LOOT = [(3821, "Gold Coins", 120, 0.02)]
+
+
+class TestWorldSimulator(unittest.TestCase):
+    """Test the virtual clock and the simulated API"""
+
+    def test_pause_advances_virtual_clock_pass_case(self):
+        """Misc.Pause moves simulated time, runs due events and drives timers"""
+        world = WorldSimulator()
+        api = world.api
+        start = world.clock.now
+
+        api["Timer"].Create("HEALING", 1000)
+        self.assertTrue(api["Timer"].Check("HEALING"))
+
+        api["Items"].UseItemByID(0x0E21, -1)
+        api["Target"].Self()
+        api["Misc"].Pause(world.bandage_ms)
+
+        self.assertAlmostEqual(world.clock.now - start, world.bandage_ms / 1000.0)
+        self.assertFalse(api["Timer"].Check("HEALING"))
+        self.assertTrue(api["Journal"].SearchByType("You finish applying the bandages.", "System"))
+        self.assertEqual(api["Items"].BackpackCount(0x0E21), 199)
+
+    def test_move_from_distant_corpse_fail_case(self):
+        """Items cannot be moved out of corpses beyond reach"""
+        world = WorldSimulator()
+        corpse = world.spawn_corpse(x_offset=5, loot=GOLD_LOOT)
+        gold = corpse.Contains[0]
+
+        self.assertFalse(world.api["Items"].Move(gold.Serial, world.backpack.Serial, gold.Amount))
+        self.assertEqual(world.get_stats()["item_moves_failed"], 1)
+        self.assertEqual(gold.Container, corpse.Serial)
+
+    def test_install_and_uninstall_edge_case(self):
+        """Installing patches loaded modules (API names and time) and uninstall restores them"""
+        original_items = looting.Items
+        with WorldSimulator() as world:
+            self.assertIs(looting.Items, world.api["Items"])
+            self.assertIs(imports.Misc, world.api["Misc"])
+            self.assertIs(combat.time, world.clock)
+        self.assertIs(looting.Items, original_items)
+        self.assertIsNot(combat.time, world.clock)
+
+
+class TestSimulatedSystems(unittest.TestCase):
+    """Run the real bot systems against the simulated world"""
+
+    def setUp(self):
+        self.config_manager = ConfigManager()
+        self.saved_main = self.config_manager.main_config
+        self.saved_combat = self.config_manager.combat_config
+        self.console_enabled = Logger.console_enabled
+        Logger.console_enabled = False
+
+    def tearDown(self):
+        self.config_manager.main_config = self.saved_main
+        self.config_manager.combat_config = self.saved_combat
+        Logger.console_enabled = self.console_enabled
+
+    def _run(self, world, update, ticks, period_ms=250):
+        for _ in range(ticks):
+            update()
+            world.api["Misc"].Pause(period_ms)
+
+    def test_looting_system_empties_corpse_pass_case(self):
+        """LootingSystem moves gold from a nearby corpse into the backpack"""
+        world = WorldSimulator()
+        corpse = world.spawn_corpse(loot=GOLD_LOOT)
+
+        with world:
+            looting_system = LootingSystem(self.config_manager)
+            self._run(world, looting_system.update, 200)
+
+        self.assertEqual(world.api["Items"].BackpackCount(3821), 120)
+        self.assertEqual(corpse.Contains, [])
+
+    def test_combat_system_kills_mobile_edge_case(self):
+        """CombatSystem engages an approaching mobile until it leaves a corpse"""
+        self.config_manager.combat_config = self.config_manager._merge_configs(
+            self.saved_combat, {"system_toggles": {"combat_system_enabled": True}}
+        )
+        world = WorldSimulator()
+        world.spawn_mobile("Orc", x_offset=4, hits=30, loot=GOLD_LOOT)
+
+        with world:
+            combat_system = CombatSystem(self.config_manager)
+            self._run(world, combat_system.run, 400)
+
+        stats = world.get_stats()
+        self.assertEqual(stats["mobiles_killed"], 1)
+        self.assertEqual(stats["corpses_on_ground"], 1)
+
+    def test_headless_main_loop_pass_case(self):
+        """run_dexbot runs a simulated session to disconnect without touching disk"""
+        self.config_manager.main_config = self.config_manager._merge_configs(
+            self.saved_main,
+            {
+                "logging": {"file_logging": False, "console_logging": False, "event_log_enabled": False},
+                "performance_optimization": {"profiling": {"dump_on_shutdown": False}},
+                "runtime_state": {"enabled": False},
+            },
+        )
+        world = WorldSimulator()
+        world.spawn_mobile("Orc", x_offset=3, damage=20)
+        world.disconnect_after(120)
+
+        with world:
+            main_loop.run_dexbot()
+
+        self.assertGreaterEqual(world.clock.now, world.session_end)
+        self.assertGreater(world.get_stats()["bandages_applied"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)